@@ -0,0 +1,247 @@
+import queue
+import threading
+
+import numpy as np
+
+from tareas import informar
+
+# --- Acumuladores en línea para probar secuencias por bloques ---
+#
+# Las pruebas de medias, varianza y Chi-cuadrado solo necesitan unos pocos
+# números de resumen de la muestra (n, media, M2, frecuencias por intervalo). Estos
+# acumuladores los actualizan bloque a bloque, de modo que una secuencia de
+# 10^10 números se puede generar y probar con memoria constante.
+
+TAM_BLOQUE = 1 << 22
+
+
+def bloques_de(datos, tam_bloque=TAM_BLOQUE):
+    """
+    Recorre una muestra por bloques, sin copiarla entera.
+
+    Args:
+        datos: Arreglo (también mapeado en memoria), lista o secuencia guardada
+            (``secuencias.Secuencia``, que normaliza cada tramo al pedirlo).
+
+    Yields:
+        np.ndarray: Bloques consecutivos de a lo sumo ``tam_bloque`` valores.
+    """
+    if hasattr(datos, "bloques"):
+        yield from datos.bloques(tam_bloque)
+        return
+    datos = np.asarray(datos).ravel()
+    for inicio in range(0, len(datos), tam_bloque):
+        yield datos[inicio:inicio + tam_bloque]
+
+
+def cantidad_de(datos):
+    """Cantidad de valores de una muestra de las que acepta ``bloques_de``, sin leerla."""
+    return len(datos) if hasattr(datos, "bloques") else np.size(datos)
+
+
+class Momentos:
+    """
+    Estado combinable de una muestra: cantidad, media y M2 = Σ(x - x̄)².
+
+    Se actualiza por bloques con la fórmula de Welford/Chan, que es estable
+    numéricamente aunque la media sea grande frente a la dispersión. Dos estados
+    calculados por separado (otros procesos, otros archivos, otros días) se
+    combinan con ``combinar`` sin volver a leer los datos.
+
+    Atributos:
+        n (int): Cantidad de valores vistos.
+        media (float): Media de los valores.
+        m2 (float): Suma de los cuadrados de los desvíos respecto de la media.
+    """
+
+    def __init__(self, n=0, media=0.0, m2=0.0):
+        self.n = int(n)
+        self.media = float(media)
+        self.m2 = float(m2)
+
+    @classmethod
+    def de_datos(cls, datos, progreso=None, tam_bloque=TAM_BLOQUE):
+        """Crea el estado de una muestra completa (ver ``bloques_de``), recorriéndola por bloques."""
+        momentos = cls()
+        total = cantidad_de(datos)
+        for bloque in bloques_de(datos, tam_bloque):
+            momentos.agregar(bloque)
+            informar(progreso, momentos.n / total)
+        return momentos
+
+    def agregar(self, bloque):
+        """Incorpora un bloque de valores (o un único valor)."""
+        bloque = np.asarray(bloque, dtype=np.float64).ravel()
+        if bloque.size == 0:
+            return self
+        media = float(np.mean(bloque))
+        desvios = bloque - media
+        return self.combinar(Momentos(bloque.size, media, np.dot(desvios, desvios)))
+
+    def combinar(self, otro):
+        """Incorpora el estado de otra muestra (fórmula de Chan et al.)."""
+        if otro.n == 0:
+            return self
+        if self.n == 0:
+            self.n, self.media, self.m2 = otro.n, otro.media, otro.m2
+            return self
+        n = self.n + otro.n
+        delta = otro.media - self.media
+        self.media += delta * otro.n / n
+        self.m2 += otro.m2 + delta * delta * self.n * otro.n / n
+        self.n = n
+        return self
+
+    def __add__(self, otro):
+        return Momentos(self.n, self.media, self.m2).combinar(otro)
+
+    def varianza(self, ddof=1):
+        """
+        Varianza de la muestra (cuasivarianza con ``ddof=1``).
+
+        Raises:
+            ValueError: Si no hay más de ``ddof`` valores.
+        """
+        if self.n <= ddof:
+            raise ValueError(f"La varianza necesita al menos {ddof + 1} valores (hay {self.n}).")
+        return self.m2 / (self.n - ddof)
+
+    def a_dict(self):
+        """Estado serializable (por ejemplo, para guardarlo en JSON)."""
+        return {"n": self.n, "media": self.media, "m2": self.m2}
+
+    @classmethod
+    def de_dict(cls, estado):
+        return cls(estado["n"], estado["media"], estado["m2"])
+
+    def __repr__(self):
+        return f"Momentos(n={self.n}, media={self.media!r}, m2={self.m2!r})"
+
+
+def reducir(momentos):
+    """Combina una colección de estados ``Momentos`` en uno nuevo."""
+    total = Momentos()
+    for parcial in momentos:
+        total.combinar(parcial)
+    return total
+
+
+class Histograma:
+    """
+    Frecuencias acumuladas de k intervalos.
+
+    Por defecto son k intervalos iguales de [a, b], con el valor b asignado al
+    último. Con ``bordes`` (k + 1 valores crecientes, pueden ser ±inf) los
+    intervalos son [bordes[i], bordes[i + 1]) y se ubican con ``searchsorted``.
+    Los valores fuera del rango se cuentan aparte en ``fuera``.
+    """
+
+    def __init__(self, k=10, a=0.0, b=1.0, bordes=None):
+        if bordes is not None:
+            bordes = np.asarray(bordes, dtype=np.float64)
+            if bordes.ndim != 1 or len(bordes) < 2 or np.any(np.diff(bordes) <= 0):
+                raise ValueError("Los bordes deben ser al menos dos valores estrictamente crecientes.")
+            k, a, b = len(bordes) - 1, bordes[0], bordes[-1]
+        if k <= 0:
+            raise ValueError("La cantidad de intervalos (k) debe ser positiva.")
+        if not a < b:
+            raise ValueError("El límite inferior debe ser menor que el superior.")
+        self.k = k
+        self.a = a
+        self.b = b
+        self.bordes = bordes
+        self.conteos = np.zeros(k, dtype=np.int64)
+        self.fuera = 0
+
+    def agregar(self, bloque):
+        """Incorpora un bloque de valores."""
+        bloque = np.asarray(bloque, dtype=np.float64).ravel()
+        dentro = (bloque >= self.a) & (bloque <= self.b)
+        if not dentro.all():
+            self.fuera += int(bloque.size - np.count_nonzero(dentro))
+            bloque = bloque[dentro]
+        if self.bordes is None:
+            indices = ((bloque - self.a) * (self.k / (self.b - self.a))).astype(np.intp)
+        else:
+            indices = np.searchsorted(self.bordes, bloque, side="right") - 1
+        np.minimum(indices, self.k - 1, out=indices)
+        self.conteos += np.bincount(indices, minlength=self.k)
+        return self
+
+
+def bordes_equiprobables(k, cuantil):
+    """
+    Bordes de k intervalos de igual probabilidad para una distribución objetivo.
+
+    Args:
+        k (int): Cantidad de intervalos.
+        cuantil: Función cuantil (inversa de la acumulada) de la distribución,
+            por ejemplo ``scipy.stats.norm(0, 1).ppf``; debe aceptar arreglos.
+
+    Returns:
+        np.ndarray: Los k + 1 bordes (el primero y el último pueden ser ±inf).
+    """
+    if k <= 0:
+        raise ValueError("La cantidad de intervalos (k) debe ser positiva.")
+    return np.asarray(cuantil(np.linspace(0.0, 1.0, k + 1)), dtype=np.float64)
+
+
+def consumir(bloques, *acumuladores):
+    """
+    Pasa cada bloque por todos los acumuladores, en una sola lectura de la secuencia.
+
+    Returns:
+        tuple: Los mismos acumuladores, ya actualizados.
+    """
+    for bloque in bloques:
+        for acumulador in acumuladores:
+            acumulador.agregar(bloque)
+    return acumuladores
+
+
+_FIN = object()
+
+
+def en_segundo_plano(bloques, profundidad=2):
+    """
+    Genera los bloques en un hilo aparte mientras el consumidor procesa los anteriores.
+
+    NumPy libera el GIL en las operaciones vectorizadas, así que la generación
+    del bloque siguiente se superpone con las pruebas sobre el actual. A lo sumo
+    ``profundidad`` bloques esperan en la cola.
+
+    Yields:
+        Los mismos bloques, en el mismo orden.
+    """
+    cola = queue.Queue(maxsize=profundidad)
+    detener = threading.Event()
+
+    def producir():
+        try:
+            for bloque in bloques:
+                if detener.is_set():
+                    return
+                cola.put(bloque)
+        except BaseException as e:
+            cola.put(e)
+            return
+        cola.put(_FIN)
+
+    hilo = threading.Thread(target=producir, daemon=True)
+    hilo.start()
+    try:
+        while True:
+            elemento = cola.get()
+            if elemento is _FIN:
+                break
+            if isinstance(elemento, BaseException):
+                raise elemento
+            yield elemento
+    finally:
+        detener.set()
+        # Liberar un lugar por si el productor quedó bloqueado en put().
+        while hilo.is_alive():
+            try:
+                cola.get_nowait()
+            except queue.Empty:
+                hilo.join(0.01)
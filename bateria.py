@@ -0,0 +1,240 @@
+"""
+Batería de pruebas de independencia para números pseudoaleatorios U(0, 1).
+
+Las pruebas de medias, varianza, K-S y frecuencias no detectan correlaciones
+entre números consecutivos, que es justamente el defecto de cuadrados medios y
+de los LCG con módulo chico. Estas pruebas sí:
+
+- Rachas arriba y abajo (corridas ascendentes/descendentes).
+- Póker (manos de 5 dígitos).
+- Huecos (distancia entre números que caen en un intervalo [a, b)).
+- Serial en 2 dimensiones (pares consecutivos en una grilla k x k).
+
+Todas se calculan con operaciones de NumPy sobre tramos del arreglo (sin ciclos
+por muestra) y devuelven ``(proceso, interpretacion)`` igual que las pruebas de
+``calculos.py``.
+"""
+import numpy as np
+
+from traza import COMPLETO, Traza
+from valores_criticos import valor_critico, valor_p
+
+TAM_TRAMO = 1 << 22
+
+CATEGORIAS_POKER = ("Todos diferentes", "Un par", "Dos pares", "Tercia", "Full", "Póker", "Quintilla")
+PROBABILIDADES_POKER = np.array([0.3024, 0.5040, 0.1080, 0.0720, 0.0090, 0.0045, 0.0001])
+
+
+def _tramos(n, tam_tramo=TAM_TRAMO):
+    for inicio in range(0, n, tam_tramo):
+        yield inicio, min(inicio + tam_tramo, n)
+
+
+def _interpretar(rechaza, propiedad):
+    if rechaza:
+        return f"Se rechaza la hipótesis nula. Los números NO parecen {propiedad}."
+    return f"No hay evidencia suficiente para rechazar la hipótesis nula. Los números parecen {propiedad}."
+
+
+def _agrupar_esperadas(observadas, esperadas, etiquetas, minimo=5):
+    # Junta las últimas categorías hasta que cada frecuencia esperada sea >= minimo,
+    # como se hace a mano con las tablas de la prueba Chi-cuadrado.
+    observadas, esperadas, etiquetas = list(observadas), list(esperadas), list(etiquetas)
+    while len(esperadas) > 2 and esperadas[-1] < minimo:
+        ultima_o, ultima_e = observadas.pop(), esperadas.pop()
+        observadas[-1] += ultima_o
+        esperadas[-1] += ultima_e
+        etiquetas.pop()
+        if not etiquetas[-1].endswith("o más"):
+            etiquetas[-1] = f"{etiquetas[-1]} o más"
+    return np.array(observadas, dtype=np.float64), np.array(esperadas, dtype=np.float64), etiquetas
+
+
+def _seccion_chi_cuadrado(proceso, observadas, esperadas, etiqueta, alpha, paso):
+    # Agrega al proceso la tabla O_i / E_i y el cálculo de χ² contra el valor crítico.
+    contribuciones = (observadas - esperadas)**2 / esperadas
+    chi2_statistic = float(np.sum(contribuciones))
+    grados_libertad = len(observadas) - 1
+    critico = valor_critico("chi2", alpha, grados_libertad)
+    p = valor_p("chi2", chi2_statistic, grados_libertad)
+
+    proceso.texto(f"{paso}. Frecuencias observadas (Oᵢ) y esperadas (Eᵢ):\n")
+    proceso.pasos(len(observadas), lambda i: f"   - {etiqueta(i)}: O = {observadas[i]:.0f}, E = {esperadas[i]:.4f}, "
+                                             f"(O - E)² / E = {contribuciones[i]:.4f}\n")
+    proceso.texto(f"{paso + 1}. Estadístico Chi-cuadrado:\n   χ² = Σ (Oᵢ - Eᵢ)² / Eᵢ = {chi2_statistic:.4f}\n")
+    proceso.texto(f"{paso + 2}. Grados de libertad: {grados_libertad}; valor crítico (α={alpha}): {critico:.4f}; "
+                  f"valor p: {p:.4f}\n\n")
+    proceso.resultados.update(estadistico=chi2_statistic, grados_libertad=grados_libertad,
+                              valor_critico=critico, valor_p=p)
+    return chi2_statistic >= critico
+
+
+def prueba_de_rachas_proceso(datos, alpha=0.05, nivel=COMPLETO):
+    """
+    Prueba de rachas arriba y abajo.
+
+    Una racha es una secuencia máxima de diferencias consecutivas con el mismo
+    signo (las diferencias nulas cuentan como descendentes). Bajo H0, el número
+    de rachas R es aproximadamente normal con media (2n - 1) / 3 y varianza (16n - 29) / 90.
+    """
+    datos = np.asarray(datos)
+    n = len(datos)
+    if n < 3:
+        raise ValueError("La prueba de rachas necesita al menos 3 números.")
+
+    cambios = 0
+    signo_anterior = None
+    for inicio, fin in _tramos(n - 1):
+        # Cada tramo incluye el último número del anterior para no perder la diferencia de frontera.
+        subidas = datos[inicio + 1:fin + 1] > datos[inicio:fin]
+        cambios += int(np.count_nonzero(subidas[1:] != subidas[:-1]))
+        if signo_anterior is not None:
+            cambios += int(subidas[0] != signo_anterior)
+        signo_anterior = subidas[-1]
+    rachas = cambios + 1
+
+    media_r = (2 * n - 1) / 3
+    varianza_r = (16 * n - 29) / 90
+    z0 = (rachas - media_r) / np.sqrt(varianza_r)
+    z_critico = valor_critico("norm", alpha / 2)
+    p = valor_p("norm", z0, bilateral=True)
+
+    proceso = Traza(nivel)
+    proceso.texto("--- Proceso de la Prueba de Rachas Arriba y Abajo ---\n")
+    proceso.texto(f"1. Datos de entrada:\n   - Tamaño de la muestra (n): {n}\n")
+    proceso.texto(f"2. Número de rachas observadas (R): {rachas}\n")
+    proceso.texto(f"3. Media y varianza de R bajo H0:\n   μR = (2n - 1) / 3 = {media_r:.4f}\n"
+                  f"   σR² = (16n - 29) / 90 = {varianza_r:.4f}\n")
+    proceso.texto(f"4. Estadístico Z0:\n   Z0 = (R - μR) / σR = {z0:.4f}\n")
+    proceso.texto(f"5. Valor crítico (α={alpha}): ±{z_critico:.4f}; valor p: {p:.4f}\n\n")
+    proceso.resultados.update(n=n, rachas=rachas, estadistico=z0, valor_critico=z_critico, valor_p=p)
+
+    return proceso, _interpretar(abs(z0) > z_critico, "independientes")
+
+
+def _tabla_poker():
+    # Categoría de cada una de las 10^5 manos posibles de 5 dígitos (se calcula una vez).
+    manos = np.arange(100000)
+    digitos = np.stack([(manos // 10**k) % 10 for k in range(5)], axis=1)
+    conteos = np.zeros((len(manos), 10), dtype=np.int8)
+    for k in range(5):
+        conteos[manos, digitos[:, k]] += 1
+    distintos = np.count_nonzero(conteos, axis=1)
+    maximo = conteos.max(axis=1)
+    categoria = np.select(
+        [distintos == 5, distintos == 4, (distintos == 3) & (maximo == 2), distintos == 3,
+         (distintos == 2) & (maximo == 3), distintos == 2],
+        [0, 1, 2, 3, 4, 5], default=6,
+    )
+    return categoria.astype(np.int8)
+
+
+_categoria_poker = None
+
+
+def prueba_de_poker_proceso(datos, alpha=0.05, nivel=COMPLETO):
+    """
+    Prueba de póker con los primeros 5 decimales de cada número.
+
+    Cada número se clasifica en una de las 7 manos (todos diferentes, un par,
+    dos pares, tercia, full, póker, quintilla) con una tabla precalculada de las
+    10^5 manos posibles, y se compara con las probabilidades teóricas por Chi-cuadrado.
+    """
+    global _categoria_poker
+    if _categoria_poker is None:
+        _categoria_poker = _tabla_poker()
+
+    datos = np.asarray(datos)
+    n = len(datos)
+    observadas = np.zeros(len(CATEGORIAS_POKER), dtype=np.int64)
+    for inicio, fin in _tramos(n):
+        manos = np.clip((datos[inicio:fin] * 100000).astype(np.int64), 0, 99999)
+        observadas += np.bincount(_categoria_poker[manos], minlength=len(CATEGORIAS_POKER))
+
+    o, e, etiquetas = _agrupar_esperadas(observadas, n * PROBABILIDADES_POKER, CATEGORIAS_POKER)
+
+    proceso = Traza(nivel)
+    proceso.texto("--- Proceso de la Prueba de Póker ---\n")
+    proceso.texto(f"1. Datos de entrada:\n   - Tamaño de la muestra (n): {n}\n"
+                  f"   - Cada número se toma como una mano con sus 5 primeros decimales.\n")
+    rechaza = _seccion_chi_cuadrado(proceso, o, e, etiquetas.__getitem__, alpha, 2)
+    proceso.resultados["n"] = n
+
+    return proceso, _interpretar(rechaza, "independientes")
+
+
+def prueba_de_huecos_proceso(datos, a=0.0, b=0.5, max_hueco=10, alpha=0.05, nivel=COMPLETO):
+    """
+    Prueba de huecos sobre el intervalo [a, b).
+
+    Un hueco es la cantidad de números entre dos apariciones consecutivas de
+    valores en [a, b). Con p = b - a, P(hueco = i) = p (1 - p)^i; los huecos
+    de longitud >= ``max_hueco`` se agrupan en una sola categoría.
+    """
+    if not 0 <= a < b <= 1:
+        raise ValueError("El intervalo [a, b) debe cumplir 0 <= a < b <= 1.")
+    datos = np.asarray(datos)
+    n = len(datos)
+    p_intervalo = b - a
+
+    observadas = np.zeros(max_hueco + 1, dtype=np.int64)
+    ultima = None
+    for inicio, fin in _tramos(n):
+        tramo = datos[inicio:fin]
+        posiciones = np.flatnonzero((tramo >= a) & (tramo < b)) + inicio
+        if posiciones.size == 0:
+            continue
+        if ultima is not None:
+            posiciones = np.concatenate(([ultima], posiciones))
+        huecos = np.diff(posiciones) - 1
+        observadas += np.bincount(np.minimum(huecos, max_hueco), minlength=max_hueco + 1)
+        ultima = posiciones[-1]
+
+    total_huecos = int(observadas.sum())
+    if total_huecos == 0:
+        raise ValueError("No hay suficientes números en [a, b) para formar huecos.")
+    probabilidades = p_intervalo * (1 - p_intervalo)**np.arange(max_hueco + 1)
+    probabilidades[-1] = (1 - p_intervalo)**max_hueco
+    etiquetas = [str(i) for i in range(max_hueco)] + [f"{max_hueco} o más"]
+    o, e, etiquetas = _agrupar_esperadas(observadas, total_huecos * probabilidades, etiquetas)
+
+    proceso = Traza(nivel)
+    proceso.texto("--- Proceso de la Prueba de Huecos ---\n")
+    proceso.texto(f"1. Datos de entrada:\n   - Tamaño de la muestra (n): {n}\n"
+                  f"   - Intervalo [a, b) = [{a}, {b}), p = b - a = {p_intervalo:.4f}\n"
+                  f"   - Huecos encontrados: {total_huecos}\n")
+    rechaza = _seccion_chi_cuadrado(proceso, o, e, etiquetas.__getitem__, alpha, 2)
+    proceso.resultados["n"] = n
+
+    return proceso, _interpretar(rechaza, "independientes")
+
+
+def prueba_serial_proceso(datos, k=10, alpha=0.05, nivel=COMPLETO):
+    """
+    Prueba serial en 2 dimensiones.
+
+    Los pares no solapados (u₁, u₂), (u₃, u₄), ... se ubican en una grilla de
+    k x k celdas; bajo H0 cada celda tiene frecuencia esperada (n / 2) / k².
+    """
+    datos = np.asarray(datos)
+    n_pares = len(datos) // 2
+    if n_pares == 0:
+        raise ValueError("La prueba serial necesita al menos 2 números.")
+
+    observadas = np.zeros(k * k, dtype=np.int64)
+    for inicio, fin in _tramos(n_pares):
+        pares = np.asarray(datos[2 * inicio:2 * fin]).reshape(-1, 2)
+        celdas = np.clip((pares * k).astype(np.int64), 0, k - 1)
+        observadas += np.bincount(celdas[:, 0] * k + celdas[:, 1], minlength=k * k)
+
+    esperadas = np.full(k * k, n_pares / (k * k))
+
+    proceso = Traza(nivel)
+    proceso.texto("--- Proceso de la Prueba Serial (2 dimensiones) ---\n")
+    proceso.texto(f"1. Datos de entrada:\n   - Tamaño de la muestra (n): {len(datos)}\n"
+                  f"   - Pares no solapados: {n_pares}\n   - Grilla: {k} x {k} celdas\n")
+    rechaza = _seccion_chi_cuadrado(proceso, observadas.astype(np.float64), esperadas,
+                                    lambda i: f"Celda ({i // k + 1}, {i % k + 1})", alpha, 2)
+    proceso.resultados["n"] = len(datos)
+
+    return proceso, _interpretar(rechaza, "independientes")
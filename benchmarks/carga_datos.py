@@ -0,0 +1,84 @@
+"""
+Mide la carga de 10^7 muestras desde archivos con ``carga.cargar_muestras``.
+
+Se escriben los mismos valores como .npy, binario crudo .f64/.f32 y CSV (uno por
+línea, 6 decimales) y se cronometra la carga hasta tener los datos en memoria
+(los mapeos se materializan sumando el arreglo). Todos los formatos, el CSV
+incluido, deben cargarse en menos de ``--limite-s``. El texto de un formulario
+se compara con el ``float(x) for x in texto.split(',')`` que usaban las
+interfaces, que no tenían un lector de archivos.
+
+Uso:
+    python benchmarks/carga_datos.py [--n 10000000] [--repeticiones 3] [--limite-s 1]
+"""
+import argparse
+import os
+import sys
+import tempfile
+import time
+
+import numpy as np
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+from carga import cargar_muestras, parsear_texto, validar_rango
+
+
+def cronometrar(funcion, repeticiones):
+    """Mejor tiempo (s) de ``repeticiones`` llamadas y el último resultado."""
+    mejor = float("inf")
+    for _ in range(repeticiones):
+        inicio = time.perf_counter()
+        resultado = funcion()
+        mejor = min(mejor, time.perf_counter() - inicio)
+    return mejor, resultado
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--n", type=int, default=10_000_000)
+    parser.add_argument("--repeticiones", type=int, default=3)
+    parser.add_argument("--limite-s", type=float, default=1.0)
+    args = parser.parse_args(argv)
+
+    datos = np.round(np.random.default_rng(0).random(args.n), 6)
+    falla = False
+    with tempfile.TemporaryDirectory() as directorio:
+        rutas = {
+            "npy": os.path.join(directorio, "muestras.npy"),
+            "f64": os.path.join(directorio, "muestras.f64"),
+            "f32": os.path.join(directorio, "muestras.f32"),
+            "csv": os.path.join(directorio, "muestras.csv"),
+        }
+        np.save(rutas["npy"], datos)
+        datos.tofile(rutas["f64"])
+        datos.astype(np.float32).tofile(rutas["f32"])
+        with open(rutas["csv"], "w") as archivo:
+            archivo.write("valor\n")
+            np.savetxt(archivo, datos, fmt="%.6f")
+
+        print(f"Carga de {args.n:,} muestras (mejor de {args.repeticiones}):")
+        for formato, ruta in rutas.items():
+            # Materializar y validar el rango: lo que hace una prueba antes de empezar.
+            t, cargado = cronometrar(lambda: validar_rango(np.asarray(cargar_muestras(ruta), dtype=np.float64)),
+                                     args.repeticiones)
+            tol = 1e-6 if formato == "f32" else 0.0
+            if len(cargado) != args.n or not np.allclose(cargado, datos, rtol=0, atol=tol):
+                print(f"  {formato}: FALLA, los valores leídos no coinciden")
+                falla = True
+                continue
+            mb = os.path.getsize(ruta) / 1024 ** 2
+            marca = " OK" if t < args.limite_s else f" FALLA (límite {args.limite_s} s)"
+            falla |= t >= args.limite_s
+            print(f"  {formato:<4} {t:7.3f} s  ({mb:6.1f} MB, {args.n / t / 1e6:6.1f} M valores/s){marca}")
+
+    texto = ",".join(f"{x:.6f}" for x in datos[:100_000])
+    t_nuevo, _ = cronometrar(lambda: parsear_texto(texto), args.repeticiones)
+    t_viejo, _ = cronometrar(lambda: np.array([float(x.strip()) for x in texto.split(",")]), args.repeticiones)
+    print(f"Texto de formulario con 100,000 valores: {t_nuevo * 1000:.1f} ms (antes {t_viejo * 1000:.1f} ms)")
+
+    print("FALLA" if falla else "OK")
+    return 1 if falla else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
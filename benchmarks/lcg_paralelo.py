@@ -0,0 +1,70 @@
+"""
+Mide la generación en paralelo del multiplicador constante (``lcg_paralelo``) para 1, 2, 4, ... procesos.
+
+Para cada cantidad de procesos se genera la secuencia en memoria compartida y
+se compara con la serial (``estados_lcg``): deben ser idénticas. Se informa la
+velocidad y la aceleración frente a un proceso; con ``--archivo`` también se
+mide la escritura directa a un .seq mapeado.
+
+Uso:
+    python benchmarks/lcg_paralelo.py [--n 100000000] [--procesos 1 2 4 8] [--archivo]
+"""
+import argparse
+import os
+import sys
+import tempfile
+import time
+
+import numpy as np
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+from lcg_paralelo import estados_lcg_paralelo, guardar_lcg_paralelo
+from multiplicador_constante import estados_lcg
+from secuencias import abrir_secuencia
+
+SEMILLA, A, M = 12345, 16807, 2 ** 31 - 1
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--n", type=int, default=100_000_000)
+    nucleos = os.cpu_count() or 1
+    parser.add_argument("--procesos", type=int, nargs="*",
+                        default=sorted({1, *(2 ** k for k in range(1, nucleos.bit_length())), nucleos}))
+    parser.add_argument("--archivo", action="store_true", help="Medir también la escritura a un archivo .seq.")
+    args = parser.parse_args(argv)
+
+    inicio = time.perf_counter()
+    serial = estados_lcg(SEMILLA, A, M, args.n)
+    t_serial = time.perf_counter() - inicio
+    print(f"{args.n:,} estados, {nucleos} núcleos. Serial (estados_lcg): {t_serial:.2f} s")
+
+    falla = False
+    base = None
+    for procesos in args.procesos:
+        inicio = time.perf_counter()
+        estados = estados_lcg_paralelo(SEMILLA, A, M, args.n, procesos)
+        t = time.perf_counter() - inicio
+        base = base or t
+        iguales = np.array_equal(estados, serial)
+        falla |= not iguales
+        print(f"  {procesos:>3} procesos: {t:6.2f} s  {args.n / t / 1e6:7.1f} M estados/s  "
+              f"x{base / t:4.2f}  {'idéntica' if iguales else 'FALLA: distinta de la serial'}")
+        del estados
+
+        if args.archivo:
+            with tempfile.TemporaryDirectory() as directorio:
+                ruta = os.path.join(directorio, "lcg.seq")
+                inicio = time.perf_counter()
+                guardar_lcg_paralelo(ruta, SEMILLA, A, M, args.n, procesos)
+                t = time.perf_counter() - inicio
+                iguales = np.array_equal(abrir_secuencia(ruta).estados, serial)
+                falla |= not iguales
+                print(f"      a .seq: {t:6.2f} s  {'idéntica' if iguales else 'FALLA: distinta de la serial'}")
+
+    print("FALLA" if falla else "OK")
+    return 1 if falla else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,228 @@
+"""
+Mide tiempo, velocidad y memoria pico de los generadores y las pruebas para varios tamaños.
+
+Cubre los cinco ``*_proceso`` que usa script.py, ``EstadisticaApp.middle_square_method``
+y las pruebas de interface.py, y los cálculos de eje1 a eje4. Los datos de
+entrada se preparan fuera de la medición. El tiempo es el mejor de varias
+corridas; la memoria pico (``tracemalloc``, que también registra los arreglos de
+NumPy) se mide en una corrida aparte para no sumar su costo al tiempo.
+
+Corre sin pantalla (matplotlib con el backend Agg) y sin red. Los resultados se
+guardan como JSON; con ``--base`` se comparan con una corrida anterior y el
+programa termina con código 1 si algún caso se volvió más lento que la tolerancia.
+
+Uso:
+    python benchmarks/rendimiento.py --salida base.json
+    python benchmarks/rendimiento.py --hasta 8 --base base.json --salida actual.json
+    python benchmarks/rendimiento.py --casos medias uniformidad --hasta 7
+"""
+import argparse
+import datetime
+import json
+import os
+import platform
+import sys
+import time
+import tracemalloc
+
+os.environ.setdefault("MPLBACKEND", "Agg")
+
+import numpy as np
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+import calculos
+from cuadrados_medios import secuencia_cuadrados_medios
+from traza import RESUMEN
+from valores_criticos import valor_critico
+
+# Tiempo mínimo acumulado por caso y tamaño antes de dejar de repetir.
+TIEMPO_MINIMO = 0.2
+
+
+def _uniformes(n):
+    return np.random.default_rng(n).random(n)
+
+
+def _con_texto(resultado):
+    # Las interfaces muestran el proceso: se incluye el costo de convertirlo a texto.
+    str(resultado[0])
+    return resultado
+
+
+def _chi_cuadrado_eje(datos, k=10, alpha=0.05):
+    # Cálculo de eje1.py / eje2.py a partir de un archivo de muestras.
+    observadas = calculos.frecuencias_de_muestras(datos, k)
+    esperada = observadas.sum() / k
+    estadistico = np.sum((observadas - esperada) ** 2 / esperada)
+    return estadistico < valor_critico("chi2", alpha, k - 1)
+
+
+def _medias_eje3(numeros, alpha=0.05):
+    # Cálculo de eje3.py: Z0 con la varianza teórica 1/12.
+    error_estandar = np.sqrt(1 / 12) / np.sqrt(len(numeros))
+    z0 = (np.mean(numeros) - 0.5) / error_estandar
+    return abs(z0) <= valor_critico("norm", alpha / 2)
+
+
+def _cuadrados_medios_eje4(n, semilla=123456, digitos=6):
+    # Cálculo de eje4.py: estados normalizados a una lista.
+    estados = secuencia_cuadrados_medios(semilla, n, digitos)
+    return list(estados.astype(np.float64) / (10 ** digitos - 1))
+
+
+def _middle_square_interface(n):
+    from interface import EstadisticaApp
+
+    # El método no usa el estado de la ventana, así que no hace falta crear una (ni una pantalla).
+    return EstadisticaApp.middle_square_method(None, 123456, n, 6)
+
+
+def _pruebas_interface(datos):
+    from calculos import prueba_chi_cuadrado_frecuencias, prueba_de_medias_uniforme
+
+    # interface.py: chi-cuadrado desde las muestras (10 intervalos) y prueba de medias.
+    return (prueba_chi_cuadrado_frecuencias(calculos.frecuencias_de_muestras(datos, 10)),
+            prueba_de_medias_uniforme(datos))
+
+
+# nombre -> (preparar(n) -> argumento, medir(argumento))
+CASOS = {
+    "script.prueba_de_medias_proceso": (
+        _uniformes, lambda d: _con_texto(calculos.prueba_de_medias_proceso(d, 0.5, None, RESUMEN))),
+    "script.prueba_de_varianza_proceso": (
+        _uniformes, lambda d: _con_texto(calculos.prueba_de_varianza_proceso(d, 1 / 12, RESUMEN))),
+    "script.prueba_de_uniformidad_proceso": (
+        _uniformes, lambda d: _con_texto(calculos.prueba_de_uniformidad_proceso(d, RESUMEN))),
+    "script.generador_cuadrados_medios_proceso": (
+        int, lambda n: _con_texto(calculos.generador_cuadrados_medios_proceso(5735, n, RESUMEN))),
+    "script.generador_multiplicador_constante_proceso": (
+        int, lambda n: _con_texto(calculos.generador_multiplicador_constante_proceso(
+            12345, 16807, 2 ** 31 - 1, n, RESUMEN))),
+    "interface.middle_square_method": (int, _middle_square_interface),
+    "interface.pruebas_uniformidad_y_medias": (_uniformes, _pruebas_interface),
+    "eje1_eje2.chi_cuadrado": (_uniformes, _chi_cuadrado_eje),
+    "eje3.medias": (_uniformes, _medias_eje3),
+    "eje4.cuadrados_medios": (int, _cuadrados_medios_eje4),
+}
+
+
+def medir(preparar, funcion, n, repeticiones):
+    """
+    Mide un caso para un tamaño.
+
+    Returns:
+        dict: ``segundos`` (mejor corrida), ``por_segundo`` (elementos/s),
+        ``memoria_pico`` (bytes por encima de lo que ya ocupaba la entrada) y ``corridas``.
+    """
+    argumento = preparar(n)
+    funcion(argumento)  # calentamiento: importaciones perezosas y cachés de valores críticos
+
+    tiempos = []
+    while len(tiempos) < repeticiones and (not tiempos or sum(tiempos) < TIEMPO_MINIMO):
+        inicio = time.perf_counter()
+        funcion(argumento)
+        tiempos.append(time.perf_counter() - inicio)
+
+    tracemalloc.start()
+    base, _ = tracemalloc.get_traced_memory()
+    tracemalloc.reset_peak()
+    funcion(argumento)
+    _, pico = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+
+    segundos = min(tiempos)
+    return {"segundos": segundos, "por_segundo": n / segundos if segundos else None,
+            "memoria_pico": pico - base, "corridas": len(tiempos)}
+
+
+def comparar(resultados, base, tolerancia, minimo_s):
+    """
+    Compara con una corrida anterior.
+
+    Returns:
+        list: (caso, n, segundos, segundos de la base) de los casos que superan a la
+        base en más de ``tolerancia`` (fracción) y en más de ``minimo_s`` segundos.
+    """
+    anteriores = {(r["caso"], r["n"]): r for r in base["resultados"]}
+    regresiones = []
+    for r in resultados:
+        anterior = anteriores.get((r["caso"], r["n"]))
+        if anterior is None:
+            continue
+        mas_lento = r["segundos"] - anterior["segundos"]
+        if mas_lento > anterior["segundos"] * tolerancia and mas_lento > minimo_s:
+            regresiones.append((r["caso"], r["n"], r["segundos"], anterior["segundos"]))
+    return regresiones
+
+
+def _bytes(cantidad):
+    for unidad in ("B", "KB", "MB", "GB"):
+        if cantidad < 1024 or unidad == "GB":
+            return f"{cantidad:.0f} {unidad}" if unidad == "B" else f"{cantidad:.1f} {unidad}"
+        cantidad /= 1024
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--desde", type=int, default=2, help="Exponente del menor tamaño (10^desde). Por defecto 2.")
+    parser.add_argument("--hasta", type=int, default=6, help="Exponente del mayor tamaño (10^hasta). Por defecto 6; "
+                                                               "10^8 necesita varios GB de memoria.")
+    parser.add_argument("--casos", nargs="*", default=None,
+                        help="Solo los casos cuyo nombre contiene alguno de estos textos.")
+    parser.add_argument("--repeticiones", type=int, default=5, help="Máximo de corridas por caso y tamaño.")
+    parser.add_argument("--limite-s", type=float, default=30.0,
+                        help="Si un caso tarda más que esto, se omiten sus tamaños mayores.")
+    parser.add_argument("--salida", help="Archivo JSON donde guardar los resultados.")
+    parser.add_argument("--base", help="Resultados JSON de una corrida anterior contra la cual comparar.")
+    parser.add_argument("--tolerancia", type=float, default=0.25,
+                        help="Aumento relativo de tiempo tolerado frente a la base. Por defecto 0.25 (25 %%).")
+    parser.add_argument("--minimo-ms", type=float, default=5.0,
+                        help="Diferencias absolutas menores que esto nunca son regresiones (ruido).")
+    args = parser.parse_args(argv)
+
+    casos = {nombre: caso for nombre, caso in CASOS.items()
+             if not args.casos or any(texto in nombre for texto in args.casos)}
+    tamanos = [10 ** e for e in range(args.desde, args.hasta + 1)]
+
+    resultados = []
+    for nombre, (preparar, funcion) in casos.items():
+        print(nombre)
+        for n in tamanos:
+            medicion = medir(preparar, funcion, n, args.repeticiones)
+            resultados.append(dict(caso=nombre, n=n, **medicion))
+            print(f"  n = {n:>11,}  {medicion['segundos'] * 1000:10.2f} ms  "
+                  f"{medicion['por_segundo']:9.3g} valores/s  pico {_bytes(medicion['memoria_pico']):>9}")
+            if medicion["segundos"] > args.limite_s:
+                print(f"  (se omiten los tamaños mayores: superó {args.limite_s} s)")
+                break
+
+    informe = {
+        "fecha": datetime.datetime.now().isoformat(timespec="seconds"),
+        "python": platform.python_version(),
+        "numpy": np.__version__,
+        "plataforma": platform.platform(),
+        "procesador": platform.processor() or platform.machine(),
+        "nucleos": os.cpu_count(),
+        "resultados": resultados,
+    }
+    if args.salida:
+        with open(args.salida, "w", encoding="utf-8") as archivo:
+            json.dump(informe, archivo, indent=2, ensure_ascii=False)
+        print(f"Resultados guardados en {args.salida}")
+
+    if args.base:
+        with open(args.base, encoding="utf-8") as archivo:
+            base = json.load(archivo)
+        regresiones = comparar(resultados, base, args.tolerancia, args.minimo_ms / 1000)
+        if regresiones:
+            print(f"FALLA: {len(regresiones)} regresiones frente a {args.base}:")
+            for caso, n, actual, anterior in regresiones:
+                print(f"  {caso} n = {n:,}: {actual * 1000:.2f} ms (base {anterior * 1000:.2f} ms, "
+                      f"{actual / anterior - 1:+.0%})")
+            return 1
+        print(f"OK: sin regresiones frente a {args.base}")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,80 @@
+"""
+Mide el tiempo de importación en frío del núcleo de cálculo (``calculos``).
+
+Cada medición corre en un intérprete nuevo con ``python -X importtime`` y se
+informa la mediana del total real y, al lado, la del total sin NumPy. El límite
+(100 ms) se aplica al total real, NumPy incluido: es lo que paga quien importa
+el núcleo. Con ``--sin-numpy`` se aplica solo al resto (módulos propios más lo
+que importen); es un objetivo menor que el pedido, útil para detectar
+regresiones propias en máquinas donde NumPy sola ya ronda los 100 ms.
+
+Uso:
+    python benchmarks/tiempo_importacion.py [--modulo calculos] [--repeticiones 7] [--limite-ms 100] [--sin-numpy]
+"""
+import argparse
+import os
+import statistics
+import subprocess
+import sys
+
+RAIZ = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+# Módulos que no deben cargarse al importar el núcleo.
+PESADOS = ("scipy", "matplotlib", "tkinter")
+
+
+def medir_importacion(modulo):
+    """
+    Importa ``modulo`` en un intérprete nuevo.
+
+    Returns:
+        tuple: (microsegundos totales, microsegundos de numpy, módulos pesados cargados).
+    """
+    salida = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", f"import {modulo}"],
+        cwd=RAIZ, capture_output=True, text=True, check=True,
+    ).stderr
+
+    acumulados = {}
+    for linea in salida.splitlines():
+        if not linea.startswith("import time:") or "|" not in linea:
+            continue
+        _, acumulado, nombre = linea[len("import time:"):].split("|")
+        if acumulado.strip().isdigit():
+            acumulados[nombre.strip()] = int(acumulado)
+
+    pesados = sorted({nombre.split(".")[0] for nombre in acumulados if nombre.split(".")[0] in PESADOS})
+    return acumulados.get(modulo, 0), acumulados.get("numpy", 0), pesados
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--modulo", default="calculos")
+    parser.add_argument("--repeticiones", type=int, default=7)
+    parser.add_argument("--limite-ms", type=float, default=100.0)
+    parser.add_argument("--sin-numpy", action="store_true", help="Aplicar el límite al total sin NumPy.")
+    args = parser.parse_args(argv)
+
+    mediciones = [medir_importacion(args.modulo) for _ in range(args.repeticiones)]
+    total_ms = statistics.median(m[0] for m in mediciones) / 1000
+    numpy_ms = statistics.median(m[1] for m in mediciones) / 1000
+    nucleo_ms = total_ms - numpy_ms
+    pesados = sorted(set().union(*(m[2] for m in mediciones)))
+
+    medido_ms = nucleo_ms if args.sin_numpy else total_ms
+    limite = f" (límite {args.limite_ms:.0f} ms)"
+    print(f"import {args.modulo} en frío (mediana de {args.repeticiones}):")
+    print(f"  total:          {total_ms:.1f} ms{'' if args.sin_numpy else limite}")
+    print(f"  sin numpy:      {nucleo_ms:.1f} ms{limite if args.sin_numpy else ''}")
+    print(f"  numpy:          {numpy_ms:.1f} ms")
+    print(f"  módulos pesados cargados: {', '.join(pesados) if pesados else 'ninguno'}")
+
+    if pesados or medido_ms > args.limite_ms:
+        print("FALLA: el núcleo de cálculo excede el presupuesto de importación.")
+        return 1
+    print("OK")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
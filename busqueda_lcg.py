@@ -0,0 +1,468 @@
+"""
+Búsqueda de multiplicadores para el Algoritmo Multiplicador Constante.
+
+Uso:
+    python busqueda_lcg.py 2147483647 --mejores 10
+    python busqueda_lcg.py 65536 --c 12345 --mejores 10
+
+Para un módulo m se recorren los multiplicadores a en [inicio, fin) y:
+
+1. Se descartan los que no alcanzan el período máximo: con c = 0, a debe ser
+   coprimo con m y de orden λ(m) (función de Carmichael); con c ≠ 0 se usan
+   las condiciones de Hull–Dobell para el período completo m.
+2. Se calcula la prueba espectral en dimensión 2 (reducción de Gauss,
+   vectorizada) y se preseleccionan los mejores de cada tramo.
+3. A los preseleccionados se les calcula la prueba espectral en las
+   dimensiones 2 a 6 (LLL más enumeración del vector más corto) y se ordenan
+   por el mínimo de las figuras de mérito normalizadas S_t ∈ (0, 1].
+
+Los tramos se reparten entre los procesos de un pool y el resultado de cada
+uno se agrega como una línea a un archivo JSON Lines por módulo, así que una
+búsqueda interrumpida continúa donde quedó y una repetida no recalcula nada.
+"""
+import argparse
+import contextlib
+import json
+import math
+import os
+import random
+import sys
+from concurrent.futures import ProcessPoolExecutor
+
+import numpy as np
+
+DIMENSIONES = (2, 3, 4, 5, 6)
+
+# γ_t^t, con γ_t la constante de Hermite: cota del vector más corto de una red de determinante 1.
+_HERMITE_POTENCIA = {2: 4 / 3, 3: 2, 4: 4, 5: 8, 6: 64 / 3, 7: 64, 8: 256}
+
+TAM_TRAMO = 1 << 20
+
+# Candidatos por tramo (los de mayor S_2) que pasan a la prueba espectral completa.
+PRESELECCION = 200
+
+# Hasta este módulo los productos de la reducción de Gauss caben en int64.
+_M_MAX_VECTORIAL = 1 << 31
+
+DIRECTORIO_POR_DEFECTO = os.path.join(os.path.expanduser("~"), ".cache", "busqueda_lcg")
+
+
+# --- Aritmética: factorización y período ---
+
+def _es_primo(n):
+    if n < 2:
+        return False
+    for p in (2, 3, 5, 7, 11, 13, 17, 19, 23, 29, 31, 37):
+        if n % p == 0:
+            return n == p
+    d, s = n - 1, 0
+    while d % 2 == 0:
+        d //= 2
+        s += 1
+    # Con estas bases Miller-Rabin es determinista para n < 3.3 · 10^24.
+    for b in (2, 3, 5, 7, 11, 13, 17, 19, 23, 29, 31, 37, 41):
+        x = pow(b, d, n)
+        if x in (1, n - 1):
+            continue
+        for _ in range(s - 1):
+            x = x * x % n
+            if x == n - 1:
+                break
+        else:
+            return False
+    return True
+
+
+def _pollard_rho(n):
+    if n % 2 == 0:
+        return 2
+    rng = random.Random(n)
+    while True:
+        c = rng.randrange(1, n)
+        x = y = rng.randrange(2, n)
+        d = 1
+        while d == 1:
+            x = (x * x + c) % n
+            y = (y * y + c) % n
+            y = (y * y + c) % n
+            d = math.gcd(abs(x - y), n)
+        if d != n:
+            return d
+
+
+def factorizar(n):
+    """Factorización en primos de n como diccionario {primo: exponente}."""
+    factores = {}
+    for p in (2, 3, 5, 7, 11, 13):
+        while n % p == 0:
+            factores[p] = factores.get(p, 0) + 1
+            n //= p
+    pendientes = [n] if n > 1 else []
+    while pendientes:
+        k = pendientes.pop()
+        if _es_primo(k):
+            factores[k] = factores.get(k, 0) + 1
+            continue
+        d = _pollard_rho(k)
+        pendientes.extend((d, k // d))
+    return dict(sorted(factores.items()))
+
+
+def carmichael(m):
+    """Función de Carmichael λ(m): el mayor orden posible de un elemento módulo m."""
+    resultado = 1
+    for p, e in factorizar(m).items():
+        if p == 2 and e >= 3:
+            lam = 2 ** (e - 2)
+        else:
+            lam = (p - 1) * p ** (e - 1)
+        resultado = resultado * lam // math.gcd(resultado, lam)
+    return resultado
+
+
+def periodo_maximo(a, m, c=0):
+    """
+    Indica si X_{i+1} = (a X_i + c) mod m alcanza el mayor período posible.
+
+    Con c = 0 el período máximo es λ(m) (con una semilla coprima con m); con
+    c ≠ 0 es m, y se verifica con el teorema de Hull–Dobell.
+    """
+    if c % m:
+        return _hull_dobell(a, c, m, factorizar(m))
+    return _orden_maximo(a, m, carmichael(m), factorizar(carmichael(m)))
+
+
+def _hull_dobell(a, c, m, factores_m):
+    if math.gcd(c, m) != 1:
+        return False
+    if any((a - 1) % p for p in factores_m):
+        return False
+    return m % 4 != 0 or (a - 1) % 4 == 0
+
+
+def _orden_maximo(a, m, lam, factores_lam):
+    if math.gcd(a, m) != 1:
+        return False
+    return all(pow(a, lam // q, m) != 1 for q in factores_lam)
+
+
+def _potencia_vectorial(bases, exponente, m):
+    # Exponenciación modular por cuadrados sobre un arreglo; con m <= 2^32 los
+    # productos caben en uint64.
+    resultado = np.ones_like(bases)
+    base = bases.copy()
+    modulo = np.uint64(m)
+    while exponente:
+        if exponente & 1:
+            resultado = resultado * base % modulo
+        base = base * base % modulo
+        exponente >>= 1
+    return resultado
+
+
+# --- Prueba espectral ---
+
+def _producto(u, v):
+    return sum(x * y for x, y in zip(u, v))
+
+
+def _gram_schmidt(base):
+    n = len(base)
+    mu = [[0.0] * n for _ in range(n)]
+    ortogonal, normas = [], []
+    for i in range(n):
+        v = [float(x) for x in base[i]]
+        for j in range(i):
+            mu[i][j] = _producto(base[i], ortogonal[j]) / normas[j]
+            v = [x - mu[i][j] * y for x, y in zip(v, ortogonal[j])]
+        ortogonal.append(v)
+        normas.append(_producto(v, v))
+    return mu, normas
+
+
+def _lll(base, delta=0.99):
+    # LLL con coordenadas enteras exactas y Gram-Schmidt en punto flotante;
+    # en dimensión <= 6 alcanza con recalcular Gram-Schmidt tras cada cambio.
+    base = [list(fila) for fila in base]
+    mu, normas = _gram_schmidt(base)
+    k = 1
+    while k < len(base):
+        for j in range(k - 1, -1, -1):
+            q = round(mu[k][j])
+            if q:
+                base[k] = [x - q * y for x, y in zip(base[k], base[j])]
+                mu, normas = _gram_schmidt(base)
+        if normas[k] >= (delta - mu[k][k - 1] ** 2) * normas[k - 1]:
+            k += 1
+        else:
+            base[k], base[k - 1] = base[k - 1], base[k]
+            mu, normas = _gram_schmidt(base)
+            k = max(k - 1, 1)
+    return base
+
+
+def _mas_corto(base):
+    # Enumeración de Fincke–Pohst sobre una base ya reducida: devuelve la norma
+    # al cuadrado (exacta) del vector no nulo más corto de la red.
+    n = len(base)
+    mu, normas = _gram_schmidt(base)
+    mejor = min(_producto(b, b) for b in base)
+    x = [0] * n
+
+    def buscar(j, acumulado):
+        nonlocal mejor
+        centro = -sum(mu[i][j] * x[i] for i in range(j + 1, n))
+        radio = math.sqrt(max(mejor - acumulado, 0) / normas[j]) + 1e-9
+        for xj in range(math.ceil(centro - radio), math.floor(centro + radio) + 1):
+            parcial = acumulado + normas[j] * (xj - centro) ** 2
+            if parcial > mejor * (1 + 1e-9):
+                continue
+            x[j] = xj
+            if j:
+                buscar(j - 1, parcial)
+            elif any(x):
+                v = [sum(x[i] * base[i][k] for i in range(n)) for k in range(n)]
+                mejor = min(mejor, _producto(v, v))
+        x[j] = 0
+
+    buscar(n - 1, 0.0)
+    return mejor
+
+
+def _base_dual(a, m, t):
+    # Red dual del generador: vectores x con x_1 + a x_2 + ... + a^(t-1) x_t ≡ 0 (mod m).
+    base = [[m] + [0] * (t - 1)]
+    for i in range(1, t):
+        fila = [0] * t
+        fila[0] = -pow(a, i, m)
+        fila[i] = 1
+        base.append(fila)
+    return base
+
+
+def merito_normalizado(nu, m, t):
+    """S_t = ν_t / (γ_t^(1/2) m^(1/t)), entre 0 y 1 (1 es la red ideal)."""
+    return nu / (_HERMITE_POTENCIA[t] ** (1 / (2 * t)) * m ** (1 / t))
+
+
+def prueba_espectral(a, m, dimensiones=DIMENSIONES):
+    """
+    Prueba espectral del generador (a, m) en las dimensiones pedidas.
+
+    ν_t es la longitud del vector más corto de la red dual: 1/ν_t es la máxima
+    distancia entre los hiperplanos paralelos que cubren las t-uplas generadas.
+
+    Returns:
+        dict: {t: (ν_t, S_t)}.
+    """
+    resultado = {}
+    for t in dimensiones:
+        if t not in _HERMITE_POTENCIA:
+            raise ValueError(f"La dimensión debe estar entre 2 y {max(_HERMITE_POTENCIA)}.")
+        nu = math.sqrt(_mas_corto(_lll(_base_dual(a, m, t))))
+        resultado[t] = (nu, merito_normalizado(nu, m, t))
+    return resultado
+
+
+def _nu2_vectorial(multiplicadores, m):
+    # Reducción de Gauss de las bases {(m, 0), (a, -1)} de todos los a a la vez.
+    u0 = np.full(len(multiplicadores), m, dtype=np.int64)
+    u1 = np.zeros(len(multiplicadores), dtype=np.int64)
+    v0 = multiplicadores.astype(np.int64)
+    v1 = np.full(len(multiplicadores), -1, dtype=np.int64)
+    activos = np.arange(len(multiplicadores))
+    while activos.size:
+        a0, a1, b0, b1 = u0[activos], u1[activos], v0[activos], v1[activos]
+        uv = a0 * b0 + a1 * b1
+        vv = b0 * b0 + b1 * b1
+        # Redondeo exacto de uv / vv sin pasar por punto flotante.
+        q, r = np.divmod(uv, vv)
+        q += 2 * r > vv
+        a0 -= q * b0
+        a1 -= q * b1
+        sigue = a0 * a0 + a1 * a1 < vv
+        # Los que siguen intercambian u y v; los demás ya tienen en v el más corto.
+        u0[activos] = np.where(sigue, b0, a0)
+        u1[activos] = np.where(sigue, b1, a1)
+        v0[activos] = np.where(sigue, a0, b0)
+        v1[activos] = np.where(sigue, a1, b1)
+        activos = activos[sigue]
+    return np.sqrt((v0 * v0 + v1 * v1).astype(np.float64))
+
+
+def _nu2(a, m):
+    u, v = (m, 0), (a, -1)
+    while True:
+        uv, vv = _producto(u, v), _producto(v, v)
+        q = (2 * uv + vv) // (2 * vv)
+        u = (u[0] - q * v[0], u[1] - q * v[1])
+        if _producto(u, u) >= vv:
+            return math.sqrt(vv)
+        u, v = v, u
+
+
+# --- Búsqueda ---
+
+def _explorar_tramo(tarea):
+    m, c, inicio, fin, preseleccion = tarea
+    factores_m = factorizar(m)
+    lam = carmichael(m)
+    factores_lam = factorizar(lam)
+
+    if c % m == 0 and m <= _M_MAX_VECTORIAL:
+        a = np.arange(inicio, fin, dtype=np.uint64)
+        a = a[np.gcd(a.astype(np.int64), m) == 1]
+        # Cada factor primo descarta una parte; los siguientes solo se prueban sobre los que quedan.
+        for q in factores_lam:
+            a = a[_potencia_vectorial(a, lam // q, m) != 1]
+        meritos = _nu2_vectorial(a, m) / (_HERMITE_POTENCIA[2] ** 0.25 * math.sqrt(m))
+        candidatos = list(zip(a.tolist(), meritos.tolist()))
+    else:
+        if c % m:
+            completos = (a for a in range(inicio, fin) if _hull_dobell(a, c, m, factores_m))
+        else:
+            completos = (a for a in range(inicio, fin) if _orden_maximo(a, m, lam, factores_lam))
+        candidatos = [(a, merito_normalizado(_nu2(a, m), m, 2)) for a in completos]
+
+    candidatos.sort(key=lambda par: -par[1])
+    return {"periodo_maximo": len(candidatos), "candidatos": candidatos[:preseleccion]}
+
+
+def _evaluar(tarea):
+    a, m, dimensiones = tarea
+    espectral = prueba_espectral(a, m, dimensiones)
+    return {
+        "a": a,
+        "nu": {t: nu for t, (nu, _) in espectral.items()},
+        "S": {t: s for t, (_, s) in espectral.items()},
+        "merito": min(s for _, s in espectral.values()),
+    }
+
+
+def _ruta_cache(directorio, m):
+    return os.path.join(directorio, f"lcg_m{m}.jsonl")
+
+
+def _leer_cache(ruta):
+    # Una línea incompleta (la búsqueda se cortó mientras se escribía) se ignora.
+    cache = {"tramos": {}, "espectral": {}}
+    try:
+        with open(ruta, encoding="utf-8") as archivo:
+            for linea in archivo:
+                try:
+                    registro = json.loads(linea)
+                    cache[registro["seccion"]][registro["clave"]] = registro["valor"]
+                except (ValueError, KeyError, TypeError):
+                    continue
+    except OSError:
+        pass
+    return cache
+
+
+def _abrir_cache(ruta):
+    os.makedirs(os.path.dirname(ruta), exist_ok=True)
+    archivo = open(ruta, "a+", encoding="utf-8")
+    # Si la última línea quedó cortada, la próxima empieza en una línea nueva.
+    if archivo.tell():
+        archivo.seek(archivo.tell() - 1)
+        if archivo.read(1) != "\n":
+            archivo.write("\n")
+    return archivo
+
+
+def _agregar_a_cache(archivo, seccion, registros):
+    # Solo se agregan las líneas nuevas: el archivo no se reescribe por cada tramo.
+    archivo.write("".join(json.dumps({"seccion": seccion, "clave": clave, "valor": valor}) + "\n"
+                          for clave, valor in registros))
+    archivo.flush()
+
+
+def buscar_multiplicadores(m, c=0, inicio=2, fin=None, mejores=10, dimensiones=DIMENSIONES, preseleccion=PRESELECCION,
+                           procesos=None, directorio=DIRECTORIO_POR_DEFECTO, tam_tramo=TAM_TRAMO):
+    """
+    Busca y ordena los multiplicadores de período máximo de un módulo.
+
+    Args:
+        m (int): Módulo.
+        c (int): Incremento (0 para el multiplicador constante de este proyecto).
+        inicio, fin (int): Rango de multiplicadores a recorrer (por defecto [2, m)).
+        mejores (int): Cantidad de multiplicadores a devolver.
+        dimensiones (tuple): Dimensiones de la prueba espectral.
+        preseleccion (int): Candidatos por tramo (según S_2) que pasan a la prueba
+            completa; debe ser bastante mayor que ``mejores``.
+        procesos (int): Procesos del pool (1 = sin pool).
+        directorio (str): Carpeta de la caché en disco (None para no usarla).
+
+    Returns:
+        dict: ``m``, ``c``, ``periodo_maximo`` (cuántos a del rango lo alcanzan) y
+        ``mejores``: lista de {a, nu, S, merito} ordenada por mérito decreciente.
+    """
+    if m < 2:
+        raise ValueError("El módulo (m) debe ser al menos 2.")
+    fin = m if fin is None else min(fin, m)
+    inicio = max(inicio, 1)
+    preseleccion = max(preseleccion, mejores)
+
+    ruta = _ruta_cache(directorio, m) if directorio else None
+    cache = _leer_cache(ruta) if ruta else {"tramos": {}, "espectral": {}}
+    tramos = cache["tramos"]
+
+    claves, pendientes = [], []
+    for desde in range(inicio, fin, tam_tramo):
+        hasta = min(desde + tam_tramo, fin)
+        clave = f"{c % m}:{desde}:{hasta}:{preseleccion}"
+        claves.append(clave)
+        if clave not in tramos:
+            pendientes.append((clave, (m, c % m, desde, hasta, preseleccion)))
+
+    with ProcessPoolExecutor(max_workers=procesos) as pool, \
+            (_abrir_cache(ruta) if ruta else contextlib.nullcontext()) as archivo:
+        mapear = map if procesos == 1 else pool.map
+        for (clave, _), resultado in zip(pendientes, mapear(_explorar_tramo, [t for _, t in pendientes])):
+            tramos[clave] = resultado
+            if archivo:
+                _agregar_a_cache(archivo, "tramos", [(clave, resultado)])
+
+        total = sum(tramos[clave]["periodo_maximo"] for clave in claves)
+        preseleccionados = sorted((par for clave in claves for par in tramos[clave]["candidatos"]),
+                                  key=lambda par: -par[1])[:preseleccion]
+
+        evaluados = cache["espectral"]
+        faltan = [a for a, _ in preseleccionados if f"{a}:{dimensiones}" not in evaluados]
+        nuevos = [(f"{resultado['a']}:{dimensiones}", resultado)
+                  for resultado in mapear(_evaluar, [(a, m, dimensiones) for a in faltan])]
+        evaluados.update(nuevos)
+        if archivo and nuevos:
+            _agregar_a_cache(archivo, "espectral", nuevos)
+
+    # JSON guarda las claves como texto: se vuelven a convertir las dimensiones a enteros.
+    ranking = sorted(({**r, "nu": {int(t): v for t, v in r["nu"].items()}, "S": {int(t): v for t, v in r["S"].items()}}
+                      for r in (evaluados[f"{a}:{dimensiones}"] for a, _ in preseleccionados)),
+                     key=lambda r: -r["merito"])
+    return {"m": m, "c": c, "periodo_maximo": total, "mejores": ranking[:mejores]}
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Búsqueda de multiplicadores del generador congruencial.")
+    parser.add_argument("m", type=int, help="Módulo.")
+    parser.add_argument("--c", type=int, default=0, help="Incremento (0 = multiplicador constante). Por defecto 0.")
+    parser.add_argument("--inicio", type=int, default=2, help="Primer multiplicador a considerar. Por defecto 2.")
+    parser.add_argument("--fin", type=int, default=None, help="Multiplicador final (excluido). Por defecto m.")
+    parser.add_argument("--mejores", type=int, default=10, help="Cantidad de multiplicadores a mostrar. Por defecto 10.")
+    parser.add_argument("--procesos", "-j", type=int, default=None, help="Procesos en paralelo (por defecto, uno por núcleo).")
+    parser.add_argument("--cache", default=DIRECTORIO_POR_DEFECTO, help="Carpeta de la caché en disco.")
+    parser.add_argument("--sin-cache", action="store_true", help="No leer ni escribir la caché.")
+    args = parser.parse_args(argv)
+
+    resultado = buscar_multiplicadores(args.m, args.c, args.inicio, args.fin, args.mejores, procesos=args.procesos,
+                                       directorio=None if args.sin_cache else args.cache)
+    print(f"m = {resultado['m']}, c = {resultado['c']}: "
+          f"{resultado['periodo_maximo']} multiplicadores con período máximo en el rango.")
+    for r in resultado["mejores"]:
+        figuras = "  ".join(f"S{t}={s:.4f}" for t, s in r["S"].items())
+        print(f"  a = {r['a']:<12} mínimo = {r['merito']:.4f}  {figuras}")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,208 @@
+import hashlib
+import os
+import pickle
+import tempfile
+import threading
+from collections import OrderedDict
+
+import numpy as np
+
+# --- Caché de resultados direccionada por contenido ---
+#
+# Repetir una prueba sobre los mismos datos volvía a ordenar, a construir las
+# curvas y a dibujar la figura. Aquí cada resultado se guarda bajo una clave que
+# es el hash de sus entradas (el contenido de los arreglos, o ruta, tamaño y
+# fecha de los archivos) y de los parámetros de la prueba. Hay dos niveles: una
+# LRU en memoria acotada en bytes y un directorio en disco acotado en tamaño,
+# del que se borran primero las entradas usadas hace más tiempo. Las entradas se
+# guardan serializadas con pickle, así que cada consulta devuelve una copia.
+
+DIRECTORIO_POR_DEFECTO = os.path.join(os.path.expanduser("~"), ".cache", "calculadora")
+
+MAX_MEMORIA = 64 * 1024 ** 2
+MAX_DISCO = 512 * 1024 ** 2
+
+# Las entradas más grandes (p. ej. el texto completo de 10^6 pasos) no se guardan.
+MAX_ENTRADA = 16 * 1024 ** 2
+
+# Versión de los cálculos y del formato de las entradas; entra en cada clave.
+# Hay que incrementarla cuando cambie lo que calcula una prueba, su texto o la
+# forma de la entrada guardada: así las entradas viejas del disco dejan de usarse.
+VERSION_CACHE = 1
+
+# Elementos por tramo al calcular el hash de un arreglo.
+_TRAMO_HASH = 1 << 22
+
+
+def _alimentar(h, valor):
+    if isinstance(valor, np.ndarray):
+        h.update(f"ndarray:{valor.dtype.str}:{valor.shape}:".encode())
+        plano = valor.reshape(-1)
+        for inicio in range(0, len(plano), _TRAMO_HASH):
+            h.update(np.ascontiguousarray(plano[inicio:inicio + _TRAMO_HASH]).data)
+    elif isinstance(valor, str) and valor.strip() and os.path.isfile(valor.strip()):
+        # Un archivo se identifica por ruta, tamaño y fecha de modificación, sin leerlo.
+        estado = os.stat(valor.strip())
+        h.update(f"archivo:{os.path.abspath(valor.strip())}:{estado.st_size}:{estado.st_mtime_ns}".encode())
+    elif isinstance(valor, (list, tuple)):
+        h.update(f"{type(valor).__name__}:{len(valor)}:".encode())
+        for elemento in valor:
+            _alimentar(h, elemento)
+    else:
+        h.update(f"{type(valor).__name__}:{valor!r};".encode())
+
+
+def clave_de(*entradas, **parametros):
+    """
+    Clave hexadecimal de un cálculo.
+
+    Args:
+        *entradas: Arreglos (se usa su contenido), textos (una ruta a un archivo
+            existente se identifica por ruta, tamaño y fecha) u otros valores.
+        **parametros: Parámetros de la prueba (media/varianza hipotética, σ,
+            alfa, semilla, a, m, nivel de detalle, ...).
+
+    La clave incluye ``VERSION_CACHE``, de modo que un cambio en los cálculos no
+    devuelve resultados guardados por una versión anterior.
+    """
+    h = hashlib.blake2b(digest_size=16)
+    h.update(f"version:{VERSION_CACHE};".encode())
+    for entrada in entradas:
+        _alimentar(h, entrada)
+    for nombre in sorted(parametros):
+        h.update(f"|{nombre}=".encode())
+        _alimentar(h, parametros[nombre])
+    return h.hexdigest()
+
+
+class CacheResultados:
+    """
+    Caché de dos niveles (memoria y disco) para resultados serializables.
+
+    Args:
+        directorio (str): Carpeta del nivel en disco; None para usar solo memoria.
+        max_memoria (int): Bytes máximos en memoria.
+        max_disco (int): Bytes máximos en disco.
+        max_entrada (int): Tamaño máximo (serializado) de una entrada.
+    """
+
+    def __init__(self, directorio=DIRECTORIO_POR_DEFECTO, max_memoria=MAX_MEMORIA, max_disco=MAX_DISCO,
+                 max_entrada=MAX_ENTRADA):
+        self.directorio = directorio
+        self.max_memoria = max_memoria
+        self.max_disco = max_disco
+        self.max_entrada = max_entrada
+        self._memoria = OrderedDict()
+        self._bytes_memoria = 0
+        self._cerrojo = threading.Lock()
+
+    def _ruta(self, clave):
+        return os.path.join(self.directorio, clave + ".pkl")
+
+    def _a_memoria(self, clave, datos):
+        with self._cerrojo:
+            anterior = self._memoria.pop(clave, None)
+            if anterior is not None:
+                self._bytes_memoria -= len(anterior)
+            self._memoria[clave] = datos
+            self._bytes_memoria += len(datos)
+            while self._bytes_memoria > self.max_memoria and len(self._memoria) > 1:
+                _, viejo = self._memoria.popitem(last=False)
+                self._bytes_memoria -= len(viejo)
+
+    def obtener(self, clave):
+        """Devuelve (una copia de) el valor guardado bajo ``clave``, o None."""
+        with self._cerrojo:
+            datos = self._memoria.get(clave)
+            if datos is not None:
+                self._memoria.move_to_end(clave)
+        if datos is None and self.directorio:
+            try:
+                with open(self._ruta(clave), "rb") as archivo:
+                    datos = archivo.read()
+                # La fecha de modificación marca el último uso para el recorte del disco.
+                os.utime(self._ruta(clave))
+            except OSError:
+                return None
+            self._a_memoria(clave, datos)
+        if datos is None:
+            return None
+        try:
+            return pickle.loads(datos)
+        except Exception:
+            self.descartar(clave)
+            return None
+
+    def guardar(self, clave, valor):
+        """
+        Guarda ``valor`` en memoria y en disco.
+
+        Returns:
+            bool: False si la entrada supera ``max_entrada`` y no se guardó.
+        """
+        datos = pickle.dumps(valor, protocol=pickle.HIGHEST_PROTOCOL)
+        if len(datos) > self.max_entrada:
+            return False
+        self._a_memoria(clave, datos)
+        if self.directorio:
+            try:
+                os.makedirs(self.directorio, exist_ok=True)
+                descriptor, temporal = tempfile.mkstemp(dir=self.directorio, suffix=".tmp")
+                with os.fdopen(descriptor, "wb") as archivo:
+                    archivo.write(datos)
+                os.replace(temporal, self._ruta(clave))
+                self._recortar_disco()
+            except OSError:
+                # Sin permiso o sin espacio: la caché en memoria sigue funcionando.
+                pass
+        return True
+
+    def memorizar(self, clave, calcular):
+        """Devuelve el valor guardado bajo ``clave`` o, si no hay, ``calcular()`` (y lo guarda)."""
+        valor = self.obtener(clave)
+        if valor is None:
+            valor = calcular()
+            self.guardar(clave, valor)
+        return valor
+
+    def descartar(self, clave):
+        with self._cerrojo:
+            datos = self._memoria.pop(clave, None)
+            if datos is not None:
+                self._bytes_memoria -= len(datos)
+        if self.directorio:
+            try:
+                os.remove(self._ruta(clave))
+            except OSError:
+                pass
+
+    def limpiar(self):
+        """Vacía ambos niveles."""
+        with self._cerrojo:
+            self._memoria.clear()
+            self._bytes_memoria = 0
+        if self.directorio and os.path.isdir(self.directorio):
+            for entrada in os.scandir(self.directorio):
+                if entrada.name.endswith(".pkl"):
+                    os.remove(entrada.path)
+
+    def _recortar_disco(self):
+        entradas = [e for e in os.scandir(self.directorio) if e.name.endswith(".pkl")]
+        estados = [(e.stat(), e.path) for e in entradas]
+        total = sum(estado.st_size for estado, _ in estados)
+        for estado, ruta in sorted(estados, key=lambda par: par[0].st_mtime_ns):
+            if total <= self.max_disco:
+                break
+            try:
+                os.remove(ruta)
+            except OSError:
+                continue
+            total -= estado.st_size
+
+
+# Caché compartida por las interfaces. CALCULADORA_SIN_CACHE=1 la desactiva
+# (no guarda nada); CALCULADORA_CACHE=<carpeta> cambia el directorio en disco.
+if os.environ.get("CALCULADORA_SIN_CACHE") == "1":
+    CACHE = CacheResultados(None, max_memoria=0, max_disco=0, max_entrada=-1)
+else:
+    CACHE = CacheResultados(os.environ.get("CALCULADORA_CACHE", DIRECTORIO_POR_DEFECTO))
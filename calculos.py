@@ -0,0 +1,505 @@
+"""
+Lógica de cálculo de las pruebas estadísticas y los generadores, sin interfaz gráfica.
+
+Este módulo se puede importar sin pantalla y sin pagar la carga de SciPy ni de
+Matplotlib: ambas se importan recién dentro de las funciones que las usan
+(valores p, distribuciones y gráficos). Lo mismo ``lcg_paralelo`` y ``carga``,
+que traen multiprocessing y solo hacen falta al generar en paralelo o al leer
+un archivo.
+"""
+import numpy as np
+
+from acumuladores import Histograma, Momentos, bloques_de, bordes_equiprobables, cantidad_de, consumir, en_segundo_plano
+from congruencial import GeneradorCongruencial
+from cuadrados_medios import secuencia_cuadrados_medios
+from graficos import MAX_PUNTOS, dibujar_frecuencias, preparar_figura, puntos_cdf_empirica
+from kolmogorov import MEMORIA_POR_DEFECTO, prueba_ks, prueba_ks_archivo
+from medicion import etapa
+from multiplicador_constante import normalizar_estados
+from tareas import informar, tramo
+from traza import COMPLETO, Traza
+from valores_criticos import valor_critico, valor_p as valor_p_tabla
+
+
+# --- Gráficos de las funciones de proceso ---
+#
+# Con ``graficar=DIFERIDO`` las funciones de proceso no tocan Matplotlib:
+# devuelven una función ``dibujar(fig)`` que guarda solo los datos del gráfico
+# ya reducidos (frecuencias, puntos de la curva). Así la interfaz calcula en un
+# hilo aparte y dibuja desde el hilo de Tk sobre la figura de su vista.
+
+DIFERIDO = "diferido"
+
+
+def _graficar(graficar, fig, dibujar, *datos):
+    if not graficar:
+        return None
+    if graficar == DIFERIDO:
+        return lambda fig: dibujar(fig, *datos)
+    return dibujar(fig, *datos)
+
+
+def _dibujar_varianza(fig, chi2_statistic, grados_libertad):
+    from scipy.stats import chi2
+
+    with etapa("figura"):
+        fig, ax = preparar_figura(fig)
+        x = np.linspace(0, chi2.ppf(0.99, grados_libertad) * 1.5, 100)
+        ax.plot(x, chi2.pdf(x, grados_libertad), 'r-', lw=2, label='Distribución Chi-cuadrado')
+        ax.axvline(chi2_statistic, color='blue', linestyle='--', label=f'Estadístico χ²: {chi2_statistic:.4f}')
+        ax.set_title('Prueba de Varianza Chi-cuadrado')
+        ax.set_xlabel('Valor')
+        ax.set_ylabel('Densidad de Probabilidad')
+        ax.legend()
+        ax.grid(True)
+        fig.tight_layout()
+    return fig
+
+
+def _dibujar_uniformidad(fig, valores, cdf, marcar):
+    with etapa("figura"):
+        fig, ax = preparar_figura(fig)
+        ax.plot(valores, cdf, label='CDF Empírica', **({"marker": "o"} if marcar else {}))
+        ax.plot(np.linspace(0, 1, 100), np.linspace(0, 1, 100), label='CDF Uniforme Teórica', linestyle='--')
+        ax.set_title('Prueba de Uniformidad (Kolmogorov-Smirnov)')
+        ax.set_xlabel('Valor')
+        ax.set_ylabel('Probabilidad Acumulada')
+        ax.legend()
+        ax.grid(True)
+        fig.tight_layout()
+    return fig
+
+
+def _dibujar_generados(fig, conteos, bordes):
+    with etapa("figura"):
+        fig, ax = preparar_figura(fig)
+        dibujar_frecuencias(ax, conteos, bordes, edgecolor='black', alpha=0.7)
+        ax.set_title('Histograma de Números Generados')
+        ax.set_xlabel('Valor')
+        ax.set_ylabel('Frecuencia')
+        ax.grid(axis='y', alpha=0.75)
+        fig.tight_layout()
+    return fig
+
+
+# --- Funciones de Lógica de Cálculo (mejoradas con pasos) ---
+
+def prueba_de_medias_proceso(datos, media_hipotetica, desviacion_estandar_poblacional=None, nivel=COMPLETO,
+                             progreso=None):
+    return _proceso_medias(datos, Momentos.de_datos(datos, progreso), media_hipotetica,
+                           desviacion_estandar_poblacional, nivel)
+
+
+def _proceso_medias(datos, momentos, media_hipotetica, desviacion_estandar_poblacional, nivel):
+    # Todo sale del estado (n, media, M2); ``datos`` solo se muestra.
+    n = momentos.n
+    # La prueba Z necesita un valor; la t, además, dos para estimar s.
+    minimo = 1 if desviacion_estandar_poblacional else 2
+    if n < minimo:
+        raise ValueError(f"La prueba {'Z' if minimo == 1 else 't'} necesita al menos {minimo} "
+                         f"{'valor' if minimo == 1 else 'valores'} (hay {n}).")
+    media_muestra = momentos.media
+    proceso = Traza(nivel)
+    proceso.texto("--- Proceso de la Prueba de Medias ---\n")
+    proceso.texto(f"1. Datos de entrada:\n   - Muestra: {datos}\n   - Tamaño de la muestra (n): {n}\n   - Media hipotética (μ₀): {media_hipotetica}\n")
+    proceso.texto(f"2. Cálculo de la media de la muestra (x̄):\n   x̄ = Σ(datos) / n = {media_muestra:.4f}\n")
+
+    if desviacion_estandar_poblacional:
+        # Prueba Z
+        desviacion_estandar_error = desviacion_estandar_poblacional / np.sqrt(n)
+        z_score = (media_muestra - media_hipotetica) / desviacion_estandar_error
+        valor_p = valor_p_tabla("norm", z_score, bilateral=True)
+
+        proceso.texto(f"3. Desviación estándar poblacional conocida (σ = {desviacion_estandar_poblacional:.4f}). Se usa una Prueba Z.\n")
+        proceso.texto(f"4. Cálculo del Error Estándar (σ / √n):\n   Error Estándar = {desviacion_estandar_poblacional:.4f} / √{n} = {desviacion_estandar_error:.4f}\n")
+        proceso.texto(f"5. Cálculo del Estadístico Z:\n   Z = (x̄ - μ₀) / Error Estándar\n   Z = ({media_muestra:.4f} - {media_hipotetica:.4f}) / {desviacion_estandar_error:.4f} = {z_score:.4f}\n")
+        proceso.texto(f"6. Cálculo del Valor p (área bajo la curva Z):\n   Valor p = 2 * P(Z > |{z_score:.4f}|) = {valor_p:.4f}\n\n")
+
+        proceso.resultados.update(prueba="Z", n=n, media=media_muestra, estadistico=z_score, valor_p=valor_p)
+        interpretacion = f"Interpretación:\n- Si el valor p ({valor_p:.4f}) es menor que 0.05, se rechaza la hipótesis nula.\n- Resultado: {'Se rechaza la hipótesis nula. La media de la muestra es significativamente diferente de la media hipotética.' if valor_p < 0.05 else 'No hay evidencia suficiente para rechazar la hipótesis nula. La media de la muestra no es significativamente diferente de la media hipotética.'}"
+
+        return proceso, interpretacion
+    else:
+        # Prueba t
+        desviacion_estandar_muestra = np.sqrt(momentos.varianza())
+        error_estandar = desviacion_estandar_muestra / np.sqrt(n)
+        t_statistic = (media_muestra - media_hipotetica) / error_estandar
+
+        proceso.texto(f"3. Desviación estándar poblacional desconocida. Se usa una Prueba t.\n")
+        proceso.texto(f"4. Cálculo de la Desviación Estándar de la Muestra (s):\n   s = {desviacion_estandar_muestra:.4f}\n")
+        proceso.texto(f"5. Cálculo del Error Estándar (s / √n):\n   Error Estándar = {desviacion_estandar_muestra:.4f} / √{n} = {error_estandar:.4f}\n")
+        proceso.texto(f"6. Cálculo del Estadístico t:\n   t = (x̄ - μ₀) / Error Estándar\n   t = ({media_muestra:.4f} - {media_hipotetica:.4f}) / {error_estandar:.4f} = {t_statistic:.4f}\n")
+
+        proceso.resultados.update(prueba="t", n=n, media=media_muestra, estadistico=t_statistic,
+                                  grados_libertad=n - 1)
+        return proceso, "Se ha calculado el estadístico t. Para la interpretación, se compara este valor con el valor crítico de la distribución t de Student."
+
+
+def prueba_de_varianza_proceso(datos, varianza_hipotetica, nivel=COMPLETO, graficar=True, fig=None, progreso=None):
+    momentos = Momentos.de_datos(datos, tramo(progreso, 0.0, 0.8, "Calculando la varianza"))
+    informar(progreso, 0.8, "Graficando")
+    return _proceso_varianza(momentos, varianza_hipotetica, nivel, graficar, fig)
+
+
+def _proceso_varianza(momentos, varianza_hipotetica, nivel, graficar, fig=None):
+    n = momentos.n
+    if n < 2:
+        raise ValueError(f"La prueba de varianza necesita al menos 2 valores (hay {n}).")
+    varianza_muestra = momentos.varianza()
+    grados_libertad = n - 1
+
+    proceso = Traza(nivel)
+    proceso.texto("--- Proceso de la Prueba de Varianza ---\n")
+    proceso.texto(f"1. Datos de entrada:\n   - Tamaño de la muestra (n): {n}\n   - Varianza hipotética (σ₀²): {varianza_hipotetica}\n")
+    proceso.texto(f"2. Cálculo de la varianza de la muestra (s²):\n   s² = Σ(xi - x̄)² / (n - 1) = {varianza_muestra:.4f}\n")
+    proceso.texto(f"3. Grados de libertad (df):\n   df = n - 1 = {n - 1}\n")
+    proceso.texto(f"4. Cálculo del Estadístico Chi-cuadrado (χ²):\n   χ² = ((n - 1) * s²) / σ₀²\n   χ² = (({n - 1}) * {varianza_muestra:.4f}) / {varianza_hipotetica:.4f} = {(n - 1) * varianza_muestra / varianza_hipotetica:.4f}\n\n")
+
+    chi2_statistic = (n - 1) * varianza_muestra / varianza_hipotetica
+    proceso.resultados.update(n=n, varianza=varianza_muestra, estadistico=chi2_statistic,
+                              grados_libertad=grados_libertad)
+
+    return proceso, _graficar(graficar, fig, _dibujar_varianza, chi2_statistic, grados_libertad)
+
+
+def prueba_de_uniformidad_proceso(datos, nivel=COMPLETO, graficar=True, fig=None, progreso=None):
+    n = len(datos)
+    informar(progreso, 0.0, "Ordenando los datos")
+    datos_ordenados = np.sort(datos)
+    # D, D+, D- y el valor p salen del motor K-S (``kolmogorov.prueba_ks``) sobre
+    # la misma muestra ordenada: los datos no se vuelven a ordenar.
+    informar(progreso, 0.4, "Calculando el estadístico D y el valor p")
+    resultado = prueba_ks(datos_ordenados, ordenados=True)
+    estadistico_ks, valor_p = resultado['D'], resultado['valor_p']
+
+    proceso = Traza(nivel)
+    proceso.texto("--- Proceso de la Prueba de Uniformidad (Kolmogorov-Smirnov) ---\n")
+    proceso.texto(f"1. Datos de entrada:\n   - Tamaño de la muestra (n): {n}\n")
+    proceso.texto(f"2. Ordenar los datos de menor a mayor:\n   {np.round(datos_ordenados, 4)}\n")
+
+    proceso.texto(f"3. Calcular la diferencia absoluta máxima (D):\n   D = max(|CDF Empírica - CDF Teórica|)\n")
+    proceso.texto("   - Diferencias superiores: [")
+    # Solo se formatean las diferencias que la traza muestra.
+    proceso.pasos(n, lambda i: f"'{(i + 1) / n - datos_ordenados[i]:.4f}'", separador=", ", omitidos="... ({} omitidas)")
+    proceso.texto("]\n   - Diferencias inferiores: [")
+    proceso.pasos(n, lambda i: f"'{datos_ordenados[i] - i / n:.4f}'", separador=", ", omitidos="... ({} omitidas)")
+    proceso.texto("]\n")
+    proceso.texto(f"   - Estadístico D: {estadistico_ks:.4f}\n")
+    proceso.texto(f"4. El valor p para el Estadístico D ({estadistico_ks:.4f}) es: {valor_p:.4f}\n\n")
+
+    interpretacion = 'Se rechaza la hipótesis de uniformidad. Los datos NO parecen uniformes.' if valor_p < 0.05 else 'No hay evidencia suficiente para rechazar la hipótesis. Los datos parecen uniformes.'
+    proceso.resultados.update(n=n, estadistico=estadistico_ks, valor_p=valor_p)
+
+    if not graficar:
+        return proceso, interpretacion, None
+
+    informar(progreso, 0.8, "Graficando")
+    valores, cdf = puntos_cdf_empirica(datos_ordenados)
+    return proceso, interpretacion, _graficar(graficar, fig, _dibujar_uniformidad, valores, cdf, n <= MAX_PUNTOS)
+
+
+def prueba_de_uniformidad_archivo_proceso(ruta, dtype=None, memoria_max=MEMORIA_POR_DEFECTO, nivel=COMPLETO,
+                                          graficar=True, fig=None, progreso=None):
+    # Variante para muestras enormes guardadas en disco (.npy, .seq o binario
+    # crudo): no ordena en RAM ni lista las diferencias, y la CDF empírica se
+    # grafica con los puntos tomados durante la misma mezcla.
+    from carga import tipo_crudo
+
+    informar(progreso, 0.0, "Ordenando los datos por tramos")
+    resultado = prueba_ks_archivo(ruta, dtype or tipo_crudo(ruta), memoria_max,
+                                  puntos_cdf=MAX_PUNTOS if graficar else 0, progreso=tramo(progreso, 0.0, 0.8))
+
+    proceso = Traza(nivel)
+    proceso.texto("--- Proceso de la Prueba de Uniformidad (Kolmogorov-Smirnov, archivo) ---\n")
+    proceso.texto(f"1. Datos de entrada:\n   - Archivo: {ruta}\n   - Tamaño de la muestra (n): {resultado['n']}\n")
+    proceso.texto(f"2. Ordenar los datos por tramos de a lo sumo {memoria_max // (1024 ** 2)} MB y mezclarlos por bloques.\n")
+    proceso.texto(f"3. Calcular la diferencia absoluta máxima (D) durante la mezcla:\n")
+    proceso.texto(f"   - D+ = max((i + 1) / n - u_i) = {resultado['D+']:.4f}\n")
+    proceso.texto(f"   - D- = max(u_i - i / n) = {resultado['D-']:.4f}\n")
+    proceso.texto(f"   - Estadístico D: {resultado['D']:.4f}\n")
+    proceso.texto(f"4. El valor p para el Estadístico D ({resultado['D']:.4f}) es: {resultado['valor_p']:.4f}\n\n")
+
+    proceso.resultados.update(n=resultado['n'], estadistico=resultado['D'], valor_p=resultado['valor_p'])
+    interpretacion = 'Se rechaza la hipótesis de uniformidad. Los datos NO parecen uniformes.' if resultado['valor_p'] < 0.05 else 'No hay evidencia suficiente para rechazar la hipótesis. Los datos parecen uniformes.'
+
+    if not graficar:
+        return proceso, interpretacion, None
+
+    informar(progreso, 0.8, "Graficando")
+    return proceso, interpretacion, _graficar(graficar, fig, _dibujar_uniformidad, *resultado['cdf'], False)
+
+
+def generador_cuadrados_medios_proceso(semilla, n_numeros, nivel=COMPLETO, fig=None, progreso=None, graficar=True):
+    proceso = Traza(nivel)
+    proceso.texto("--- Proceso del Algoritmo de Cuadrados Medios ---\n")
+    proceso.texto(f"1. Semilla inicial (X₀): {semilla}\n")
+
+    # Los estados se leen del índice precalculado de 4 dígitos; cada iteración
+    # del proceso se formatea recién cuando se muestra.
+    estados = secuencia_cuadrados_medios(semilla, n_numeros, 4, tramo(progreso, 0.0, 0.6, "Generando"))
+    numeros_generados = estados.astype(np.float64) / 10000
+
+    def iteracion(i):
+        current_semilla = str(int(estados[i - 1]) if i else semilla).zfill(4)
+        cuadrado_str = str(int(current_semilla) ** 2).zfill(8)
+        medio = str(int(estados[i])).zfill(4)
+        return (f"2. Iteración {i + 1}:\n"
+                f"   - Semilla actual: {current_semilla}\n"
+                f"   - Semilla al cuadrado: {cuadrado_str}\n"
+                f"   - Números del medio: {medio}\n"
+                f"   - Número pseudoaleatorio (U{i + 1}): {numeros_generados[i]:.4f}\n\n")
+
+    proceso.pasos(n_numeros, iteracion)
+
+    if not graficar:
+        return proceso, None
+
+    informar(progreso, 0.8, "Graficando")
+    return proceso, _graficar(graficar, fig, _dibujar_generados, *np.histogram(numeros_generados, bins=10))
+
+
+def generador_multiplicador_constante_proceso(semilla, a, m, n_numeros, nivel=COMPLETO, fig=None, progreso=None,
+                                              procesos=1, c=0, graficar=True):
+    # lcg_paralelo trae multiprocessing y shared_memory: se importa solo al generar.
+    from lcg_paralelo import estados_lcg_paralelo
+
+    proceso = Traza(nivel)
+    if c:
+        proceso.texto("--- Proceso del Algoritmo Congruencial Mixto ---\n")
+        proceso.texto(f"1. Parámetros:\n   - Semilla (X₀): {semilla}\n   - Multiplicador (a): {a}\n"
+                      f"   - Incremento (c): {c}\n   - Módulo (m): {m}\n")
+    else:
+        proceso.texto("--- Proceso del Algoritmo Multiplicador Constante ---\n")
+        proceso.texto(f"1. Parámetros:\n   - Semilla (X₀): {semilla}\n   - Multiplicador (a): {a}\n   - Módulo (m): {m}\n")
+
+    # Los estados se calculan por bloques vectorizados (con procesos != 1, por
+    # tramos contiguos en varios procesos); cada iteración del proceso se
+    # formatea recién cuando se muestra. El mixto (c != 0) usa el generador de
+    # 64 bits de ``congruencial``.
+    if c:
+        estados = GeneradorCongruencial(a, m, c).estados(semilla, n_numeros,
+                                                         progreso=tramo(progreso, 0.0, 0.6, "Generando"))
+    else:
+        estados = estados_lcg_paralelo(semilla, a, m, n_numeros, procesos,
+                                       progreso=tramo(progreso, 0.0, 0.6, "Generando"))
+    numeros_generados = normalizar_estados(estados, m)
+    # Con c = 0 la fórmula queda la del multiplicador constante.
+    mas_c, mas_incremento = (" + c", f" + {c}") if c else ("", "")
+
+    def iteracion(i):
+        xn = int(estados[i - 1]) if i else semilla
+        xn_siguiente = int(estados[i])
+        return (f"2. Iteración {i + 1}:\n"
+                f"   - Fórmula: X_{i + 1} = (a * X_{i}{mas_c}) mod m\n"
+                f"   - Cálculo: X_{i + 1} = ({a} * {xn}{mas_incremento}) mod {m} = {xn_siguiente}\n"
+                f"   - Número pseudoaleatorio (U{i + 1}): {xn_siguiente} / {m} = {numeros_generados[i]:.4f}\n\n")
+
+    proceso.pasos(n_numeros, iteracion)
+
+    if not graficar:
+        return proceso, None
+
+    informar(progreso, 0.8, "Graficando")
+    return proceso, _graficar(graficar, fig, _dibujar_generados, *np.histogram(numeros_generados, bins=10))
+
+
+# --- Pruebas sobre números pseudoaleatorios U(0, 1) (calculadora de interface.py) ---
+
+def prueba_chi_cuadrado_frecuencias(observed_freq, alpha=0.05):
+    """
+    Prueba de uniformidad Chi-cuadrado a partir de las frecuencias observadas por intervalo.
+
+    Args:
+        observed_freq (np.ndarray): Frecuencias observadas O_i de los k intervalos.
+        alpha (float): Nivel de significancia.
+
+    Returns:
+        dict: ``n``, ``esperada`` (E_i), ``estadistico`` (χ²), ``grados_libertad``,
+        ``valor_critico`` y ``rechaza`` (True si se rechaza H0).
+    """
+    observed_freq = np.asarray(observed_freq)
+    k = len(observed_freq)
+    n = np.sum(observed_freq)
+    if n == 0:
+        raise ValueError("La suma de las frecuencias no puede ser cero.")
+
+    expected_freq_array = np.full(k, n / k)
+    chi2_statistic = np.sum((observed_freq - expected_freq_array)**2 / expected_freq_array)
+    degrees_of_freedom = k - 1
+    critical_value = valor_critico("chi2", alpha, degrees_of_freedom)
+
+    return {
+        "n": n,
+        "esperada": expected_freq_array,
+        "estadistico": chi2_statistic,
+        "grados_libertad": degrees_of_freedom,
+        "valor_critico": critical_value,
+        "rechaza": not chi2_statistic < critical_value,
+    }
+
+
+def frecuencias_de_muestras(datos, k=10, a=0.0, b=1.0, bordes=None, tam_bloque=1 << 22, progreso=None):
+    """
+    Cuenta las frecuencias observadas por intervalo directamente de las muestras.
+
+    Las muestras se recorren por bloques, así que ``datos`` puede ser un arreglo
+    mapeado en memoria o un iterable de bloques de cualquier tamaño total.
+
+    Args:
+        datos: Arreglo (o lista) de muestras, o un iterador de bloques.
+        k (int): Cantidad de intervalos iguales de [a, b] (se ignora si hay ``bordes``).
+        bordes (np.ndarray): k + 1 bordes de intervalos arbitrarios (ver ``bordes_equiprobables``).
+        progreso (Progreso): Opcional; se informa el avance después de cada bloque.
+
+    Returns:
+        np.ndarray: Las k frecuencias observadas.
+    """
+    histograma = Histograma(k, a, b, bordes)
+    if isinstance(datos, (np.ndarray, list, tuple)) or hasattr(datos, "bloques"):
+        bloques = bloques_de(datos, tam_bloque)
+        if progreso is not None:
+            bloques = _informando(bloques, cantidad_de(datos), progreso)
+    else:
+        bloques = datos
+    consumir(bloques, histograma)
+    if histograma.fuera:
+        raise ValueError(f"{histograma.fuera} muestras están fuera del rango [{histograma.a}, {histograma.b}].")
+    return histograma.conteos
+
+
+def _informando(bloques, n, progreso):
+    # Informa el avance (y permite cancelar) a medida que se consumen los bloques.
+    hechos = 0
+    for bloque in bloques:
+        yield bloque
+        hechos += len(bloque)
+        progreso.informar(hechos / n)
+
+
+def prueba_chi_cuadrado_muestras(datos, k=10, alpha=0.05, a=0.0, b=1.0, cuantil=None):
+    """
+    Prueba de uniformidad Chi-cuadrado a partir de las muestras, sin contar a mano.
+
+    Con ``cuantil`` (la inversa de la acumulada de la distribución objetivo) los
+    k intervalos se eligen de igual probabilidad, de modo que la frecuencia
+    esperada sigue siendo n / k y el estadístico es el mismo.
+
+    Returns:
+        dict: Lo mismo que ``prueba_chi_cuadrado_frecuencias`` más ``observada``.
+    """
+    bordes = bordes_equiprobables(k, cuantil) if cuantil is not None else None
+    observadas = frecuencias_de_muestras(datos, k, a, b, bordes)
+    resultado = prueba_chi_cuadrado_frecuencias(observadas, alpha)
+    resultado["observada"] = observadas
+    return resultado
+
+
+def prueba_de_medias_uniforme(numbers, alpha=0.05):
+    """
+    Prueba de medias para números U(0, 1): compara x̄ con el intervalo 0.5 ± z·√(1/12n).
+
+    Returns:
+        dict: ``n``, ``media``, ``estadistico`` (Z0), ``error_estandar``,
+        ``limite_inf``, ``limite_sup`` y ``rechaza``.
+    """
+    # La media sale de un recorrido por bloques: un archivo mapeado no se copia.
+    momentos = Momentos.de_datos(numbers)
+    n = momentos.n
+    x_bar = momentos.media
+    media_teorica = 0.5
+    varianza_teorica = 1/12
+    error_estandar = np.sqrt(varianza_teorica / n)
+
+    z0 = (x_bar - media_teorica) / error_estandar
+    z_critico = valor_critico("norm", alpha / 2)
+
+    limite_inf = media_teorica - z_critico * error_estandar
+    limite_sup = media_teorica + z_critico * error_estandar
+
+    return {
+        "n": n,
+        "media": x_bar,
+        "estadistico": z0,
+        "error_estandar": error_estandar,
+        "limite_inf": limite_inf,
+        "limite_sup": limite_sup,
+        "rechaza": not limite_inf <= x_bar <= limite_sup,
+    }
+
+
+# --- Pruebas en flujo: la secuencia se consume por bloques, sin guardarla ---
+
+def prueba_de_medias_flujo(momentos, media_hipotetica, desviacion_estandar_poblacional=None, nivel=COMPLETO):
+    """
+    Prueba de medias a partir de un estado ``Momentos``; mismo proceso que ``prueba_de_medias_proceso``.
+
+    El estado puede venir de un flujo, de ``reducir`` sobre varios archivos o de
+    un histórico al que se le agregaron datos nuevos.
+    """
+    return _proceso_medias(f"(flujo de {momentos.n} números, no se guardan)", momentos, media_hipotetica,
+                           desviacion_estandar_poblacional, nivel)
+
+
+def prueba_de_varianza_flujo(momentos, varianza_hipotetica, nivel=COMPLETO, graficar=False, fig=None):
+    """Prueba de varianza a partir de un estado ``Momentos``."""
+    return _proceso_varianza(momentos, varianza_hipotetica, nivel, graficar, fig)
+
+
+def prueba_chi_cuadrado_proceso(observed_freq, alpha=0.05, nivel=COMPLETO):
+    """
+    Prueba de uniformidad Chi-cuadrado con su proceso paso a paso.
+
+    Returns:
+        tuple: (proceso, interpretacion).
+    """
+    r = prueba_chi_cuadrado_frecuencias(observed_freq, alpha)
+    observadas = np.asarray(observed_freq)
+    esperada = r["esperada"][0]
+
+    proceso = Traza(nivel)
+    proceso.texto("--- Proceso de la Prueba Chi-cuadrado de Frecuencias ---\n")
+    proceso.texto(f"1. Datos de entrada:\n   - Tamaño de la muestra (n): {r['n']}\n   - Intervalos (k): {len(observadas)}\n")
+    proceso.texto(f"2. Frecuencia esperada por intervalo:\n   E = n / k = {esperada:.4f}\n")
+    proceso.texto("3. Contribución de cada intervalo (O - E)² / E:\n")
+    proceso.pasos(len(observadas), lambda i: f"   - Intervalo {i + 1}: ({observadas[i]} - {esperada:.4f})² / {esperada:.4f} = "
+                                             f"{(observadas[i] - esperada) ** 2 / esperada:.4f}\n")
+    proceso.texto(f"4. Estadístico:\n   χ² = Σ (O - E)² / E = {r['estadistico']:.4f}\n")
+    proceso.texto(f"5. Valor crítico (α = {alpha}, gl = {r['grados_libertad']}): {r['valor_critico']:.4f}\n\n")
+
+    proceso.resultados.update(prueba="chi2", n=r["n"], estadistico=r["estadistico"],
+                              grados_libertad=r["grados_libertad"], valor_critico=r["valor_critico"],
+                              rechaza=r["rechaza"])
+    interpretacion = f"Interpretación:\n- Si χ² ({r['estadistico']:.4f}) es mayor o igual que el valor crítico ({r['valor_critico']:.4f}), se rechaza la hipótesis nula.\n- Resultado: {'Se rechaza la hipótesis nula. Los números no siguen una distribución uniforme.' if r['rechaza'] else 'No hay evidencia suficiente para rechazar la hipótesis nula. Los números pueden considerarse uniformes.'}"
+    return proceso, interpretacion
+
+
+def pruebas_en_flujo(bloques, media_hipotetica=0.5, desviacion_estandar_poblacional=None, varianza_hipotetica=1 / 12,
+                     k=10, alpha=0.05, nivel=COMPLETO, segundo_plano=True):
+    """
+    Corre las pruebas de medias, varianza y Chi-cuadrado sobre una secuencia por bloques.
+
+    La secuencia se recorre una sola vez y nunca se guarda completa; con
+    ``segundo_plano`` los bloques se generan en otro hilo mientras se acumulan.
+
+    Args:
+        bloques: Iterable de bloques de números (p. ej. ``bloques_lcg(...)``).
+        k (int): Intervalos iguales de [0, 1) para la prueba Chi-cuadrado.
+
+    Returns:
+        dict: ``medias`` (proceso, interpretación), ``varianza`` (proceso) y
+        ``chi_cuadrado`` (proceso, interpretación).
+    """
+    if segundo_plano:
+        bloques = en_segundo_plano(bloques)
+    momentos, histograma = consumir(bloques, Momentos(), Histograma(k))
+    if momentos.n < 2:
+        raise ValueError("Se necesitan al menos dos números para las pruebas.")
+    if histograma.fuera:
+        raise ValueError(f"{histograma.fuera} números están fuera del intervalo [0, 1].")
+
+    proceso_varianza, _ = prueba_de_varianza_flujo(momentos, varianza_hipotetica, nivel)
+    return {
+        "medias": prueba_de_medias_flujo(momentos, media_hipotetica, desviacion_estandar_poblacional, nivel),
+        "varianza": proceso_varianza,
+        "chi_cuadrado": prueba_chi_cuadrado_proceso(histograma.conteos, alpha, nivel),
+    }
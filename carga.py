@@ -0,0 +1,233 @@
+import io
+import os
+from concurrent.futures import ProcessPoolExecutor
+
+import numpy as np
+
+from acumuladores import bloques_de
+from kolmogorov import abrir_muestras
+from secuencias import EXTENSION as EXTENSION_SECUENCIA, abrir_secuencia
+
+# --- Carga masiva de muestras desde archivos ---
+#
+# Los formularios y los ejercicios leían los datos de un campo de texto con
+# ``[float(x) for x in texto.split(',')]``, que con más de unos miles de valores
+# se vuelve lento. Aquí:
+#   - .npy y los binarios crudos se abren mapeados en memoria (sin copiarlos);
+#   - los CSV/TXT se convierten con los lectores en C de NumPy y, si son muy
+#     grandes, por tramos en varios procesos;
+#   - los rangos se validan con operaciones vectorizadas por bloques, sin copiar
+#     los archivos mapeados.
+
+# Extensiones de binarios crudos y su tipo de dato.
+TIPOS_CRUDOS = {
+    ".f32": np.float32,
+    ".f64": np.float64,
+    ".u32": np.uint32,
+    ".bin": np.float64,
+    ".raw": np.float64,
+}
+
+EXTENSIONES_TEXTO = (".csv", ".txt")
+
+# Formatos que se recorren mapeados en memoria, sin cargarlos enteros.
+EXTENSIONES_MAPEADAS = (".npy", EXTENSION_SECUENCIA) + tuple(TIPOS_CRUDOS)
+
+EXTENSIONES = (".npy", EXTENSION_SECUENCIA) + EXTENSIONES_TEXTO + tuple(TIPOS_CRUDOS)
+
+# A partir de este tamaño (unos 0.5 s de loadtxt) los CSV se reparten entre
+# procesos; por debajo, arrancar el pool y devolver los tramos cuesta más de lo
+# que ahorra. loadtxt lee un tramo ya cargado en memoria a la mitad de velocidad
+# que el archivo directamente, así que con menos de ``MIN_PROCESOS_CSV`` procesos
+# tampoco conviene.
+TAM_CSV_PARALELO = 64 * 1024 ** 2
+MIN_PROCESOS_CSV = 3
+
+_BLANCOS = b" \t\n\r\x0b\x0c"
+
+
+def _numeros(texto):
+    # Una sola conversión vectorizada de los campos (con las reglas de float());
+    # nada se completa con valores por defecto.
+    campos = texto.replace(b",", b" ").replace(b";", b" ").split()
+    try:
+        return np.array(campos, dtype=np.float64)
+    except ValueError:
+        raise ValueError("Los datos contienen elementos que no son números.") from None
+
+
+def parsear_texto(texto):
+    """
+    Convierte un texto con números separados por comas, espacios o saltos de línea en un arreglo.
+
+    Raises:
+        ValueError: Si el texto está vacío, si hay un campo vacío (p. ej. "0.1,,0.2")
+            o si algún elemento no es un número.
+    """
+    if isinstance(texto, str):
+        texto = texto.encode()
+    texto = texto.strip()
+    if not texto:
+        raise ValueError("No se ingresaron datos.")
+    # Sin los blancos, un campo vacío deja dos separadores juntos o uno en un extremo.
+    compacto = texto.translate(None, _BLANCOS).replace(b";", b",")
+    if compacto.startswith(b",") or compacto.endswith(b",") or b",," in compacto:
+        raise ValueError("Los datos contienen un campo vacío entre separadores (p. ej. \"0.1,,0.2\").")
+    return _numeros(texto)
+
+
+def _es_numero(campo):
+    try:
+        float(campo)
+        return True
+    except ValueError:
+        return False
+
+
+def _saltar_encabezado(contenido):
+    # Una primera línea sin ningún número (p. ej. "valor") es un encabezado, no un dato.
+    fin = contenido.find(b"\n")
+    if fin < 0:
+        return 0
+    campos = contenido[:fin].replace(b",", b" ").split()
+    return fin + 1 if campos and not any(_es_numero(c) for c in campos) else 0
+
+
+def _leer_tramo(ruta, inicio, fin):
+    with open(ruta, "rb") as archivo:
+        archivo.seek(inicio)
+        return archivo.read(fin - inicio)
+
+
+def _parsear_tramo(tarea):
+    contenido = _leer_tramo(*tarea)
+    try:
+        # Los tramos se cortan en fin de línea: un CSV regular se lee con loadtxt.
+        return np.loadtxt(io.BytesIO(contenido), delimiter=",", ndmin=1, dtype=np.float64).ravel()
+    except ValueError:
+        # Filas de distinto largo, separadas por espacios o un tramo cortado después
+        # de una coma: no se valida como texto completo.
+        return _numeros(contenido)
+
+
+def _tramos_de_lineas(ruta, inicio, tamano, partes):
+    # Cortes aproximadamente iguales, movidos hasta el siguiente fin de línea (o,
+    # en una línea muy larga, hasta la siguiente coma) para no partir números.
+    cortes = [inicio]
+    with open(ruta, "rb") as archivo:
+        for i in range(1, partes):
+            archivo.seek(max(inicio + tamano * i // partes, cortes[-1]))
+            resto = archivo.read(1 << 16)
+            salto = resto.find(b"\n")
+            if salto < 0:
+                salto = resto.find(b",")
+            if salto < 0:
+                continue
+            cortes.append(archivo.tell() - len(resto) + salto + 1)
+    cortes.append(inicio + tamano)
+    return [(ruta, a, b) for a, b in zip(cortes, cortes[1:]) if b > a]
+
+
+def leer_csv(ruta, procesos=None):
+    """
+    Lee un CSV/TXT de números (separados por comas, espacios o uno por línea).
+
+    Los archivos de más de ``TAM_CSV_PARALELO`` bytes se parten en tramos que se
+    analizan en paralelo (con al menos ``MIN_PROCESOS_CSV`` procesos). Se admite
+    una primera línea de encabezado.
+    """
+    tamano = os.path.getsize(ruta)
+    with open(ruta, "rb") as archivo:
+        inicio = _saltar_encabezado(archivo.read(4096))
+    procesos = procesos or os.cpu_count() or 1
+    if tamano < TAM_CSV_PARALELO or procesos < MIN_PROCESOS_CSV:
+        try:
+            # Con una columna (o una sola fila) el lector en C de loadtxt es el más
+            # rápido; los números son ASCII, así que latin1 evita decodificar UTF-8.
+            return np.loadtxt(ruta, delimiter=",", skiprows=1 if inicio else 0, ndmin=1, dtype=np.float64,
+                              encoding="latin1").ravel()
+        except ValueError:
+            # Filas de distinto largo o separadas por espacios.
+            return _numeros(_leer_tramo(ruta, inicio, tamano))
+    tareas = _tramos_de_lineas(ruta, inicio, tamano - inicio, procesos)
+    with ProcessPoolExecutor(max_workers=procesos) as pool:
+        return np.concatenate(list(pool.map(_parsear_tramo, tareas)))
+
+
+def cargar_muestras(ruta, dtype=None, procesos=None):
+    """
+    Carga un archivo de muestras según su extensión.
+
+    Args:
+        ruta (str): Archivo .npy, secuencia .seq, .csv/.txt o binario crudo
+            (.f32, .f64, .u32, .bin/.raw = float64).
+        dtype: Tipo de los valores de un binario crudo (reemplaza al de la extensión).
+        procesos (int): Procesos para analizar CSV grandes.
+
+    Returns:
+        np.ndarray o secuencias.Secuencia: Arreglo unidimensional, mapeado en
+        memoria (solo lectura) para .npy y binarios crudos; de una .seq, la
+        ``Secuencia`` mapeada, que normaliza los U_i por tramos. Ninguno de los
+        formatos mapeados se copia entero: ``acumuladores.bloques_de`` los recorre por bloques.
+    """
+    extension = os.path.splitext(str(ruta))[1].lower()
+    if extension == ".npy":
+        return abrir_muestras(ruta).ravel()
+    if extension == EXTENSION_SECUENCIA:
+        return abrir_secuencia(ruta)
+    if extension in EXTENSIONES_TEXTO:
+        return leer_csv(ruta, procesos)
+    if extension in TIPOS_CRUDOS or dtype is not None:
+        return abrir_muestras(ruta, dtype or TIPOS_CRUDOS[extension])
+    raise ValueError(f"Formato de archivo no soportado: '{extension}'. Se aceptan {', '.join(EXTENSIONES)}.")
+
+
+def validar_rango(datos, minimo=0.0, maximo=1.0, nombre="Los datos"):
+    """
+    Verifica con operaciones vectorizadas por bloques que todos los valores estén en [minimo, maximo].
+
+    Los arreglos mapeados y las secuencias .seq se recorren sin copiarlos y se
+    devuelven tal cual; cualquier otra entrada se devuelve como arreglo.
+
+    Raises:
+        ValueError: Indicando cuántos valores quedan afuera y el primero de ellos.
+    """
+    if not hasattr(datos, "bloques"):
+        datos = np.asarray(datos)
+    cantidad, primero, inicio = 0, None, 0
+    for bloque in bloques_de(datos):
+        fuera = ~((bloque >= minimo) & (bloque <= maximo))
+        afuera = int(np.count_nonzero(fuera))
+        if afuera and primero is None:
+            i = int(np.argmax(fuera))
+            primero = (inicio + i, bloque[i])
+        cantidad += afuera
+        inicio += len(bloque)
+    if cantidad:
+        raise ValueError(f"{nombre} deben estar en el intervalo [{minimo}, {maximo}]: {cantidad} valores quedan "
+                         f"afuera (el primero es {primero[1]} en la posición {primero[0] + 1}).")
+    return datos
+
+
+def archivo_mapeable(texto_o_ruta):
+    """
+    Devuelve la ruta si la entrada es un archivo existente que se puede recorrer
+    mapeado en memoria (.npy, .seq o binario crudo, ver ``EXTENSIONES_MAPEADAS``); si no, None.
+    """
+    candidato = texto_o_ruta.strip()
+    if candidato.lower().endswith(EXTENSIONES_MAPEADAS) and os.path.isfile(candidato):
+        return candidato
+    return None
+
+
+def tipo_crudo(ruta):
+    """Tipo de los valores de un archivo según su extensión (float64 si no es un binario crudo conocido)."""
+    return TIPOS_CRUDOS.get(os.path.splitext(str(ruta))[1].lower(), np.float64)
+
+
+def leer_datos(texto_o_ruta):
+    """Interpreta la entrada de un formulario: la ruta de un archivo existente o los números escritos."""
+    candidato = texto_o_ruta.strip()
+    if candidato and os.path.isfile(candidato):
+        return cargar_muestras(candidato)
+    return parsear_texto(texto_o_ruta)
@@ -0,0 +1,238 @@
+import numpy as np
+
+from tareas import informar
+
+# --- Generador congruencial lineal con aritmética de 64 bits ---
+#
+# X_{i+1} = (a·X_i + c) mod m: mixto si c != 0, multiplicativo si c = 0. Todos
+# los estados son uint64 y cada producto a·X mod m se calcula sin desbordar:
+#   - m potencia de dos (2^k, hasta 2^64): el producto módulo 2^64 se enmascara.
+#   - b·(m - 1) < 2^64 (p. ej. m <= 2^32): producto directo y resto.
+#   - m mod b < m div b: método de Schrage, m = b·q + r, con
+#     b·X mod m = b·(X mod q) - r·(X div q) (+ m si queda negativo).
+#   - en otro caso (m <= 2^63): el multiplicador se recorre por dígitos de w
+#     bits, w = 64 - bits(m), como en Horner: r = (r·2^w + X·dígito) mod m,
+#     donde cada término cabe en 64 bits.
+# Un bloque de B estados sale de las tablas A_k = a^k y C_k = c·(a^(k-1) + ... + 1)
+# (mod m): X_{i+k} = A_k·X_i + C_k, igual que las potencias de multiplicador_constante.
+
+TAM_BLOQUE = 1 << 16
+
+_DOS_64 = 1 << 64
+
+# nombre -> (a, c, m, descripción)
+GENERADORES_CONOCIDOS = {
+    "minstd": (16807, 0, 2 ** 31 - 1, "Park y Miller (1988), estándar mínimo: multiplicativo con m primo."),
+    "minstd2": (48271, 0, 2 ** 31 - 1, "Park, Miller y Stockmeyer (1993): el multiplicador revisado de MINSTD."),
+    "randu": (65539, 0, 2 ** 31, "RANDU de IBM: solo para demostrar un mal generador (tríos en 15 planos)."),
+    "numerical_recipes": (1664525, 1013904223, 2 ** 32, "Numerical Recipes: mixto con m = 2^32."),
+    "java": (25214903917, 11, 2 ** 48, "java.util.Random: mixto con m = 2^48."),
+    "mmix": (6364136223846793005, 1442695040888963407, 2 ** 64, "MMIX de Knuth: mixto con m = 2^64."),
+}
+
+
+def es_potencia_de_dos(m):
+    return m > 0 and m & (m - 1) == 0
+
+
+def modulo_soportado(m):
+    """True si los estados módulo m se pueden operar en uint64: m <= 2^63 o m = 2^k <= 2^64."""
+    return 0 < m <= 1 << 63 or (es_potencia_de_dos(m) and m <= _DOS_64)
+
+
+def _validar_modulo(m):
+    if m <= 0:
+        raise ValueError("El módulo (m) debe ser un entero positivo.")
+    if not modulo_soportado(m):
+        raise ValueError(f"El módulo {m} no se puede operar con 64 bits: use m <= 2^63 o una potencia de dos "
+                         f"hasta 2^64.")
+
+
+def multiplicar_mod(x, b, m, out=None):
+    """
+    Calcula (x · b) mod m elemento a elemento sin desbordar 64 bits.
+
+    Args:
+        x (np.ndarray): Estados uint64 menores que m.
+        b (int): Multiplicador (cualquier entero de Python; se reduce módulo m).
+        m (int): Módulo soportado (ver ``modulo_soportado``).
+        out (np.ndarray): Arreglo uint64 donde escribir el resultado (puede ser ``x``).
+
+    Returns:
+        np.ndarray: El resultado (``out`` si se pasó).
+    """
+    b = int(b) % m
+    x = np.asarray(x, dtype=np.uint64)
+    if out is None:
+        out = np.empty_like(x)
+    if es_potencia_de_dos(m):
+        # El producto uint64 ya es módulo 2^64; el de 2^k son sus k bits bajos.
+        np.multiply(x, np.uint64(b), out=out)
+        if m < _DOS_64:
+            np.bitwise_and(out, np.uint64(m - 1), out=out)
+        return out
+    if b * (m - 1) < _DOS_64:
+        np.multiply(x, np.uint64(b), out=out)
+        np.remainder(out, np.uint64(m), out=out)
+        return out
+
+    q, r = divmod(m, b)
+    if r < q:
+        # Schrage: ambos términos son menores que m.
+        alto = x // np.uint64(q)
+        bajo = (x - alto * np.uint64(q)) * np.uint64(b)
+        alto *= np.uint64(r)
+        out[...] = np.where(bajo >= alto, bajo - alto, bajo + (np.uint64(m) - alto))
+        return out
+
+    ancho = 64 - m.bit_length()
+    digitos = []
+    while b:
+        digitos.append(b & ((1 << ancho) - 1))
+        b >>= ancho
+    modulo = np.uint64(m)
+    resultado = np.zeros_like(x)
+    for digito in reversed(digitos):
+        # resultado < m y x < m <= 2^(64 - ancho): los desplazamientos y productos caben en 64 bits.
+        np.left_shift(resultado, np.uint64(ancho), out=resultado)
+        np.remainder(resultado, modulo, out=resultado)
+        if digito:
+            resultado += (x * np.uint64(digito)) % modulo
+            np.subtract(resultado, modulo, out=resultado, where=resultado >= modulo)
+    out[...] = resultado
+    return out
+
+
+def sumar_mod(x, y, m, out=None):
+    """Calcula (x + y) mod m elemento a elemento para x, y uint64 menores que m."""
+    out = np.add(x, y, out=out)
+    if es_potencia_de_dos(m):
+        if m < _DOS_64:
+            np.bitwise_and(out, np.uint64(m - 1), out=out)
+        return out
+    # x + y < 2m <= 2^64: no desborda, y basta con restar m una vez.
+    np.subtract(out, np.uint64(m), out=out, where=out >= np.uint64(m))
+    return out
+
+
+class GeneradorCongruencial:
+    """
+    Generador congruencial lineal X_{i+1} = (a·X_i + c) mod m, vectorizado por bloques.
+
+    Args:
+        a (int): Multiplicador.
+        m (int): Módulo: hasta 2^63, o una potencia de dos hasta 2^64.
+        c (int): Incremento (0 = multiplicativo).
+
+    Raises:
+        ValueError: Si m no se puede operar con 64 bits.
+    """
+
+    def __init__(self, a, m, c=0):
+        _validar_modulo(m)
+        self.a = a % m
+        self.m = m
+        self.c = c % m
+        self._tablas = None
+
+    @classmethod
+    def conocido(cls, nombre):
+        """Generador de ``GENERADORES_CONOCIDOS`` ("minstd", "randu", "mmix", ...)."""
+        try:
+            a, c, m, _ = GENERADORES_CONOCIDOS[nombre.lower()]
+        except KeyError:
+            raise ValueError(f"Generador desconocido: '{nombre}'. Se conocen: "
+                             f"{', '.join(GENERADORES_CONOCIDOS)}.") from None
+        return cls(a, m, c)
+
+    def __repr__(self):
+        return f"GeneradorCongruencial(a={self.a}, m={self.m}, c={self.c})"
+
+    def coeficientes(self, k):
+        """(A_k, C_k) tales que X_{i+k} = (A_k·X_i + C_k) mod m, por duplicación en O(log k)."""
+        A, C = 1, 0
+        a, c = self.a, self.c
+        while k:
+            if k & 1:
+                A, C = (a * A) % self.m, (a * C + c) % self.m
+            a, c = (a * a) % self.m, (a * c + c) % self.m
+            k >>= 1
+        return A, C
+
+    def saltar(self, x, k):
+        """El estado X_{i+k} a partir de X_i = x, sin generar los intermedios."""
+        A, C = self.coeficientes(k)
+        return (A * x + C) % self.m
+
+    def tablas(self, cantidad):
+        """
+        Arreglos uint64 [A_1 .. A_cantidad] y [C_1 .. C_cantidad] por duplicación.
+
+        Con la mitad ya calculada, A_{k+j} = A_j·A_k y C_{k+j} = A_j·C_k + C_j.
+        """
+        if self._tablas is not None and len(self._tablas[0]) >= cantidad:
+            return self._tablas[0][:cantidad], self._tablas[1][:cantidad]
+        potencias = np.empty(cantidad, dtype=np.uint64)
+        sumas = np.empty(cantidad, dtype=np.uint64)
+        if cantidad:
+            potencias[0], sumas[0] = self.a, self.c
+        k = 1
+        while k < cantidad:
+            paso = min(k, cantidad - k)
+            A_k, C_k = self.coeficientes(k)
+            multiplicar_mod(potencias[:paso], A_k, self.m, out=potencias[k:k + paso])
+            multiplicar_mod(potencias[:paso], C_k, self.m, out=sumas[k:k + paso])
+            sumar_mod(sumas[k:k + paso], sumas[:paso], self.m, out=sumas[k:k + paso])
+            k += paso
+        self._tablas = (potencias, sumas)
+        return potencias, sumas
+
+    def llenar(self, salida, semilla, tam_bloque=TAM_BLOQUE, progreso=None):
+        """
+        Escribe en ``salida`` (uint64) los estados X_1 .. X_len(salida) que siguen a ``semilla``.
+
+        Returns:
+            int: El último estado escrito (o la semilla si ``salida`` está vacía).
+        """
+        x = semilla % self.m
+        n = len(salida)
+        if n == 0:
+            return x
+        potencias, sumas = self.tablas(min(tam_bloque, n))
+        for inicio in range(0, n, len(potencias)):
+            fin = min(inicio + len(potencias), n)
+            bloque = salida[inicio:fin]
+            multiplicar_mod(potencias[:fin - inicio], x, self.m, out=bloque)
+            if self.c:
+                sumar_mod(bloque, sumas[:fin - inicio], self.m, out=bloque)
+            x = int(bloque[-1])
+            informar(progreso, fin / n)
+        return x
+
+    def estados(self, semilla, n, tam_bloque=TAM_BLOQUE, progreso=None):
+        """Los estados X_1 .. X_n (uint64)."""
+        estados = np.empty(n, dtype=np.uint64)
+        self.llenar(estados, semilla, tam_bloque, progreso)
+        return estados
+
+    def bloques_estados(self, semilla, n, tam_bloque=TAM_BLOQUE):
+        """
+        Yields:
+            np.ndarray: Bloques de a lo sumo ``tam_bloque`` estados uint64, continuando cada uno del anterior.
+        """
+        x = semilla
+        for inicio in range(0, n, tam_bloque):
+            bloque = np.empty(min(tam_bloque, n - inicio), dtype=np.uint64)
+            x = self.llenar(bloque, x, tam_bloque)
+            yield bloque
+
+    def normalizar(self, estados):
+        """U_i = X_i / m (float64), siempre en [0, 1) (ver ``multiplicador_constante.normalizar_estados``)."""
+        # Import diferido: multiplicador_constante importa este módulo.
+        from multiplicador_constante import normalizar_estados
+
+        return normalizar_estados(estados, self.m)
+
+    def numeros(self, semilla, n, tam_bloque=TAM_BLOQUE, progreso=None):
+        """Los números U_1 .. U_n en [0, 1)."""
+        return self.normalizar(self.estados(semilla, n, tam_bloque, progreso))
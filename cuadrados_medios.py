@@ -0,0 +1,332 @@
+import numpy as np
+
+from tareas import informar
+
+# --- Índice precalculado del Algoritmo de Cuadrados Medios ---
+#
+# Para un ancho de d dígitos el espacio de estados tiene solo 10^d elementos,
+# así que la función "siguiente estado" se puede tabular completa. El grafo
+# resultante (cada estado apunta a su sucesor) está formado por colas que
+# desembocan en ciclos; una vez indexado, la secuencia de cualquier semilla y su
+# punto de degeneración se obtienen sin repetir el cuadrado y el corte de dígitos.
+
+DIGITOS_TABULABLES = (2, 4, 6, 8)
+
+_TRAMO = 1 << 22
+
+TAM_BLOQUE = 1 << 16
+
+# Ancho máximo cuyo cuadrado (menor que 10^(2d)) cabe en un uint64 (< 1.8·10^19).
+MAX_DIGITOS_UINT64 = 8
+
+
+def siguiente_estado(x, num_of_digits):
+    """
+    Calcula el siguiente estado del método de cuadrados medios con aritmética entera.
+
+    Equivale a ``int(str(x ** 2).zfill(2 * d)[d // 2: d // 2 + d])``.
+    Acepta tanto un entero como un arreglo de NumPy de estados.
+    """
+    return (x * x // 10 ** (num_of_digits // 2)) % 10 ** num_of_digits
+
+
+def arreglo_de_estados(semillas, num_of_digits):
+    """
+    Convierte semillas al arreglo sobre el que se itera: uint64 hasta ``MAX_DIGITOS_UINT64``
+    dígitos, enteros de Python (dtype object) para anchos mayores.
+    """
+    if num_of_digits % 2 != 0:
+        raise ValueError("El número de dígitos debe ser par.")
+    try:
+        if num_of_digits <= MAX_DIGITOS_UINT64:
+            estados = np.array(semillas, dtype=np.uint64, ndmin=1)
+        else:
+            estados = np.array([int(s) for s in np.ravel(semillas)], dtype=object)
+        if estados.size and not (0 <= estados.min() and estados.max() < 10 ** num_of_digits):
+            raise OverflowError
+    except OverflowError:
+        raise ValueError(f"Las semillas deben tener a lo sumo {num_of_digits} dígitos.") from None
+    return estados
+
+
+def avanzar_semillas(semillas, n, num_of_digits):
+    """
+    Genera a la vez las secuencias de muchas semillas, avanzándolas al mismo paso.
+
+    Args:
+        semillas (array_like): Semillas X₀ (enteras, de a lo sumo ``num_of_digits`` dígitos).
+        n (int): Estados a generar por semilla.
+        num_of_digits (int): Ancho par de las semillas.
+
+    Returns:
+        np.ndarray: Matriz (semillas × n) con los estados X_1 .. X_n de cada semilla.
+    """
+    x = arreglo_de_estados(semillas, num_of_digits)
+    estados = np.empty((len(x), n), dtype=x.dtype)
+    for i in range(n):
+        x = siguiente_estado(x, num_of_digits)
+        estados[:, i] = x
+    return estados
+
+
+def barrido_degeneracion(num_of_digits, semillas=None):
+    """
+    Describe cómo degenera la secuencia de cada semilla.
+
+    Hasta 6 dígitos (o si el índice ya está en caché) las respuestas se leen del
+    índice precalculado: todas las semillas de 4 o 6 dígitos se estudian en
+    milisegundos. Para anchos mayores las semillas se avanzan todas a la vez con
+    ``_barrido_floyd``, sin tabular los 10^d estados.
+
+    Args:
+        num_of_digits (int): Ancho par de las semillas.
+        semillas (array_like): Semillas a estudiar; por defecto, todas las de ese ancho.
+
+    Returns:
+        dict: Arreglos alineados con las semillas: ``semillas``, ``pasos`` (hasta
+        entrar al ciclo), ``entrada`` (primer estado repetido), ``longitud_ciclo``
+        y ``cae_en_cero``.
+    """
+    if semillas is None:
+        semillas = np.arange(10 ** num_of_digits, dtype=np.uint64)
+    x0 = arreglo_de_estados(semillas, num_of_digits)
+    if num_of_digits in DIGITOS_TABULABLES and (num_of_digits <= 6 or num_of_digits in _indices):
+        indice = indice_cuadrados_medios(num_of_digits)
+        entrada = indice.entrada[x0]
+        return {
+            "semillas": x0,
+            "pasos": indice.cola[x0].astype(np.int64),
+            "entrada": entrada,
+            "longitud_ciclo": indice.longitudes_ciclo[indice.ciclo[x0]],
+            "cae_en_cero": entrada == 0,
+        }
+    return _barrido_floyd(x0, num_of_digits)
+
+
+def _barrido_floyd(x0, num_of_digits):
+    # Algoritmo de Floyd (tortuga y liebre) sobre arreglos: en cada paso solo se
+    # siguen las semillas que todavía no terminaron.
+    siguiente = lambda x: siguiente_estado(x, num_of_digits)
+
+    # 1. La tortuga avanza de a uno y la liebre de a dos hasta encontrarse dentro del ciclo.
+    encuentro = np.empty_like(x0)
+    activos = np.arange(len(x0))
+    tortuga, liebre = siguiente(x0), siguiente(siguiente(x0))
+    while activos.size:
+        listos = tortuga == liebre
+        encuentro[activos[listos]] = liebre[listos]
+        activos, tortuga, liebre = activos[~listos], tortuga[~listos], liebre[~listos]
+        tortuga, liebre = siguiente(tortuga), siguiente(siguiente(liebre))
+
+    # 2. Desde la semilla y desde el encuentro, a la par: se cruzan en la entrada del ciclo.
+    pasos = np.zeros(len(x0), dtype=np.int64)
+    entrada = np.empty_like(x0)
+    activos = np.arange(len(x0))
+    tortuga, liebre = x0, encuentro
+    while activos.size:
+        listos = tortuga == liebre
+        entrada[activos[listos]] = tortuga[listos]
+        activos, tortuga, liebre = activos[~listos], tortuga[~listos], liebre[~listos]
+        pasos[activos] += 1
+        tortuga, liebre = siguiente(tortuga), siguiente(liebre)
+
+    # 3. Vuelta completa al ciclo desde su entrada.
+    longitud = np.ones(len(x0), dtype=np.int64)
+    activos = np.arange(len(x0))
+    x = siguiente(entrada)
+    while activos.size:
+        pendientes = x != entrada[activos]
+        activos, x = activos[pendientes], x[pendientes]
+        longitud[activos] += 1
+        x = siguiente(x)
+
+    return {
+        "semillas": x0,
+        "pasos": pasos,
+        "entrada": entrada,
+        "longitud_ciclo": longitud,
+        "cae_en_cero": entrada == 0,
+    }
+
+
+class IndiceCuadradosMedios:
+    """
+    Grafo funcional completo del método de cuadrados medios para un ancho de dígitos.
+
+    Atributos:
+        digitos (int): Ancho de la semilla (número par de dígitos).
+        sucesor (np.ndarray): sucesor[x] es el estado que sigue a x.
+        cola (np.ndarray): Pasos que da x hasta entrar en su ciclo (0 si x ya está en uno).
+        entrada (np.ndarray): Primer estado del ciclo alcanzado desde x.
+        ciclo (np.ndarray): Índice (en ``ciclos``) del ciclo al que desemboca x.
+        ciclos (list): Para cada ciclo, el arreglo de sus estados en orden de recorrido.
+    """
+
+    def __init__(self, num_of_digits):
+        if num_of_digits % 2 != 0 or num_of_digits not in DIGITOS_TABULABLES:
+            raise ValueError(f"El número de dígitos debe ser uno de {DIGITOS_TABULABLES}.")
+        self.digitos = num_of_digits
+        n_estados = 10 ** num_of_digits
+
+        # El sucesor se calcula por tramos para no tener 10^8 cuadrados uint64 en memoria a la vez.
+        self.sucesor = np.empty(n_estados, dtype=np.uint32)
+        for inicio in range(0, n_estados, _TRAMO):
+            estados = np.arange(inicio, min(inicio + _TRAMO, n_estados), dtype=np.uint64)
+            self.sucesor[inicio:inicio + len(estados)] = siguiente_estado(estados, num_of_digits)
+
+        # 1. Quitar por capas los estados sin predecesores: lo que queda son los ciclos.
+        grado = np.bincount(self.sucesor, minlength=n_estados).astype(np.int32)
+        capas = []
+        frontera = np.flatnonzero(grado == 0).astype(np.uint32)
+        while frontera.size:
+            capas.append(frontera)
+            destinos, repeticiones = np.unique(self.sucesor[frontera], return_counts=True)
+            grado[destinos] -= repeticiones.astype(np.int32)
+            frontera = destinos[grado[destinos] == 0]
+
+        # 2. Recorrer cada ciclo una sola vez.
+        en_ciclo = grado > 0
+        self.ciclo = np.full(n_estados, -1, dtype=np.int32)
+        self.entrada = np.zeros(n_estados, dtype=np.uint32)
+        self.cola = np.zeros(n_estados, dtype=np.uint32)
+        self.ciclos = []
+        for inicio in np.flatnonzero(en_ciclo):
+            if self.ciclo[inicio] >= 0:
+                continue
+            nodos = [int(inicio)]
+            x = int(self.sucesor[inicio])
+            while x != inicio:
+                nodos.append(x)
+                x = int(self.sucesor[x])
+            nodos = np.array(nodos, dtype=np.uint32)
+            self.ciclo[nodos] = len(self.ciclos)
+            self.entrada[nodos] = nodos
+            self.ciclos.append(nodos)
+
+        # 3. Propagar cola, entrada y ciclo en orden inverso a las capas: el sucesor
+        #    de cada capa siempre está en una capa posterior o en un ciclo.
+        for frontera in reversed(capas):
+            destinos = self.sucesor[frontera]
+            self.cola[frontera] = self.cola[destinos] + 1
+            self.entrada[frontera] = self.entrada[destinos]
+            self.ciclo[frontera] = self.ciclo[destinos]
+
+        self.longitudes_ciclo = np.array([len(c) for c in self.ciclos], dtype=np.int64)
+
+    def _validar_semilla(self, semilla):
+        if not 0 <= semilla < 10 ** self.digitos:
+            raise ValueError(f"La semilla debe tener a lo sumo {self.digitos} dígitos.")
+
+    def longitud_ciclo(self, semilla):
+        """Longitud del ciclo en el que termina la secuencia de la semilla."""
+        return int(self.longitudes_ciclo[self.ciclo[semilla]])
+
+    def degeneracion(self, semilla):
+        """
+        Describe en O(1) cómo degenera la secuencia de una semilla.
+
+        Returns:
+            dict: ``pasos`` hasta entrar al ciclo, ``entrada`` (primer estado
+            repetido), ``longitud_ciclo`` y ``cae_en_cero`` (True si el ciclo es el 0 fijo).
+        """
+        self._validar_semilla(semilla)
+        entrada = int(self.entrada[semilla])
+        return {
+            "pasos": int(self.cola[semilla]),
+            "entrada": entrada,
+            "longitud_ciclo": self.longitud_ciclo(semilla),
+            "cae_en_cero": entrada == 0,
+        }
+
+    def secuencia(self, semilla, n):
+        """
+        Devuelve los estados X_1 .. X_n generados a partir de la semilla X₀.
+
+        Solo la cola (a lo sumo ``cola[semilla]`` pasos) se recorre estado por
+        estado; el resto de la secuencia es una lectura indexada del ciclo.
+        """
+        self._validar_semilla(semilla)
+        resultado = np.empty(n, dtype=np.uint32)
+        x = semilla
+        i = 0
+        while i < n and self.cola[x] > 0:
+            x = int(self.sucesor[x])
+            resultado[i] = x
+            i += 1
+        if i < n:
+            # x ya es cíclico: lo que sigue es recorrer su ciclo desde el sucesor.
+            nodos = self.ciclos[self.ciclo[x]]
+            inicio = int(np.flatnonzero(nodos == x)[0]) + 1
+            resultado[i:] = nodos[(inicio + np.arange(n - i)) % len(nodos)]
+        return resultado
+
+
+_indices = {}
+
+
+def indice_cuadrados_medios(num_of_digits):
+    """
+    Devuelve (y guarda en caché) el índice del método de cuadrados medios para un ancho.
+
+    El índice de 8 dígitos ocupa del orden de 1.6 GB (casi el doble durante la
+    construcción) y tarda unos 20 segundos en construirse; los de 2 a 6 dígitos
+    se construyen en milisegundos.
+    """
+    if num_of_digits not in _indices:
+        _indices[num_of_digits] = IndiceCuadradosMedios(num_of_digits)
+    return _indices[num_of_digits]
+
+
+def secuencia_cuadrados_medios(seed, n, num_of_digits, progreso=None):
+    """
+    Genera los estados X_1 .. X_n del método de cuadrados medios.
+
+    Usa el índice precalculado cuando ya está en caché o es barato de construir
+    (hasta 6 dígitos); en otro caso itera con aritmética entera.
+
+    Returns:
+        np.ndarray: Los n estados enteros (sin normalizar).
+    """
+    if num_of_digits % 2 != 0:
+        raise ValueError("El número de dígitos debe ser par.")
+    if not 0 <= seed < 10 ** num_of_digits:
+        raise ValueError(f"La semilla debe tener a lo sumo {num_of_digits} dígitos.")
+    if num_of_digits in DIGITOS_TABULABLES and (num_of_digits <= 6 or num_of_digits in _indices):
+        return indice_cuadrados_medios(num_of_digits).secuencia(seed, n)
+
+    estados = np.empty(n, dtype=object)
+    x = seed
+    for i in range(n):
+        x = siguiente_estado(x, num_of_digits)
+        estados[i] = x
+        if i % TAM_BLOQUE == 0:
+            informar(progreso, i / n)
+    return estados
+
+
+def bloques_estados_cuadrados_medios(seed, n, num_of_digits, tam_bloque=TAM_BLOQUE):
+    """
+    Recorre los estados X_1 .. X_n del método de cuadrados medios por bloques.
+
+    Cada bloque continúa desde el último estado del anterior, así que nunca se
+    guarda la secuencia completa.
+
+    Yields:
+        np.ndarray: Bloques de a lo sumo ``tam_bloque`` estados enteros.
+    """
+    x = seed
+    for inicio in range(0, n, tam_bloque):
+        estados = secuencia_cuadrados_medios(x, min(tam_bloque, n - inicio), num_of_digits)
+        x = int(estados[-1])
+        yield estados
+
+
+def bloques_cuadrados_medios(seed, n, num_of_digits, tam_bloque=TAM_BLOQUE):
+    """
+    Recorre los números U_i = X_i / 10^d del método de cuadrados medios por bloques.
+
+    Yields:
+        np.ndarray: Bloques float64 de a lo sumo ``tam_bloque`` números en [0, 1).
+    """
+    for estados in bloques_estados_cuadrados_medios(seed, n, num_of_digits, tam_bloque):
+        yield estados.astype(np.float64) / 10 ** num_of_digits
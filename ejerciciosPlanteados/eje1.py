@@ -1,6 +1,13 @@
+import os
+import sys
+
 import numpy as np
 import matplotlib.pyplot as plt
-from scipy.stats import chi2
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+from calculos import frecuencias_de_muestras
+from carga import cargar_muestras, validar_rango
+from valores_criticos import valor_critico
 
 # --- Entrada de datos interactiva ---
 print("--- Ingresa los datos para la prueba de uniformidad ---")
@@ -15,9 +22,13 @@ except ValueError as e:
     exit()
 
 # Pedir al usuario las frecuencias observadas
-print(f"Ingresa las {k} frecuencias observadas, separadas por espacios:")
+print(f"Ingresa las {k} frecuencias observadas, separadas por espacios")
+print("(o la ruta de un archivo .csv/.txt/.npy/.seq/.f32/.f64 con las muestras en [0, 1], para contarlas automáticamente):")
 try:
     observed_freq_str = input().split()
+    if len(observed_freq_str) == 1 and os.path.isfile(observed_freq_str[0]):
+        # Modo de muestras crudas: los k intervalos iguales de [0, 1] se cuentan por bloques.
+        observed_freq_str = frecuencias_de_muestras(validar_rango(cargar_muestras(observed_freq_str[0])), k)
     if len(observed_freq_str) != k:
         raise ValueError("El número de frecuencias ingresadas no coincide con el número de intervalos.")
     
@@ -51,7 +62,7 @@ alpha = 0.05
 degrees_of_freedom = k - 1
 
 # Valor crítico de Chi-Cuadrado
-critical_value = chi2.ppf(1 - alpha, degrees_of_freedom)
+critical_value = valor_critico("chi2", alpha, degrees_of_freedom)
 
 # --- Conclusión ---
 print("\n--- Resultados de la Prueba de Uniformidad ---")
@@ -82,8 +93,10 @@ ax.bar(x + bar_width/2, expected_freq_array, bar_width, label='Frecuencia Espera
 ax.set_title('Comparación de Frecuencias: Prueba de Uniformidad', fontsize=16, fontweight='bold')
 ax.set_xlabel('Intervalo', fontsize=12)
 ax.set_ylabel('Frecuencia', fontsize=12)
-ax.set_xticks(x)
-ax.set_xticklabels([f'Int. {i+1}' for i in range(k)], rotation=45, ha='right')
+# Con cientos o miles de intervalos las etiquetas individuales no se leen.
+if k <= 50:
+    ax.set_xticks(x)
+    ax.set_xticklabels([f'Int. {i+1}' for i in range(k)], rotation=45, ha='right')
 ax.legend()
 plt.tight_layout()
 plt.show()
\ No newline at end of file
@@ -1,6 +1,13 @@
+import os
+import sys
+
 import numpy as np
 import matplotlib.pyplot as plt
-from scipy.stats import chi2
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+from calculos import frecuencias_de_muestras
+from carga import cargar_muestras, validar_rango
+from valores_criticos import valor_critico
 
 # --- Entrada de datos interactiva ---
 print("--- PRUEBA DE UNIFORMIDAD CHI-CUADRADO ---")
@@ -10,8 +17,12 @@ try:
     if num_intervals <= 1:
         raise ValueError("El número de intervalos debe ser mayor que 1.")
     
-    print(f"Ingresa las {num_intervals} frecuencias observadas, separadas por espacios:")
+    print(f"Ingresa las {num_intervals} frecuencias observadas, separadas por espacios")
+    print("(o la ruta de un archivo .csv/.txt/.npy/.seq/.f32/.f64 con las muestras en [0, 1], para contarlas automáticamente):")
     observed_freq_str = input().split()
+    if len(observed_freq_str) == 1 and os.path.isfile(observed_freq_str[0]):
+        # Modo de muestras crudas: los intervalos iguales de [0, 1] se cuentan por bloques.
+        observed_freq_str = frecuencias_de_muestras(validar_rango(cargar_muestras(observed_freq_str[0])), num_intervals)
     if len(observed_freq_str) != num_intervals:
         raise ValueError("El número de frecuencias no coincide con el número de intervalos.")
     
@@ -43,7 +54,7 @@ if degrees_of_freedom <= 0:
     print("Error: No hay suficientes grados de libertad para realizar la prueba.")
     exit()
 
-critical_value = chi2.ppf(1 - alpha, degrees_of_freedom)
+critical_value = valor_critico("chi2", alpha, degrees_of_freedom)
 
 # --- Resultados y Conclusión ---
 print("\n--- Resultados de la Prueba ---")
@@ -74,8 +85,10 @@ ax.bar(x + bar_width/2, expected_freq_array, bar_width, label='Frecuencia Espera
 ax.set_title('Comparación de Frecuencias: Prueba de Uniformidad', fontsize=16, fontweight='bold')
 ax.set_xlabel('Intervalo', fontsize=12)
 ax.set_ylabel('Frecuencia', fontsize=12)
-ax.set_xticks(x)
-ax.set_xticklabels([f'Int. {i+1}' for i in range(num_intervals)])
+# Con cientos o miles de intervalos las etiquetas individuales no se leen.
+if num_intervals <= 50:
+    ax.set_xticks(x)
+    ax.set_xticklabels([f'Int. {i+1}' for i in range(num_intervals)])
 ax.legend()
 plt.tight_layout()
 plt.show()
\ No newline at end of file
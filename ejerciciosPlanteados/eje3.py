@@ -1,26 +1,37 @@
+import os
+import sys
+
 import numpy as np
 import matplotlib.pyplot as plt
 from scipy.stats import norm
 
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+from acumuladores import Momentos
+from carga import leer_datos, validar_rango
+from valores_criticos import valor_critico
+
 # --- 1. Entrada de datos ---
 print("--- PRUEBA DE MEDIAS PARA NÚMEROS PSEUDOALEATORIOS ---")
 
 try:
-    numeros_str = input("Ingresa los números pseudoaleatorios, separados por espacios: ")
-    numeros = np.array([float(n) for n in numeros_str.split()])
-    if np.any((numeros < 0) | (numeros > 1)):
-        raise ValueError("Los números deben estar en el intervalo [0, 1].")
+    numeros_str = input("Ingresa los números pseudoaleatorios, separados por espacios "
+                        "(o la ruta de un archivo .csv/.txt/.npy/.seq/.f32/.f64): ")
+    numeros = validar_rango(leer_datos(numeros_str), 0, 1, "Los números")
+    if len(numeros) == 0:
+        raise ValueError("No se ingresaron números.")
 except ValueError as e:
     print(f"Error: {e}. Por favor, reinicia el programa e ingresa números válidos.")
     exit()
 
 # --- 2. Cálculos para la prueba ---
-n = len(numeros)
+# Un archivo mapeado (.npy, .seq, binario crudo) se recorre por bloques, sin copiarlo.
+momentos = Momentos.de_datos(numeros)
+n = momentos.n
 if n < 30:
     print("Advertencia: La prueba Z asume una muestra grande (n >= 30).")
 
 # Media de la muestra (x_barra)
-x_barra = np.mean(numeros)
+x_barra = momentos.media
 
 # Media teórica para una distribución uniforme U(0,1)
 media_teorica = 0.5
@@ -40,7 +51,7 @@ z0 = (x_barra - media_teorica) / error_estandar
 
 # --- 3. Límites de confianza (a 95%) ---
 alpha = 0.05
-z_alpha_medios = norm.ppf(1 - alpha / 2) # Valor Z para 95% de confianza (1.96)
+z_alpha_medios = valor_critico("norm", alpha / 2) # Valor Z para 95% de confianza (1.96)
 
 limite_inferior = media_teorica - z_alpha_medios * error_estandar
 limite_superior = media_teorica + z_alpha_medios * error_estandar
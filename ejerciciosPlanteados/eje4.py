@@ -1,6 +1,13 @@
+import os
+import sys
+
 import matplotlib.pyplot as plt
 import numpy as np
 
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+from cuadrados_medios import secuencia_cuadrados_medios
+from secuencias import guardar_cuadrados_medios
+
 def middle_square_method(seed, n, num_of_digits):
     """
     Genera una secuencia de números pseudoaleatorios usando el método de los cuadrados medios.
@@ -15,28 +22,14 @@ def middle_square_method(seed, n, num_of_digits):
     """
     if num_of_digits % 2 != 0:
         raise ValueError("El número de dígitos debe ser par.")
-    
-    x = seed
-    random_numbers = []
-    
-    for _ in range(n):
-        # 1. Elevar al cuadrado
-        x_squared = x ** 2
-        
-        # 2. Convertir a string para extraer los dígitos del centro
-        x_squared_str = str(x_squared).zfill(2 * num_of_digits)
-        
-        # 3. Calcular los índices para el centro
-        start_index = num_of_digits // 2
-        end_index = start_index + num_of_digits
-        
-        # 4. Extraer los dígitos del centro y convertirlos a entero
-        x = int(x_squared_str[start_index:end_index])
-        
-        # 5. Normalizar el número para que esté en el rango [0, 1]
-        random_number = x / (10**num_of_digits - 1)
-        random_numbers.append(random_number)
-        
+
+    # Los estados salen del índice precalculado (o de aritmética entera), sin
+    # pasar por str(x**2).zfill(...) en cada iteración.
+    estados = secuencia_cuadrados_medios(seed, n, num_of_digits)
+
+    # Normalizar los números para que estén en el rango [0, 1]
+    random_numbers = list(estados.astype(np.float64) / (10**num_of_digits - 1))
+
     return random_numbers
 
 # --- Entrada de datos interactiva ---
@@ -61,6 +54,13 @@ print("\n--- Números pseudoaleatorios generados ---")
 for i, num in enumerate(generated_numbers):
     print(f"r{i+1}: {num:.4f}")
 
+# --- Guardar la secuencia (opcional) ---
+# El archivo .seq guarda los estados enteros: se vuelve a probar sin regenerarla.
+ruta_secuencia = input("\nRuta para guardar la secuencia (.seq), o Enter para omitir: ").strip()
+if ruta_secuencia:
+    cabecera = guardar_cuadrados_medios(ruta_secuencia, seed_input, num_to_generate, num_of_digits)
+    print(f"{cabecera['cantidad']} estados guardados en {ruta_secuencia}.")
+
 # --- Gráfico de los números generados ---
 plt.style.use('seaborn-v0_8-whitegrid')
 fig, ax = plt.subplots(figsize=(10, 6))
@@ -0,0 +1,171 @@
+import os
+from concurrent.futures import ProcessPoolExecutor
+
+import numpy as np
+
+from busqueda_lcg import carmichael
+from cuadrados_medios import arreglo_de_estados, secuencia_cuadrados_medios, siguiente_estado
+from multiplicador_constante import dtype_para, escalar, normalizar_estados, potencias_modulares, producto_mod
+
+# --- Varios flujos independientes como una matriz (flujos × n) ---
+#
+# Cada fila es la secuencia de una semilla. Con una sola semilla y una cantidad
+# de flujos, el flujo j es el bloque j de la secuencia (estados X_{jn+1} .. X_{(j+1)n}),
+# así que los flujos no se solapan: su semilla se obtiene saltando j·n pasos
+# (X_{jn} = (a^n)^j · X₀ mod m) sin generar los estados intermedios.
+#
+# Las columnas se llenan por tramos: en el multiplicador constante cada tramo
+# es el producto de la columna de estados actuales por la fila de potencias
+# a^1 .. a^B; en cuadrados medios todas las semillas avanzan al mismo paso.
+
+# Hasta este módulo el producto exterior estado · potencia cabe en uint64; con
+# módulos mayores cada fila se multiplica con ``producto_mod``.
+_M_MAX_PRODUCTO_EXTERIOR = 1 << 32
+
+# Elementos (flujos × columnas) por tramo: unos 8 MB de uint64.
+TAM_TRAMO = 1 << 20
+
+
+def _columnas_por_tramo(n_flujos, n):
+    return max(1, min(n, TAM_TRAMO // max(n_flujos, 1)))
+
+
+def semillas_de_flujos(semilla, a, m, n_flujos, n):
+    """
+    Semillas de ``n_flujos`` bloques consecutivos de longitud n de una misma secuencia.
+
+    Returns:
+        np.ndarray: [X₀, X_n, X_{2n}, ...] (mod m).
+
+    Raises:
+        ValueError: Si los bloques necesitan más de λ(m) estados (función de
+            Carmichael, el mayor período posible con c = 0): se solaparían.
+    """
+    periodo = carmichael(m)
+    if n_flujos * n > periodo:
+        raise ValueError(f"{n_flujos} flujos de {n} números necesitan más estados que el período máximo "
+                         f"(λ(m) = {periodo}); se solaparían.")
+    dtype = dtype_para(m)
+    semillas = np.empty(n_flujos, dtype=dtype)
+    semillas[0] = semilla % m
+    # (a^n)^1 .. (a^n)^(k-1) por duplicación, multiplicadas por X₀.
+    saltos = potencias_modulares(pow(a, n, m), m, n_flujos - 1)
+    producto_mod(saltos, semilla % m, m, out=semillas[1:])
+    return semillas
+
+
+def _llenar_lcg(tarea):
+    semillas, a, m, n, normalizar = tarea
+    dtype = dtype_para(m)
+    estados = np.asarray(semillas, dtype=dtype).copy()
+    salida = np.empty((len(estados), n), dtype=np.float64 if normalizar else dtype)
+    if n == 0:
+        return salida
+    potencias = potencias_modulares(a, m, _columnas_por_tramo(len(estados), n))
+    exterior = dtype is object or m <= _M_MAX_PRODUCTO_EXTERIOR
+    # Solo el producto exterior usa el módulo como escalar: np.uint64(2^64) no existe.
+    modulo = escalar(dtype, m) if exterior else None
+    for inicio in range(0, n, len(potencias)):
+        fin = min(inicio + len(potencias), n)
+        if exterior:
+            tramo = (estados[:, None] * potencias[None, :fin - inicio]) % modulo
+        else:
+            tramo = np.empty((len(estados), fin - inicio), dtype=dtype)
+            for fila, estado in zip(tramo, estados):
+                producto_mod(potencias[:fin - inicio], estado, m, out=fila)
+        estados = tramo[:, -1].copy()
+        salida[:, inicio:fin] = normalizar_estados(tramo.ravel(), m).reshape(tramo.shape) if normalizar else tramo
+    return salida
+
+
+def _en_paralelo(funcion, tareas, procesos):
+    if procesos == 1 or len(tareas) == 1:
+        return np.vstack([funcion(t) for t in tareas])
+    with ProcessPoolExecutor(max_workers=procesos) as pool:
+        return np.vstack(list(pool.map(funcion, tareas)))
+
+
+def _repartir(semillas, procesos):
+    # Filas contiguas por proceso; el resultado no depende de cómo se reparten.
+    partes = max(1, min(len(semillas), procesos or os.cpu_count() or 1))
+    return [fila for fila in np.array_split(semillas, partes) if len(fila)]
+
+
+def flujos_lcg(a, m, n, semillas=None, semilla=None, n_flujos=None, normalizar=True, procesos=1):
+    """
+    Genera varios flujos del generador multiplicador constante a la vez.
+
+    Args:
+        a (int): Multiplicador.
+        m (int): Módulo.
+        n (int): Números por flujo.
+        semillas (array_like): Semilla de cada flujo.
+        semilla (int): Alternativa a ``semillas``: una sola semilla repartida en
+            ``n_flujos`` bloques consecutivos que no se solapan.
+        n_flujos (int): Cantidad de flujos cuando se usa ``semilla``.
+        normalizar (bool): Si es True devuelve U = X / m (float64); si no, los estados enteros.
+        procesos (int): Procesos entre los que se reparten los flujos (1 = sin pool,
+            None = uno por núcleo). El resultado no depende de este valor.
+
+    Returns:
+        np.ndarray: Matriz (flujos × n); la fila j es la secuencia X_1 .. X_n de la semilla j.
+    """
+    if m <= 0:
+        raise ValueError("El módulo (m) debe ser un entero positivo.")
+    if (semillas is None) == (semilla is None):
+        raise ValueError("Indique las semillas de los flujos o una semilla y la cantidad de flujos.")
+    if semilla is not None:
+        if not n_flujos or n_flujos <= 0:
+            raise ValueError("La cantidad de flujos debe ser positiva.")
+        semillas = semillas_de_flujos(semilla, a, m, n_flujos, n)
+    else:
+        semillas = np.array([int(s) % m for s in np.ravel(semillas)], dtype=dtype_para(m))
+    tareas = [(parte, a, m, n, normalizar) for parte in _repartir(semillas, procesos)]
+    if not tareas:
+        return np.empty((0, n), dtype=np.float64 if normalizar else dtype_para(m))
+    return _en_paralelo(_llenar_lcg, tareas, procesos)
+
+
+def _llenar_cuadrados_medios(tarea):
+    semillas, n, num_of_digits, normalizar = tarea
+    x = arreglo_de_estados(semillas, num_of_digits)
+    salida = np.empty((len(x), n), dtype=np.float64 if normalizar else x.dtype)
+    escala = 10 ** num_of_digits
+    for i in range(n):
+        x = siguiente_estado(x, num_of_digits)
+        salida[:, i] = x.astype(np.float64) / escala if normalizar else x
+    return salida
+
+
+def flujos_cuadrados_medios(n, num_of_digits, semillas=None, semilla=None, n_flujos=None, normalizar=True,
+                            procesos=1):
+    """
+    Genera varios flujos del método de cuadrados medios a la vez.
+
+    Con ``semillas`` todas avanzan al mismo paso (``avanzar_semillas``); con una
+    ``semilla`` y ``n_flujos``, el flujo j es el bloque j de su secuencia.
+
+    Args:
+        n (int): Números por flujo.
+        num_of_digits (int): Ancho par de las semillas.
+        normalizar (bool): Si es True devuelve U = X / 10^d (float64); si no, los estados enteros.
+        procesos (int): Procesos entre los que se reparten los flujos (1 = sin pool,
+            None = uno por núcleo).
+
+    Returns:
+        np.ndarray: Matriz (flujos × n).
+    """
+    if (semillas is None) == (semilla is None):
+        raise ValueError("Indique las semillas de los flujos o una semilla y la cantidad de flujos.")
+    if semilla is not None:
+        if not n_flujos or n_flujos <= 0:
+            raise ValueError("La cantidad de flujos debe ser positiva.")
+        estados = secuencia_cuadrados_medios(semilla, n_flujos * n, num_of_digits).reshape(n_flujos, n)
+        if not normalizar:
+            return estados
+        return estados.astype(np.float64) / 10 ** num_of_digits
+    semillas = arreglo_de_estados(semillas, num_of_digits)
+    tareas = [(parte, n, num_of_digits, normalizar) for parte in _repartir(semillas, procesos)]
+    if not tareas:
+        return np.empty((0, n), dtype=np.float64 if normalizar else semillas.dtype)
+    return _en_paralelo(_llenar_cuadrados_medios, tareas, procesos)
@@ -0,0 +1,137 @@
+import io
+
+import numpy as np
+
+# --- Gráficos con costo de dibujo acotado ---
+#
+# Dibujar un punto (o una barra) por dato hace que el tiempo de redibujo crezca
+# con n y deja a la interfaz trabada con 10^6 valores. Aquí las series grandes se
+# diezman o se rasterizan como una imagen de densidad, y los histogramas se
+# dibujan a partir de frecuencias ya contadas, así que el número de artistas no
+# depende del tamaño de la muestra.
+#
+# Las figuras se crean con ``matplotlib.figure.Figure`` y no con pyplot: pyplot
+# guarda una referencia a cada figura hasta que se la cierra, y las interfaces
+# nunca las cerraban.
+
+MAX_PUNTOS = 5000
+
+# Celdas (ancho, alto) de la imagen de densidad de las series grandes.
+RESOLUCION_DENSIDAD = (400, 200)
+
+
+def preparar_figura(fig=None, figsize=(6, 4)):
+    """
+    Devuelve (fig, ax) listos para dibujar.
+
+    Si se pasa una figura existente (por ejemplo la de un lienzo de Tk) se limpia
+    y se reutiliza; si no, se crea una ``Figure`` que no queda registrada en pyplot.
+    """
+    if fig is None:
+        from matplotlib.figure import Figure
+
+        fig = Figure(figsize=figsize)
+    else:
+        fig.clear()
+    return fig, fig.add_subplot()
+
+
+def dibujar_frecuencias(ax, conteos, bordes, **estilo):
+    """Dibuja un histograma a partir de frecuencias ya contadas (una barra por intervalo)."""
+    bordes = np.asarray(bordes, dtype=np.float64)
+    if len(conteos) > MAX_PUNTOS // 10:
+        # Con miles de intervalos, un solo escalón en lugar de miles de barras.
+        return ax.stairs(conteos, bordes, fill=True, alpha=estilo.get("alpha", 0.7))
+    return ax.bar(bordes[:-1], conteos, width=np.diff(bordes), align="edge", **estilo)
+
+
+def dibujar_histograma(ax, valores, bins=10, rango=None, **estilo):
+    """Cuenta los valores con ``np.histogram`` y dibuja solo las k barras."""
+    conteos, bordes = np.histogram(valores, bins=bins, range=rango)
+    return dibujar_frecuencias(ax, conteos, bordes, **estilo)
+
+
+def indices_diezmados(n, max_puntos=MAX_PUNTOS):
+    """Hasta ``max_puntos`` índices equiespaciados de [0, n), incluidos el primero y el último."""
+    if n <= max_puntos:
+        return np.arange(n)
+    return np.unique(np.linspace(0, n - 1, max_puntos).astype(np.intp))
+
+
+def dibujar_serie(ax, y, max_puntos=MAX_PUNTOS, rango_y=None, **estilo):
+    """
+    Dibuja los valores y_i contra su índice i.
+
+    Hasta ``max_puntos`` valores se dibujan como puntos; con más, como una imagen
+    de densidad (cuántos valores caen en cada celda), cuyo costo de dibujo es fijo.
+    """
+    y = np.asarray(y)
+    n = len(y)
+    if n <= max_puntos:
+        return ax.scatter(np.arange(n), y, **estilo)
+
+    rango_y = rango_y or (float(np.min(y)), float(np.max(y)))
+    if rango_y[0] == rango_y[1]:
+        rango_y = (rango_y[0] - 0.5, rango_y[1] + 0.5)
+    ancho, alto = RESOLUCION_DENSIDAD
+    # El índice de cada valor determina su columna; no hace falta construir el arreglo de x.
+    columnas = np.arange(n) * ancho // n
+    filas = np.clip(((y - rango_y[0]) / (rango_y[1] - rango_y[0]) * alto).astype(np.intp), 0, alto - 1)
+    densidad = np.bincount(filas * ancho + columnas, minlength=ancho * alto).reshape(alto, ancho)
+    densidad = np.ma.masked_equal(densidad, 0)
+    return ax.imshow(densidad, origin="lower", aspect="auto", interpolation="nearest", cmap="viridis",
+                     extent=(0, n, rango_y[0], rango_y[1]))
+
+
+def puntos_cdf_empirica(ordenados, max_puntos=MAX_PUNTOS):
+    """
+    Puntos (valores, F) de la CDF empírica de una muestra ya ordenada.
+
+    Con más de ``max_puntos`` valores se toman solo puntos equiespaciados de la
+    curva más los dos puntos donde se alcanzan D+ y D-, para que la máxima
+    distancia a la uniforme siga viéndose.
+    """
+    n = len(ordenados)
+    cdf = np.arange(1, n + 1) / n
+    if n <= max_puntos:
+        return ordenados, cdf
+    extremos = [np.argmax(cdf - ordenados), np.argmax(ordenados - np.arange(n) / n)]
+    indices = np.union1d(indices_diezmados(n, max_puntos), extremos)
+    return ordenados[indices], cdf[indices]
+
+
+def dibujar_cdf_empirica(ax, ordenados, max_puntos=MAX_PUNTOS, **estilo):
+    """Dibuja la CDF empírica de una muestra ya ordenada (ver ``puntos_cdf_empirica``)."""
+    if len(ordenados) <= max_puntos:
+        estilo = dict(estilo, marker="o")
+    return ax.plot(*puntos_cdf_empirica(ordenados, max_puntos), **estilo)
+
+
+def png_de_lienzo(canvas):
+    """PNG de lo último que dibujó un lienzo Agg, sin volver a dibujar la figura."""
+    from matplotlib.image import imsave
+
+    salida = io.BytesIO()
+    imsave(salida, np.asarray(canvas.buffer_rgba()), format="png")
+    return salida.getvalue()
+
+
+def mostrar_png(png, fig=None):
+    """
+    Muestra una imagen PNG (p. ej. un gráfico guardado en caché) ocupando toda la figura.
+
+    Returns:
+        Figure: La figura (la misma si se pasó una).
+    """
+    from matplotlib.image import imread
+
+    if fig is None:
+        from matplotlib.figure import Figure
+
+        fig = Figure()
+    else:
+        fig.clear()
+    ax = fig.add_axes((0, 0, 1, 1))
+    ax.imshow(imread(io.BytesIO(png), format="png"), aspect="auto")
+    ax.set_axis_off()
+    return fig
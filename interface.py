@@ -1,9 +1,17 @@
 import tkinter as tk
-from tkinter import ttk, messagebox
+from tkinter import ttk, messagebox, filedialog
 import numpy as np
-import matplotlib.pyplot as plt
 from matplotlib.backends.backend_tkagg import FigureCanvasTkAgg
-from scipy.stats import chi2, norm
+from matplotlib.figure import Figure
+
+from cache_resultados import CACHE, clave_de
+from calculos import frecuencias_de_muestras, prueba_chi_cuadrado_frecuencias, prueba_de_medias_uniforme
+from cuadrados_medios import secuencia_cuadrados_medios
+from graficos import dibujar_frecuencias, dibujar_serie, mostrar_png, png_de_lienzo
+from medicion import MEDICION, etapa
+from secuencias import EXTENSION as EXTENSION_SECUENCIA, guardar_cuadrados_medios
+from carga import EXTENSIONES, cargar_muestras, leer_datos, validar_rango
+from tareas import Cancelada, ejecutar_en_segundo_plano
 
 class EstadisticaApp:
     def __init__(self, root):
@@ -11,6 +19,8 @@ class EstadisticaApp:
         self.root.title("Calculadora Estadística")
         self.root.geometry("1200x800")
         
+        self.create_status_bar()
+
         # Contenedor principal para centrar el contenido
         self.main_frame = ttk.Frame(self.root, padding="10")
         self.main_frame.pack(expand=True, fill="both")
@@ -23,9 +33,44 @@ class EstadisticaApp:
         self.right_frame.pack(side="right", fill="both", expand=True)
 
         self.create_menu()
-        
+        self.tarea = None
+
+        # Una sola figura y un solo lienzo para toda la aplicación; cada gráfico
+        # limpia los ejes y redibuja sobre ellos.
+        self.fig = Figure(figsize=(6, 6), dpi=100)
+        self.ax = self.fig.add_subplot()
+        self.canvas = FigureCanvasTkAgg(self.fig, master=self.right_frame)
+        self.canvas.get_tk_widget().pack(fill=tk.BOTH, expand=True)
+
         self.clear_interface()
 
+    def create_status_bar(self):
+        # Barra de estado con la medición opcional de las etapas de cada cálculo.
+        barra = ttk.Frame(self.root, relief="sunken", padding=(5, 2))
+        barra.pack(side="bottom", fill="x")
+        self.medir_var = tk.BooleanVar(value=MEDICION.activa)
+        ttk.Checkbutton(barra, text="Medir tiempos", variable=self.medir_var,
+                        command=self.toggle_timing).pack(side="left")
+        ttk.Button(barra, text="Exportar tiempos...", command=self.export_timings).pack(side="right")
+        self.timing_var = tk.StringVar()
+        ttk.Label(barra, textvariable=self.timing_var).pack(side="left", padx=10)
+
+    def toggle_timing(self):
+        MEDICION.activa = self.medir_var.get()
+        if not MEDICION.activa:
+            self.timing_var.set("")
+
+    def export_timings(self):
+        if not MEDICION.tramos:
+            messagebox.showinfo("Exportar tiempos", "Todavía no hay tiempos medidos. Activa \"Medir tiempos\" y "
+                                                    "realiza un cálculo.")
+            return
+        ruta = filedialog.asksaveasfilename(
+            title="Exportar tiempos", defaultextension=".json",
+            filetypes=[("Traza de Chrome (chrome://tracing)", "*.trace.json"), ("JSON", "*.json")])
+        if ruta:
+            MEDICION.exportar(ruta)
+
     def create_menu(self):
         menu_bar = tk.Menu(self.root)
         self.root.config(menu=menu_bar)
@@ -39,14 +84,15 @@ class EstadisticaApp:
         file_menu.add_command(label="Salir", command=self.root.quit)
 
     def clear_interface(self):
+        # Un cálculo de la vista anterior se cancela y su resultado ya no se muestra.
+        if self.tarea is not None:
+            self.tarea.cancelar()
+            self.tarea = None
         for widget in self.left_frame.winfo_children():
             widget.destroy()
-        
-        self.fig, self.ax = plt.subplots(figsize=(6, 6), dpi=100)
-        self.canvas = FigureCanvasTkAgg(self.fig, master=self.right_frame)
-        self.canvas.draw()
-        self.canvas.get_tk_widget().pack(fill=tk.BOTH, expand=True)
-        plt.close(self.fig)
+
+        self.reset_axes()
+        self.canvas.draw_idle()
 
     def show_uniformity_test(self):
         self.clear_interface()
@@ -61,55 +107,171 @@ class EstadisticaApp:
         self.entry_freqs = ttk.Entry(self.left_frame, width=50)
         self.entry_freqs.pack()
 
+        ttk.Label(self.left_frame, text="O un archivo de muestras en [0, 1] (.csv, .npy, .seq, .f32, .f64):").pack(pady=5)
+        self.entry_samples_file = ttk.Entry(self.left_frame, width=50)
+        self.entry_samples_file.pack()
+        ttk.Button(self.left_frame, text="Buscar...", command=self.browse_samples_file).pack(pady=2)
+
         ttk.Button(self.left_frame, text="Calcular", command=self.run_uniformity_test).pack(pady=10)
         
+        self.add_progress_controls()
+
         self.results_text = tk.Text(self.left_frame, height=15, width=60)
         self.results_text.pack(pady=10)
 
-    def run_uniformity_test(self):
-        try:
-            k = int(self.entry_intervals.get())
-            observed_freq_str = self.entry_freqs.get().split()
-            observed_freq = np.array([int(f) for f in observed_freq_str])
-            
-            if len(observed_freq) != k:
-                raise ValueError("El número de frecuencias no coincide con el número de intervalos.")
-            
-            n = np.sum(observed_freq)
-            if n == 0:
-                raise ValueError("La suma de las frecuencias no puede ser cero.")
-
-            expected_freq = n / k
-            expected_freq_array = np.full(k, expected_freq)
-            
-            chi2_statistic = np.sum((observed_freq - expected_freq_array)**2 / expected_freq_array)
-            
-            alpha = 0.05
-            degrees_of_freedom = k - 1
-            critical_value = chi2.ppf(1 - alpha, degrees_of_freedom)
-
-            self.results_text.delete(1.0, tk.END)
-            self.results_text.insert(tk.END, f"Resultados de la Prueba:\n")
-            self.results_text.insert(tk.END, f"N: {n}\n")
-            self.results_text.insert(tk.END, f"Chi-Cuadrado Calculado: {chi2_statistic:.4f}\n")
-            self.results_text.insert(tk.END, f"Valor Crítico: {critical_value:.4f}\n")
-            
-            if chi2_statistic < critical_value:
-                self.results_text.insert(tk.END, "Conclusión: Se acepta H0. La muestra es uniforme.\n")
+    def add_progress_controls(self):
+        progress_frame = ttk.Frame(self.left_frame)
+        progress_frame.pack(pady=5)
+        self.progress_bar = ttk.Progressbar(progress_frame, length=250, maximum=1.0)
+        self.progress_bar.pack(side="left", padx=5)
+        self.cancel_button = ttk.Button(progress_frame, text="Cancelar", state="disabled",
+                                        command=lambda: self.tarea and self.tarea.cancelar())
+        self.cancel_button.pack(side="left")
+
+    def run_in_background(self, calcular, mostrar, titulo="", clave=None):
+        """
+        Corre ``calcular(progreso)`` en otro hilo y luego ``mostrar(resultado)`` en el de Tk.
+
+        Con una ``clave`` de caché, un resultado ya guardado se muestra enseguida
+        (``mostrar(resultado, png)``, sin recalcular ni redibujar) y uno nuevo se
+        guarda junto con la imagen del gráfico cuando el lienzo lo termina de dibujar.
+        """
+        if self.tarea is not None:
+            return
+        MEDICION.nuevo_calculo(titulo)
+        if clave is not None:
+            with etapa("caché"):
+                guardado = CACHE.obtener(clave)
+                if guardado is not None:
+                    mostrar(guardado["resultado"], guardado["png"])
+            if guardado is not None:
+                if MEDICION.activa:
+                    self.timing_var.set(MEDICION.resumen())
+                return
+
+        def al_avanzar(progreso):
+            if tarea is self.tarea:
+                self.progress_bar["value"] = progreso.fraccion
+
+        def al_terminar(resultado):
+            if tarea is self.tarea:
+                self.end_background()
+                if clave is not None:
+                    self.save_after_draw(clave, resultado)
+                with etapa("resultados"):
+                    mostrar(resultado)
+                if MEDICION.activa:
+                    self.timing_var.set(MEDICION.resumen())
+
+        def al_fallar(error):
+            if tarea is not self.tarea:
+                return
+            self.end_background()
+            if isinstance(error, Cancelada):
+                self.results_text.delete(1.0, tk.END)
+                self.results_text.insert(tk.END, "Cálculo cancelado.\n")
+            elif isinstance(error, (ValueError, OSError)):
+                messagebox.showerror("Error", str(error))
             else:
-                self.results_text.insert(tk.END, "Conclusión: Se rechaza H0. La muestra no es uniforme.\n")
+                messagebox.showerror("Error", f"{type(error).__name__}: {error}")
+
+        self.cancel_button.config(state="normal")
+        self.progress_bar["value"] = 0
+        tarea = self.tarea = ejecutar_en_segundo_plano(self.root, calcular, al_terminar, al_fallar, al_avanzar)
+
+    def save_after_draw(self, clave, resultado):
+        # El PNG sale de lo que el lienzo ya dibujó: guardar no cuesta otro dibujo.
+        def guardar(evento):
+            self.canvas.mpl_disconnect(conexion)
+            CACHE.guardar(clave, {"resultado": resultado, "png": png_de_lienzo(self.canvas)})
+
+        conexion = self.canvas.mpl_connect("draw_event", guardar)
+
+    def reset_axes(self):
+        # Después de mostrar una imagen de la caché la figura no tiene los ejes de siempre.
+        if self.ax is None:
+            self.fig.clear()
+            self.ax = self.fig.add_subplot()
+        else:
+            self.ax.clear()
+
+    def show_png(self, png):
+        mostrar_png(png, self.fig)
+        self.ax = None
+        self.update_canvas()
+
+    def end_background(self):
+        self.tarea = None
+        self.cancel_button.config(state="disabled")
+        self.progress_bar["value"] = 0
+
+    def browse_samples_file(self, entry=None):
+        entry = entry or self.entry_samples_file
+        ruta = filedialog.askopenfilename(filetypes=[("Muestras", " ".join("*" + e for e in EXTENSIONES)),
+                                                     ("Todos", "*.*")])
+        if ruta:
+            entry.delete(0, tk.END)
+            entry.insert(0, ruta)
+
+    def run_uniformity_test(self):
+        k_str = self.entry_intervals.get()
+        samples_file = self.entry_samples_file.get().strip()
+        freqs_str = self.entry_freqs.get()
 
+        def calcular(progreso):
+            with etapa("lectura de datos"):
+                k = int(k_str)
+                muestras = cargar_muestras(samples_file) if samples_file else None
+            with etapa("cálculo"):
+                if muestras is not None:
+                    # Muestras crudas: se cuentan por bloques en k intervalos iguales de [0, 1].
+                    observed_freq = frecuencias_de_muestras(muestras, k, progreso=progreso)
+                else:
+                    observed_freq = np.array([int(f) for f in freqs_str.split()])
+
+                if len(observed_freq) != k:
+                    raise ValueError("El número de frecuencias no coincide con el número de intervalos.")
+                return observed_freq, prueba_chi_cuadrado_frecuencias(observed_freq)
+
+        clave = clave_de(k_str, samples_file, freqs_str, prueba="uniformidad", alpha=0.05)
+        self.run_in_background(calcular, self.show_uniformity_results, "Prueba de Uniformidad", clave)
+
+    def show_uniformity_results(self, calculo, png=None):
+        observed_freq, resultado = calculo
+        n = resultado["n"]
+        expected_freq_array = resultado["esperada"]
+        chi2_statistic = resultado["estadistico"]
+        critical_value = resultado["valor_critico"]
+
+        self.results_text.delete(1.0, tk.END)
+        self.results_text.insert(tk.END, f"Resultados de la Prueba:\n")
+        self.results_text.insert(tk.END, f"N: {n}\n")
+        self.results_text.insert(tk.END, f"Chi-Cuadrado Calculado: {chi2_statistic:.4f}\n")
+        self.results_text.insert(tk.END, f"Valor Crítico: {critical_value:.4f}\n")
+
+        if chi2_statistic < critical_value:
+            self.results_text.insert(tk.END, "Conclusión: Se acepta H0. La muestra es uniforme.\n")
+        else:
+            self.results_text.insert(tk.END, "Conclusión: Se rechaza H0. La muestra no es uniforme.\n")
+
+        if png is not None:
+            self.show_png(png)
+        else:
             self.plot_uniformity_test(observed_freq, expected_freq_array)
-        except ValueError as e:
-            messagebox.showerror("Error", str(e))
 
     def plot_uniformity_test(self, observed, expected):
-        self.fig, self.ax = plt.subplots(figsize=(6, 6), dpi=100)
-        x = np.arange(len(observed))
-        self.ax.bar(x - 0.2, observed, 0.4, label='Observada')
-        self.ax.bar(x + 0.2, expected, 0.4, label='Esperada')
-        self.ax.set_title('Prueba de Uniformidad')
-        self.ax.legend()
+        with etapa("figura"):
+            self.reset_axes()
+            x = np.arange(len(observed))
+            if len(observed) <= 50:
+                self.ax.bar(x - 0.2, observed, 0.4, label='Observada')
+                self.ax.bar(x + 0.2, expected, 0.4, label='Esperada')
+            else:
+                # Con miles de intervalos, un escalón por serie en lugar de miles de barras.
+                dibujar_frecuencias(self.ax, observed, np.arange(len(observed) + 1), label='Observada')
+                self.ax.stairs(expected, np.arange(len(expected) + 1), label='Esperada')
+            self.ax.set_title('Prueba de Uniformidad')
+            self.ax.legend()
         self.update_canvas()
 
     def show_media_test(self):
@@ -117,59 +279,68 @@ class EstadisticaApp:
         
         ttk.Label(self.left_frame, text="Prueba de Medias", font=("Helvetica", 16, "bold")).pack(pady=10)
         
-        ttk.Label(self.left_frame, text="Números pseudoaleatorios (separados por espacios):").pack(pady=5)
+        ttk.Label(self.left_frame, text="Números pseudoaleatorios (separados por espacios) o un archivo:").pack(pady=5)
         self.entry_numbers = ttk.Entry(self.left_frame, width=50)
         self.entry_numbers.pack()
+        ttk.Button(self.left_frame, text="Buscar...",
+                   command=lambda: self.browse_samples_file(self.entry_numbers)).pack(pady=2)
         
         ttk.Button(self.left_frame, text="Calcular", command=self.run_media_test).pack(pady=10)
         
+        self.add_progress_controls()
+
         self.results_text = tk.Text(self.left_frame, height=15, width=60)
         self.results_text.pack(pady=10)
 
     def run_media_test(self):
-        try:
-            numbers_str = self.entry_numbers.get().split()
-            numbers = np.array([float(n) for n in numbers_str])
-            
-            n = len(numbers)
-            x_bar = np.mean(numbers)
-            media_teorica = 0.5
-            varianza_teorica = 1/12
-            error_estandar = np.sqrt(varianza_teorica / n)
-            
-            z0 = (x_bar - media_teorica) / error_estandar
-            
-            alpha = 0.05
-            z_critico = norm.ppf(1 - alpha / 2)
-            
-            limite_inf = media_teorica - z_critico * error_estandar
-            limite_sup = media_teorica + z_critico * error_estandar
-
-            self.results_text.delete(1.0, tk.END)
-            self.results_text.insert(tk.END, f"Resultados de la Prueba de Medias:\n")
-            self.results_text.insert(tk.END, f"Media de la muestra: {x_bar:.4f}\n")
-            self.results_text.insert(tk.END, f"Estadístico Z0: {z0:.4f}\n")
-            self.results_text.insert(tk.END, f"Intervalo de Confianza 95%: [{limite_inf:.4f}, {limite_sup:.4f}]\n")
-            
-            if limite_inf <= x_bar <= limite_sup:
-                self.results_text.insert(tk.END, "Conclusión: La media de la muestra se encuentra dentro del intervalo de confianza. Se acepta H0.\n")
-            else:
-                self.results_text.insert(tk.END, "Conclusión: La media de la muestra está fuera del intervalo de confianza. Se rechaza H0.\n")
-            
+        numbers_str = self.entry_numbers.get()
+
+        def calcular(progreso):
+            with etapa("lectura de datos"):
+                numbers = validar_rango(leer_datos(numbers_str), 0, 1, "Los números")
+            with etapa("cálculo"):
+                return prueba_de_medias_uniforme(numbers)
+
+        clave = clave_de(numbers_str, prueba="medias", alpha=0.05)
+        self.run_in_background(calcular, self.show_media_results, "Prueba de Medias", clave)
+
+    def show_media_results(self, resultado, png=None):
+        x_bar = resultado["media"]
+        media_teorica = 0.5
+        error_estandar = resultado["error_estandar"]
+        z0 = resultado["estadistico"]
+        limite_inf = resultado["limite_inf"]
+        limite_sup = resultado["limite_sup"]
+
+        self.results_text.delete(1.0, tk.END)
+        self.results_text.insert(tk.END, f"Resultados de la Prueba de Medias:\n")
+        self.results_text.insert(tk.END, f"Media de la muestra: {x_bar:.4f}\n")
+        self.results_text.insert(tk.END, f"Estadístico Z0: {z0:.4f}\n")
+        self.results_text.insert(tk.END, f"Intervalo de Confianza 95%: [{limite_inf:.4f}, {limite_sup:.4f}]\n")
+
+        if limite_inf <= x_bar <= limite_sup:
+            self.results_text.insert(tk.END, "Conclusión: La media de la muestra se encuentra dentro del intervalo de confianza. Se acepta H0.\n")
+        else:
+            self.results_text.insert(tk.END, "Conclusión: La media de la muestra está fuera del intervalo de confianza. Se rechaza H0.\n")
+
+        if png is not None:
+            self.show_png(png)
+        else:
             self.plot_media_test(x_bar, media_teorica, error_estandar, limite_inf, limite_sup)
-        except ValueError as e:
-            messagebox.showerror("Error", str(e))
 
     def plot_media_test(self, x_bar, media_teorica, error_estandar, limite_inf, limite_sup):
-        self.fig, self.ax = plt.subplots(figsize=(6, 6), dpi=100)
-        x_vals = np.linspace(media_teorica - 4 * error_estandar, media_teorica + 4 * error_estandar, 1000)
-        pdf = norm.pdf(x_vals, media_teorica, error_estandar)
-        self.ax.plot(x_vals, pdf)
-        self.ax.fill_between(x_vals, pdf, where=(x_vals >= limite_inf) & (x_vals <= limite_sup), color='skyblue', alpha=0.5)
-        self.ax.axvline(x_bar, color='green', linestyle='-', label=f'Media Muestral: {x_bar:.4f}')
-        self.ax.axvline(media_teorica, color='red', linestyle='--', label='Media Teórica (0.5)')
-        self.ax.set_title('Prueba de Medias')
-        self.ax.legend()
+        from scipy.stats import norm
+
+        with etapa("figura"):
+            self.reset_axes()
+            x_vals = np.linspace(media_teorica - 4 * error_estandar, media_teorica + 4 * error_estandar, 1000)
+            pdf = norm.pdf(x_vals, media_teorica, error_estandar)
+            self.ax.plot(x_vals, pdf)
+            self.ax.fill_between(x_vals, pdf, where=(x_vals >= limite_inf) & (x_vals <= limite_sup), color='skyblue', alpha=0.5)
+            self.ax.axvline(x_bar, color='green', linestyle='-', label=f'Media Muestral: {x_bar:.4f}')
+            self.ax.axvline(media_teorica, color='red', linestyle='--', label='Media Teórica (0.5)')
+            self.ax.set_title('Prueba de Medias')
+            self.ax.legend()
         self.update_canvas()
 
     def show_middle_square_method(self):
@@ -186,58 +357,90 @@ class EstadisticaApp:
         self.entry_count.pack()
         
         ttk.Button(self.left_frame, text="Generar", command=self.run_middle_square_method).pack(pady=10)
+        ttk.Button(self.left_frame, text="Guardar secuencia...", command=self.save_middle_square_sequence).pack()
         
+        self.add_progress_controls()
+
         self.results_text = tk.Text(self.left_frame, height=15, width=60)
         self.results_text.pack(pady=10)
 
     def run_middle_square_method(self):
+        seed_str, count_str = self.entry_seed.get(), self.entry_count.get()
+
+        def calcular(progreso):
+            with etapa("lectura de datos"):
+                seed = int(seed_str)
+                n = int(count_str)
+                num_of_digits = len(str(seed))
+
+                if num_of_digits % 2 != 0:
+                    raise ValueError("La semilla debe tener un número par de dígitos.")
+
+            with etapa("cálculo"):
+                random_numbers = self.middle_square_method(seed, n, num_of_digits, progreso)
+            progreso.informar(0.8)
+            with etapa("texto de resultados"):
+                texto = "".join(f"r{i+1}: {num:.4f}\n" for i, num in enumerate(random_numbers))
+            return random_numbers, texto
+
+        clave = clave_de(seed_str, count_str, prueba="cuadrados medios")
+        self.run_in_background(calcular, self.show_middle_square_results, "Cuadrados Medios", clave)
+
+    def save_middle_square_sequence(self):
+        # Guarda los estados en .seq para volver a probarlos sin regenerarlos ni leer texto.
+        seed_str, count_str = self.entry_seed.get(), self.entry_count.get()
         try:
-            seed = int(self.entry_seed.get())
-            n = int(self.entry_count.get())
-            num_of_digits = len(str(seed))
-            
-            if num_of_digits % 2 != 0:
-                raise ValueError("La semilla debe tener un número par de dígitos.")
-            
-            random_numbers = self.middle_square_method(seed, n, num_of_digits)
-            
-            self.results_text.delete(1.0, tk.END)
-            self.results_text.insert(tk.END, "Números generados:\n")
-            for i, num in enumerate(random_numbers):
-                self.results_text.insert(tk.END, f"r{i+1}: {num:.4f}\n")
-            
+            seed, n = int(seed_str), int(count_str)
+        except ValueError:
+            messagebox.showerror("Error", "La semilla y la cantidad deben ser números enteros.")
+            return
+        ruta = filedialog.asksaveasfilename(title="Guardar secuencia", defaultextension=EXTENSION_SECUENCIA,
+                                            filetypes=[("Secuencia", "*" + EXTENSION_SECUENCIA)])
+        if not ruta:
+            return
+
+        def calcular(progreso):
+            return guardar_cuadrados_medios(ruta, seed, n, len(str(seed)), progreso=progreso)
+
+        def mostrar(cabecera):
+            self.results_text.insert(tk.END, f"Secuencia guardada en {ruta} ({cabecera['cantidad']} estados, "
+                                             f"{cabecera['dtype']}).\n")
+
+        self.run_in_background(calcular, mostrar, "Guardar secuencia")
+
+    def show_middle_square_results(self, calculo, png=None):
+        random_numbers, texto = calculo
+        self.results_text.delete(1.0, tk.END)
+        self.results_text.insert(tk.END, "Números generados:\n")
+        self.results_text.insert(tk.END, texto)
+
+        if png is not None:
+            self.show_png(png)
+        else:
             self.plot_middle_square_method(random_numbers)
-        except ValueError as e:
-            messagebox.showerror("Error", str(e))
-    
-    def middle_square_method(self, seed, n, num_of_digits):
-        x = seed
-        random_numbers = []
-        for _ in range(n):
-            x_squared = x ** 2
-            x_squared_str = str(x_squared).zfill(2 * num_of_digits)
-            start_index = num_of_digits // 2
-            end_index = start_index + num_of_digits
-            x = int(x_squared_str[start_index:end_index])
-            random_number = x / (10**num_of_digits)
-            random_numbers.append(random_number)
-        return random_numbers
+
+    def middle_square_method(self, seed, n, num_of_digits, progreso=None):
+        estados = secuencia_cuadrados_medios(seed, n, num_of_digits, progreso.tramo(0, 0.8) if progreso else None)
+        return estados.astype(np.float64) / (10**num_of_digits)
 
     def plot_middle_square_method(self, numbers):
-        self.fig, self.ax = plt.subplots(figsize=(6, 6), dpi=100)
-        self.ax.scatter(range(len(numbers)), numbers)
-        self.ax.set_title('Método de los Cuadrados Medios')
-        self.ax.set_xlabel('Iteración')
-        self.ax.set_ylabel('Valor (0-1)')
-        self.ax.set_ylim(0, 1)
+        with etapa("figura"):
+            self.reset_axes()
+            # Con muchos números se dibuja la densidad en lugar de un punto por valor.
+            dibujar_serie(self.ax, numbers, rango_y=(0, 1))
+            self.ax.set_title('Método de los Cuadrados Medios')
+            self.ax.set_xlabel('Iteración')
+            self.ax.set_ylabel('Valor (0-1)')
+            self.ax.set_ylim(0, 1)
         self.update_canvas()
         
     def update_canvas(self):
-        self.canvas.get_tk_widget().destroy()
-        self.canvas = FigureCanvasTkAgg(self.fig, master=self.right_frame)
-        self.canvas.draw()
-        self.canvas.get_tk_widget().pack(fill=tk.BOTH, expand=True)
-        plt.close(self.fig)
+        with etapa("dibujo"):
+            if MEDICION.activa:
+                # Al medir se dibuja ya, para que el tramo "dibujo" incluya el costo real.
+                self.canvas.draw()
+            else:
+                self.canvas.draw_idle()
 
 if __name__ == "__main__":
     root = tk.Tk()
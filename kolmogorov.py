@@ -0,0 +1,369 @@
+import os
+import tempfile
+
+import numpy as np
+
+from secuencias import EXTENSION as EXTENSION_SECUENCIA, abrir_secuencia
+from tareas import informar
+
+# --- Prueba de Kolmogorov-Smirnov fuera de memoria ---
+#
+# Para muestras que no caben en RAM (10^9 valores o más) el estadístico D se
+# calcula en tres etapas con un presupuesto de memoria fijo:
+#   1. Se ordenan tramos de la muestra por separado y se guardan en un archivo temporal.
+#   2. Los tramos ordenados se mezclan por bloques, produciendo la muestra
+#      ordenada como una sucesión de bloques crecientes.
+#   3. Cada bloque actualiza D+ y D- con su posición global, sin guardar nada más.
+#
+# ``memoria_max`` cubre todos los arreglos vivos a la vez: al ordenar, el tramo
+# en memoria y su conversión a float64; al mezclar, los búferes de lectura y el
+# bloque de salida (medio presupuesto cada uno). D+ y D- se calculan por
+# sub-bloques, así que sus temporales no dependen del tamaño del bloque.
+
+MEMORIA_POR_DEFECTO = 256 * 1024 ** 2
+
+# Elementos por sub-bloque al calcular D+ y D-: unos 512 KB por temporal.
+_SUB_BLOQUE = 1 << 16
+
+# Bytes que se reservan del presupuesto para los temporales de D+ y D- (y de la CDF graficada).
+_RESERVA_SUB_BLOQUES = 4 * _SUB_BLOQUE * 8
+
+
+def abrir_muestras(ruta, dtype=np.float64):
+    """
+    Abre un archivo de muestras como arreglo mapeado en memoria (sin leerlo entero).
+
+    Args:
+        ruta (str): Archivo .npy, secuencia .seq o binario crudo.
+        dtype: Tipo de los valores cuando el archivo es binario crudo.
+
+    Returns:
+        np.ndarray: Vista de solo lectura sobre el archivo (para una .seq, una
+        ``secuencias.Secuencia``, que normaliza los estados por tramos).
+    """
+    if str(ruta).endswith(".npy"):
+        return np.load(ruta, mmap_mode="r")
+    if str(ruta).endswith(EXTENSION_SECUENCIA):
+        return abrir_secuencia(ruta)
+    return np.memmap(ruta, dtype=dtype, mode="r")
+
+
+def _tramos_ordenados(datos, tam_tramo, directorio):
+    # Ordena cada tramo en memoria y lo escribe a un único archivo temporal.
+    n = len(datos)
+    ruta = os.path.join(directorio, "tramos.bin")
+    ordenados = np.memmap(ruta, dtype=np.float64, mode="w+", shape=(n,))
+    limites = []
+    for inicio in range(0, n, tam_tramo):
+        fin = min(inicio + tam_tramo, n)
+        tramo = np.asarray(datos[inicio:fin], dtype=np.float64)
+        if not tramo.flags.owndata:
+            # Una vista de los datos (p. ej. del archivo mapeado) no se ordena en el lugar.
+            tramo = tramo.copy()
+        tramo.sort()
+        ordenados[inicio:fin] = tramo
+        del tramo
+        limites.append((inicio, fin))
+    ordenados.flush()
+    return ordenados, limites
+
+
+def bloques_ordenados(datos, memoria_max=MEMORIA_POR_DEFECTO, directorio=None):
+    """
+    Recorre la muestra en orden creciente, en bloques, usando memoria acotada.
+
+    Args:
+        datos (np.ndarray): Muestra (normalmente mapeada en memoria).
+        memoria_max (int): Bytes aproximados de memoria de trabajo.
+        directorio (str): Carpeta para el archivo temporal (por defecto la del sistema).
+
+    Yields:
+        np.ndarray: Bloques float64 cuya concatenación es ``np.sort(datos)``. Cada
+        bloque es una vista de un búfer que se reutiliza: vale hasta pedir el siguiente.
+    """
+    n = len(datos)
+    # Medio presupuesto para los datos en curso y medio para su copia o salida.
+    reserva = min(_RESERVA_SUB_BLOQUES, memoria_max // 4)
+    tam_tramo = max(1, (memoria_max - reserva) // (2 * 8))
+    if n <= tam_tramo:
+        yield np.sort(np.asarray(datos, dtype=np.float64))
+        return
+
+    with tempfile.TemporaryDirectory(dir=directorio) as carpeta:
+        ordenados, limites = _tramos_ordenados(datos, tam_tramo, carpeta)
+        # Cada tramo tiene un búfer de lectura; entre todos ocupan a lo sumo un
+        # tramo, y la salida de cada ronda (que sale de ellos) tampoco lo supera.
+        tam_bufer = max(1, tam_tramo // len(limites))
+        posiciones = [inicio for inicio, _ in limites]
+        buferes = [np.array(ordenados[inicio:min(inicio + tam_bufer, fin)]) for inicio, fin in limites]
+        salida = np.empty(tam_bufer * len(limites))
+
+        while buferes:
+            # Todo valor <= al menor de los últimos elementos de los búferes ya
+            # tiene asegurada su posición: ningún tramo puede aportar uno menor.
+            umbral = min(b[-1] for b in buferes)
+            largo = 0
+            for j, bufer in enumerate(buferes):
+                corte = np.searchsorted(bufer, umbral, side="right")
+                salida[largo:largo + corte] = bufer[:corte]
+                largo += corte
+                buferes[j] = bufer[corte:]
+            bloque = salida[:largo]
+            bloque.sort()
+            yield bloque
+
+            # Rellenar los búferes vacíos y descartar los tramos agotados. Un búfer
+            # vacío es una vista del arreglo leído antes: se suelta antes de leer el nuevo.
+            del bloque, bufer
+            for j, (inicio, fin) in enumerate(limites):
+                if buferes[j].size == 0:
+                    buferes[j] = None
+                    posiciones[j] += tam_bufer
+                    if posiciones[j] < fin:
+                        buferes[j] = np.array(ordenados[posiciones[j]:min(posiciones[j] + tam_bufer, fin)])
+            vivos = [j for j, bufer in enumerate(buferes) if bufer is not None]
+            buferes = [buferes[j] for j in vivos]
+            limites = [limites[j] for j in vivos]
+            posiciones = [posiciones[j] for j in vivos]
+        del ordenados
+
+
+def estadistico_ks_uniforme(bloques, n):
+    """
+    Calcula D+, D- y D contra la U(0, 1) a partir de la muestra ordenada por bloques.
+
+    Args:
+        bloques: Iterable de bloques crecientes (ver ``bloques_ordenados``).
+        n (int): Tamaño total de la muestra.
+
+    Returns:
+        tuple: (D, D+, D-).
+    """
+    d_sup = -np.inf
+    d_inf = -np.inf
+    i0 = 0
+    for bloque in bloques:
+        # Por sub-bloques: los temporales no crecen con el bloque.
+        for inicio in range(0, len(bloque), _SUB_BLOQUE):
+            cdf = np.clip(bloque[inicio:inicio + _SUB_BLOQUE], 0.0, 1.0)
+            indices = np.arange(i0 + inicio, i0 + inicio + len(cdf), dtype=np.float64)
+            d_sup = max(d_sup, np.max((indices + 1) / n - cdf))
+            d_inf = max(d_inf, np.max(cdf - indices / n))
+        i0 += len(bloque)
+    return max(d_sup, d_inf), d_sup, d_inf
+
+
+def valor_p_ks(d, n, metodo="exacto"):
+    """
+    Valor p bilateral de la prueba K-S de una muestra.
+
+    Args:
+        d (float o np.ndarray): Estadístico D (o uno por muestra).
+        n (int): Tamaño de la(s) muestra(s).
+        metodo (str): "exacto" usa la distribución de D para n finito, igual que
+            ``scipy.stats.kstest``; "asintotico" usa la de Kolmogorov para √n·D,
+            más barata y suficiente para n grande.
+
+    Returns:
+        float o np.ndarray: Valor p, con la forma de ``d``.
+    """
+    from scipy.stats import kstwo, kstwobign
+
+    if metodo == "exacto":
+        p = kstwo.sf(d, n)
+    elif metodo == "asintotico":
+        p = kstwobign.sf(np.sqrt(n) * np.asarray(d, dtype=np.float64))
+    else:
+        raise ValueError(f"Método de valor p desconocido: {metodo!r} (use 'exacto' o 'asintotico').")
+    p = np.clip(p, 0.0, 1.0)
+    return float(p) if np.ndim(p) == 0 else p
+
+
+def _recorriendo(bloques, n, puntos_cdf, cdf, progreso):
+    # Deja pasar los bloques ordenados tomando a lo sumo ``puntos_cdf`` puntos
+    # equiespaciados de la CDF empírica (más el último) e informando el avance.
+    paso = max(1, n // puntos_cdf) if puntos_cdf else 0
+    i0 = 0
+    for bloque in bloques:
+        if paso:
+            indices = np.arange((-i0) % paso, len(bloque), paso)
+            if i0 + len(bloque) == n and (len(indices) == 0 or indices[-1] != len(bloque) - 1):
+                indices = np.append(indices, len(bloque) - 1)
+            cdf.append((bloque[indices], (i0 + indices + 1) / n))
+        i0 += len(bloque)
+        informar(progreso, i0 / n)
+        yield bloque
+
+
+def prueba_ks_archivo(ruta, dtype=np.float64, memoria_max=MEMORIA_POR_DEFECTO, directorio=None, puntos_cdf=0,
+                      progreso=None):
+    """
+    Prueba K-S exacta de uniformidad sobre un archivo de muestras mapeado en memoria.
+
+    Args:
+        puntos_cdf (int): Si es mayor que 0, se guardan unos tantos puntos de la
+            CDF empírica, tomados en la misma pasada (para graficarla).
+        progreso (Progreso): Opcional; se informa el avance de la mezcla de los tramos ordenados.
+
+    Returns:
+        dict: ``n``, ``D``, ``D+``, ``D-`` y ``valor_p``; con ``puntos_cdf``,
+        también ``cdf`` = (valores, F(valores)).
+    """
+    datos = abrir_muestras(ruta, dtype)
+    n = len(datos)
+    if n == 0:
+        raise ValueError("El archivo no contiene muestras.")
+    cdf = []
+    bloques = _recorriendo(bloques_ordenados(datos, memoria_max, directorio), n, puntos_cdf, cdf, progreso)
+    d, d_sup, d_inf = estadistico_ks_uniforme(bloques, n)
+    resultado = {"n": n, "D": float(d), "D+": float(d_sup), "D-": float(d_inf), "valor_p": valor_p_ks(d, n)}
+    if puntos_cdf:
+        resultado["cdf"] = (np.concatenate([x for x, _ in cdf]), np.concatenate([f for _, f in cdf]))
+    return resultado
+
+
+# --- Motor K-S en memoria: una sola ordenación ---
+#
+# D+, D- y el valor p salen de la muestra ordenada una sola vez. Una matriz se
+# prueba fila por fila en una sola operación (cada fila es una muestra), y dos
+# muestras se comparan entre sí sin pasar por una distribución teórica.
+
+# Elementos (filas × n) que se ordenan a la vez en la prueba por lotes: unos 32 MB de float64.
+TAM_LOTE = 1 << 22
+
+# Hasta este tamaño la prueba de dos muestras usa el valor p exacto (como ``ks_2samp``).
+MAX_N_EXACTO_DOS_MUESTRAS = 10000
+
+
+def estadistico_ks_ordenado(ordenados):
+    """
+    Calcula D, D+ y D- contra la U(0, 1) de una muestra ya ordenada.
+
+    Args:
+        ordenados (np.ndarray): Muestra creciente, o matriz cuyas filas son muestras crecientes.
+
+    Returns:
+        tuple: (D, D+, D-); escalares para una muestra, arreglos (uno por fila) para una matriz.
+    """
+    n = ordenados.shape[-1]
+    cdf = np.clip(ordenados, 0.0, 1.0)
+    d_sup = np.max(np.arange(1, n + 1) / n - cdf, axis=-1)
+    d_inf = np.max(cdf - np.arange(n) / n, axis=-1)
+    return np.maximum(d_sup, d_inf), d_sup, d_inf
+
+
+def prueba_ks(datos, metodo="exacto", ordenados=False):
+    """
+    Prueba K-S de uniformidad de una muestra en memoria, ordenándola una sola vez.
+
+    Args:
+        datos (array_like): Muestra.
+        metodo (str): Cálculo del valor p, "exacto" o "asintotico" (ver ``valor_p_ks``).
+        ordenados (bool): True si ``datos`` ya está ordenada (no se vuelve a ordenar).
+
+    Returns:
+        dict: ``n``, ``D``, ``D+``, ``D-`` y ``valor_p``.
+    """
+    datos = np.asarray(datos, dtype=np.float64).ravel()
+    n = len(datos)
+    if n == 0:
+        raise ValueError("La muestra está vacía.")
+    d, d_sup, d_inf = estadistico_ks_ordenado(datos if ordenados else np.sort(datos))
+    return {"n": n, "D": float(d), "D+": float(d_sup), "D-": float(d_inf), "valor_p": valor_p_ks(d, n, metodo)}
+
+
+def prueba_ks_lote(muestras, metodo="exacto", en_el_lugar=False):
+    """
+    Prueba K-S de uniformidad de muchas muestras del mismo tamaño a la vez.
+
+    Las filas se ordenan por tandas de a lo sumo ``TAM_LOTE`` elementos, así que
+    la memoria extra no crece con la cantidad de muestras.
+
+    Args:
+        muestras (np.ndarray): Matriz (muestras × n).
+        metodo (str): Cálculo del valor p, "exacto" o "asintotico".
+        en_el_lugar (bool): Si es True ordena las filas de ``muestras`` sin copiarlas
+            (debe ser un arreglo float64 escribible).
+
+    Returns:
+        dict: ``n`` y los arreglos ``D``, ``D+``, ``D-`` y ``valor_p`` (uno por fila).
+    """
+    muestras = np.asarray(muestras) if en_el_lugar else np.asarray(muestras, dtype=np.float64)
+    if muestras.ndim != 2 or muestras.shape[1] == 0:
+        raise ValueError("Las muestras deben ser una matriz (muestras × n) con n > 0.")
+    filas, n = muestras.shape
+    d, d_sup, d_inf = (np.empty(filas) for _ in range(3))
+    por_tanda = max(1, TAM_LOTE // n)
+    for inicio in range(0, filas, por_tanda):
+        fin = min(inicio + por_tanda, filas)
+        if en_el_lugar:
+            muestras[inicio:fin].sort(axis=1)
+            tanda = muestras[inicio:fin]
+        else:
+            tanda = np.sort(muestras[inicio:fin], axis=1)
+        d[inicio:fin], d_sup[inicio:fin], d_inf[inicio:fin] = estadistico_ks_ordenado(tanda)
+    return {"n": n, "D": d, "D+": d_sup, "D-": d_inf, "valor_p": np.atleast_1d(valor_p_ks(d, n, metodo))}
+
+
+def _valor_p_exacto_dos_muestras(d, n1, n2):
+    # La distribución exacta de D solo depende de n1, n2 y D: se le pide a scipy
+    # el valor p de ese D, sin pasarle las muestras (``ks_2samp`` las volvería a
+    # ordenar). Devuelve None si scipy no puede calcularlo con precisión.
+    # La función es privada: si falta o cambió su firma o su resultado, también
+    # se devuelve None y se usa el valor p asintótico.
+    from math import gcd
+
+    try:
+        from scipy.stats._stats_py import _attempt_exact_2kssamp
+
+        exito, _, valor_p = _attempt_exact_2kssamp(n1, n2, gcd(n1, n2), d, "two-sided")
+        valor_p = float(valor_p)
+    except (ImportError, TypeError, ValueError):
+        return None
+    return float(np.clip(valor_p, 0.0, 1.0)) if exito and np.isfinite(valor_p) else None
+
+
+def prueba_ks_dos_muestras(x, y, metodo="auto"):
+    """
+    Prueba K-S de dos muestras: ¿salen de la misma distribución? (p. ej. dos generadores).
+
+    Cada muestra se ordena una vez; las dos CDF empíricas se evalúan en todos
+    los valores con búsquedas binarias, lo que también maneja los empates.
+
+    Args:
+        x, y (array_like): Muestras, de tamaños que pueden diferir.
+        metodo (str): "exacto", "asintotico" o "auto" (exacto si ambas tienen a lo
+            sumo ``MAX_N_EXACTO_DOS_MUESTRAS`` valores), como ``scipy.stats.ks_2samp``.
+
+    Returns:
+        dict: ``n1``, ``n2``, ``D``, ``D+`` (max F_x - F_y), ``D-`` (max F_y - F_x),
+        ``valor_p`` y el ``metodo`` usado.
+    """
+    x = np.sort(np.asarray(x, dtype=np.float64).ravel())
+    y = np.sort(np.asarray(y, dtype=np.float64).ravel())
+    n1, n2 = len(x), len(y)
+    if n1 == 0 or n2 == 0:
+        raise ValueError("Las dos muestras deben tener al menos un valor.")
+    if metodo == "auto":
+        metodo = "exacto" if max(n1, n2) <= MAX_N_EXACTO_DOS_MUESTRAS else "asintotico"
+    elif metodo not in ("exacto", "asintotico"):
+        raise ValueError(f"Método de valor p desconocido: {metodo!r} (use 'auto', 'exacto' o 'asintotico').")
+
+    todos = np.concatenate([x, y])
+    diferencias = np.searchsorted(x, todos, side="right") / n1 - np.searchsorted(y, todos, side="right") / n2
+    d_sup = max(float(np.max(diferencias)), 0.0)
+    d_inf = max(float(-np.min(diferencias)), 0.0)
+    d = max(d_sup, d_inf)
+
+    if metodo == "exacto":
+        valor_p = _valor_p_exacto_dos_muestras(d, n1, n2)
+        if valor_p is None:
+            # Como ``ks_2samp``: si el cálculo exacto no es estable, se usa el asintótico.
+            metodo = "asintotico"
+    if metodo == "asintotico":
+        from scipy.stats import kstwo
+
+        # Aproximación de Smirnov: D con el tamaño efectivo n1·n2 / (n1 + n2).
+        efectivo = np.round(n1 * n2 / (n1 + n2))
+        valor_p = float(np.clip(kstwo.sf(d, efectivo), 0.0, 1.0))
+    return {"n1": n1, "n2": n2, "D": d, "D+": d_sup, "D-": d_inf, "valor_p": valor_p, "metodo": metodo}
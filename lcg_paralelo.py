@@ -0,0 +1,156 @@
+import os
+import tempfile
+from concurrent.futures import ProcessPoolExecutor, as_completed
+from multiprocessing import shared_memory
+
+import numpy as np
+
+from multiplicador_constante import (TAM_BLOQUE, dtype_para, estados_lcg, llenar_estados_lcg, normalizar_estados,
+                                     saltar_lcg)
+from secuencias import TAM_CABECERA, crear_secuencia, guardar_lcg
+from tareas import informar
+
+# --- Multiplicador constante en paralelo por bloques contiguos ---
+#
+# La secuencia X_1 .. X_n se parte en tramos contiguos. Cada proceso salta
+# directo al estado anterior a su tramo (X_i = a^i · X₀ mod m, con ``pow``) y
+# escribe sus estados en el arreglo de salida, que vive en memoria compartida o
+# en un archivo .seq mapeado: nada se envía de vuelta por el pool. La aritmética
+# es modular exacta, así que el resultado es idéntico al de ``estados_lcg`` para
+# cualquier cantidad de procesos.
+
+# Por debajo de esta cantidad de estados por proceso, arrancar el pool cuesta más de lo que ahorra.
+MIN_POR_PROCESO = 1 << 21
+
+# Tramos por proceso: con más de uno el avance se informa más seguido y los procesos se reparten mejor la carga.
+TRAMOS_POR_PROCESO = 4
+
+
+def cantidad_de_procesos(n_numeros, procesos=None):
+    """Procesos a usar para n estados: a lo sumo ``procesos`` (None = uno por núcleo) y 1 si n es chico."""
+    return max(1, min(procesos or os.cpu_count() or 1, n_numeros // MIN_POR_PROCESO))
+
+
+def tramos_contiguos(n, partes):
+    """Límites (inicio, fin) de ``partes`` tramos contiguos de 0 .. n de tamaños casi iguales."""
+    limites = [n * i // partes for i in range(partes + 1)]
+    return [(inicio, fin) for inicio, fin in zip(limites, limites[1:]) if fin > inicio]
+
+
+def _abrir_salida(destino):
+    # (memoria compartida o archivo, la vista completa de la salida)
+    tipo, ubicacion, n, dtype = destino
+    if tipo == "memoria":
+        memoria = shared_memory.SharedMemory(name=ubicacion)
+        return memoria, np.ndarray((n,), dtype=dtype, buffer=memoria.buf)
+    return None, np.memmap(ubicacion, dtype=dtype, mode="r+", offset=TAM_CABECERA, shape=(n,))
+
+
+def _llenar_tramo(tarea):
+    destino, inicio, fin, semilla, a, m, normalizar, tam_bloque = tarea
+    memoria, salida = _abrir_salida(destino)
+    try:
+        x = saltar_lcg(semilla % m, a, m, inicio)
+        tramo = salida[inicio:fin]
+        if tramo.dtype == np.uint64 and not normalizar:
+            llenar_estados_lcg(tramo, x, a, m, tam_bloque)
+        else:
+            # Los estados se calculan en uint64 y se guardan normalizados o en un tipo más angosto.
+            bloque = np.empty(min(tam_bloque, len(tramo)), dtype=np.uint64)
+            for i in range(0, len(tramo), len(bloque)):
+                parte = bloque[:min(len(bloque), len(tramo) - i)]
+                x = llenar_estados_lcg(parte, x, a, m, tam_bloque)
+                tramo[i:i + len(parte)] = normalizar_estados(parte, m) if normalizar else parte
+        if memoria is None:
+            salida.flush()
+        del tramo
+    finally:
+        # La memoria compartida no se puede cerrar mientras haya vistas sobre ella.
+        del salida
+        if memoria is not None:
+            memoria.close()
+    return fin - inicio
+
+
+def _llenar_en_paralelo(destino, semilla, a, m, n_numeros, normalizar, procesos, tam_bloque, progreso):
+    tareas = [(destino, inicio, fin, semilla, a, m, normalizar, tam_bloque)
+              for inicio, fin in tramos_contiguos(n_numeros, procesos * TRAMOS_POR_PROCESO)]
+    with ProcessPoolExecutor(max_workers=procesos) as pool:
+        futuros = [pool.submit(_llenar_tramo, tarea) for tarea in tareas]
+        try:
+            hechos = 0
+            for futuro in as_completed(futuros):
+                hechos += futuro.result()
+                informar(progreso, hechos / n_numeros)
+        except BaseException:
+            pool.shutdown(cancel_futures=True)
+            raise
+
+
+def estados_lcg_paralelo(semilla, a, m, n_numeros, procesos=None, normalizar=False, tam_bloque=TAM_BLOQUE,
+                         progreso=None):
+    """
+    Genera los estados X_1 .. X_n del multiplicador constante repartidos entre procesos.
+
+    Args:
+        semilla (int): Semilla inicial (X₀).
+        a (int): Multiplicador.
+        m (int): Módulo.
+        n_numeros (int): Cantidad de estados.
+        procesos (int): Máximo de procesos (None = uno por núcleo). Con pocos
+            estados (ver ``MIN_POR_PROCESO``) o un módulo que no cabe en 64 bits se genera en este proceso.
+        normalizar (bool): Si es True devuelve U_i = X_i / m (float64), calculados por cada proceso.
+        progreso (Progreso): Opcional; se informa el avance al terminar cada tramo.
+
+    Returns:
+        np.ndarray: Igual a ``estados_lcg(semilla, a, m, n_numeros)`` (o a
+        ``generar_lcg_bloques`` si se normaliza), cualquiera sea la cantidad de procesos.
+    """
+    if m <= 0:
+        raise ValueError("El módulo (m) debe ser un entero positivo.")
+    procesos = cantidad_de_procesos(n_numeros, procesos)
+    if procesos == 1 or dtype_para(m) is object:
+        estados = estados_lcg(semilla, a, m, n_numeros, tam_bloque, progreso)
+        return normalizar_estados(estados, m) if normalizar else estados
+
+    dtype = np.dtype(np.float64 if normalizar else np.uint64)
+    memoria = shared_memory.SharedMemory(create=True, size=n_numeros * dtype.itemsize)
+    try:
+        _llenar_en_paralelo(("memoria", memoria.name, n_numeros, dtype.str), semilla, a, m, n_numeros, normalizar,
+                            procesos, tam_bloque, progreso)
+        # Una copia final al arreglo propio: la memoria compartida se libera al salir.
+        vista = np.ndarray((n_numeros,), dtype=dtype, buffer=memoria.buf)
+        resultado = vista.copy()
+        del vista
+    finally:
+        memoria.close()
+        memoria.unlink()
+    return resultado
+
+
+def guardar_lcg_paralelo(ruta, semilla, a, m, n_numeros, procesos=None, tam_bloque=TAM_BLOQUE, progreso=None):
+    """
+    Genera y guarda en un archivo .seq los estados del multiplicador constante, en paralelo.
+
+    Cada proceso escribe su tramo directamente en el archivo mapeado; el
+    resultado es el mismo archivo que ``secuencias.guardar_lcg``, que es lo que
+    se usa con pocos estados o un módulo que no cabe en 64 bits.
+
+    Returns:
+        dict: La cabecera escrita.
+    """
+    procesos = cantidad_de_procesos(n_numeros, procesos)
+    if m <= 0 or procesos == 1 or dtype_para(m) is object:
+        return guardar_lcg(ruta, semilla, a, m, n_numeros, progreso=progreso)
+
+    descriptor, temporal = tempfile.mkstemp(dir=os.path.dirname(os.path.abspath(ruta)), suffix=".tmp")
+    os.close(descriptor)
+    try:
+        cabecera = crear_secuencia(temporal, n_numeros, m - 1, m, "lcg", semilla=semilla, a=a, m=m)
+        _llenar_en_paralelo(("archivo", temporal, n_numeros, cabecera["dtype"]), semilla, a, m, n_numeros, False,
+                            procesos, tam_bloque, progreso)
+        os.replace(temporal, ruta)
+    except BaseException:
+        os.remove(temporal)
+        raise
+    return cabecera
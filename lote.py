@@ -0,0 +1,184 @@
+"""
+Ejecución por lotes (sin interfaz gráfica) de las pruebas de medias, varianza y uniformidad.
+
+Uso:
+    python lote.py datos/ "salidas/*.npy" otro.csv --salida resultados.jsonl
+
+Cada conjunto de datos (.csv/.txt, .npy, secuencia .seq o binario crudo .f32/.f64/.u32) se procesa en un proceso del pool y
+produce una línea JSON con los resultados de las tres pruebas y su estado de
+momentos (n, media, M2). Con ``--combinar`` esos estados se reducen al final y
+se agrega una línea con las pruebas de medias y varianza de todos los datos juntos.
+"""
+import argparse
+import glob
+import json
+import os
+import sys
+from concurrent.futures import ProcessPoolExecutor
+
+import numpy as np
+
+from acumuladores import Momentos
+from carga import EXTENSIONES, archivo_mapeable, cargar_muestras
+from traza import NIVELES, RESUMEN
+
+def buscar_datasets(entradas):
+    """
+    Expande directorios y patrones glob a la lista ordenada de archivos de datos.
+
+    Args:
+        entradas (list): Rutas a archivos, directorios o patrones glob.
+
+    Returns:
+        list: Rutas de los archivos de datos encontrados (ver ``carga.EXTENSIONES``), sin repetir.
+    """
+    rutas = []
+    for entrada in entradas:
+        if os.path.isdir(entrada):
+            candidatos = [os.path.join(entrada, nombre) for nombre in os.listdir(entrada)]
+        else:
+            candidatos = glob.glob(entrada)
+        rutas.extend(r for r in candidatos if os.path.isfile(r) and r.lower().endswith(EXTENSIONES))
+    return sorted(set(rutas))
+
+
+def cargar_dataset(ruta):
+    """
+    Lee un archivo de muestras con ``carga.cargar_muestras``: un CSV/TXT queda en
+    memoria; un .npy, una .seq o un binario crudo, mapeado sin copiarlo.
+    """
+    return cargar_muestras(ruta)
+
+
+def _a_json(valor):
+    # Los resultados traen escalares de NumPy, que json no sabe serializar.
+    if isinstance(valor, np.generic):
+        return valor.item()
+    return valor
+
+
+def procesar_dataset(ruta, media_hipotetica, sigma, varianza_hipotetica, nivel=None):
+    """
+    Corre las tres pruebas sobre un archivo y devuelve un diccionario serializable.
+
+    Si ``nivel`` no es None, se incluye también el texto del proceso con ese nivel de detalle.
+    """
+    from calculos import (prueba_de_medias_proceso, prueba_de_uniformidad_archivo_proceso,
+                          prueba_de_uniformidad_proceso, prueba_de_varianza_proceso)
+
+    resultado = {"archivo": ruta}
+    try:
+        # Las pruebas de medias y varianza recorren los datos por bloques (ver ``acumuladores.bloques_de``).
+        datos = cargar_dataset(ruta)
+        nivel_traza = nivel or RESUMEN
+        resultado["momentos"] = Momentos.de_datos(datos).a_dict()
+
+        proceso, interpretacion = prueba_de_medias_proceso(datos, media_hipotetica, sigma, nivel_traza)
+        resultado["medias"] = dict(proceso.resultados, interpretacion=interpretacion)
+        if nivel:
+            resultado["medias"]["proceso"] = str(proceso)
+
+        proceso, _ = prueba_de_varianza_proceso(datos, varianza_hipotetica, nivel_traza, graficar=False)
+        resultado["varianza"] = dict(proceso.resultados)
+        if nivel:
+            resultado["varianza"]["proceso"] = str(proceso)
+
+        if archivo_mapeable(ruta) is not None:
+            # Los archivos mapeables se ordenan por tramos en disco, sin cargarlos enteros en RAM.
+            proceso, interpretacion, _ = prueba_de_uniformidad_archivo_proceso(ruta, nivel=nivel_traza,
+                                                                               graficar=False)
+        else:
+            proceso, interpretacion, _ = prueba_de_uniformidad_proceso(datos, nivel_traza, graficar=False)
+        resultado["uniformidad"] = dict(proceso.resultados, interpretacion=interpretacion)
+        if nivel:
+            resultado["uniformidad"]["proceso"] = str(proceso)
+    except Exception as e:
+        resultado["error"] = f"{type(e).__name__}: {e}"
+
+    return {clave: ({k: _a_json(v) for k, v in valor.items()} if isinstance(valor, dict) else valor)
+            for clave, valor in resultado.items()}
+
+
+def _procesar(argumentos):
+    return procesar_dataset(*argumentos)
+
+
+def procesar_combinado(momentos, media_hipotetica, sigma, varianza_hipotetica):
+    """Pruebas de medias y varianza sobre el estado reducido de todos los archivos."""
+    from calculos import prueba_de_medias_flujo, prueba_de_varianza_flujo
+
+    resultado = {"archivo": None, "archivos": 0, "momentos": momentos.a_dict()}
+    proceso, interpretacion = prueba_de_medias_flujo(momentos, media_hipotetica, sigma, RESUMEN)
+    resultado["medias"] = {k: _a_json(v) for k, v in dict(proceso.resultados, interpretacion=interpretacion).items()}
+    proceso, _ = prueba_de_varianza_flujo(momentos, varianza_hipotetica, RESUMEN)
+    resultado["varianza"] = {k: _a_json(v) for k, v in proceso.resultados.items()}
+    return resultado
+
+
+def ejecutar_lote(rutas, salida, media_hipotetica=0.5, sigma=None, varianza_hipotetica=1 / 12,
+                  procesos=None, nivel=None, combinar=False):
+    """
+    Procesa los archivos en paralelo y escribe una línea JSON por archivo, en orden.
+
+    Con ``combinar`` se escribe además una última línea con las pruebas sobre la
+    unión de todos los archivos, calculada solo a partir de sus estados de momentos.
+
+    Returns:
+        int: Cantidad de archivos que terminaron con error.
+    """
+    tareas = [(ruta, media_hipotetica, sigma, varianza_hipotetica, nivel) for ruta in rutas]
+    # Tandas de varios archivos por envío para que miles de archivos chicos no
+    # paguen cada uno el costo de comunicación con el pool.
+    tanda = max(1, len(tareas) // (4 * (procesos or os.cpu_count() or 1)))
+    errores = 0
+    total = Momentos()
+    combinados = 0
+    with ProcessPoolExecutor(max_workers=procesos) as pool:
+        for resultado in pool.map(_procesar, tareas, chunksize=tanda):
+            errores += "error" in resultado
+            if "momentos" in resultado:
+                total.combinar(Momentos.de_dict(resultado["momentos"]))
+                combinados += 1
+            salida.write(json.dumps(resultado, ensure_ascii=False) + "\n")
+            salida.flush()
+    if combinar and total.n > 1:
+        resultado = procesar_combinado(total, media_hipotetica, sigma, varianza_hipotetica)
+        resultado["archivos"] = combinados
+        salida.write(json.dumps(resultado, ensure_ascii=False) + "\n")
+    return errores
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Pruebas de medias, varianza y uniformidad por lotes.")
+    parser.add_argument("entradas", nargs="+",
+                        help=f"Archivos, directorios o patrones glob de datos ({', '.join(EXTENSIONES)}).")
+    parser.add_argument("--salida", "-o", help="Archivo JSON Lines de salida (por defecto, la salida estándar).")
+    parser.add_argument("--media", type=float, default=0.5, help="Media hipotética (μ₀). Por defecto 0.5.")
+    parser.add_argument("--sigma", type=float, default=None,
+                        help="Desviación estándar poblacional (σ). Si se omite, se usa una prueba t.")
+    parser.add_argument("--varianza", type=float, default=1 / 12, help="Varianza hipotética (σ₀²). Por defecto 1/12.")
+    parser.add_argument("--procesos", "-j", type=int, default=None, help="Procesos en paralelo (por defecto, uno por núcleo).")
+    parser.add_argument("--proceso", choices=NIVELES, default=None,
+                        help="Incluir el texto del proceso con este nivel de detalle.")
+    parser.add_argument("--combinar", action="store_true",
+                        help="Agregar una línea final con las pruebas sobre todos los archivos juntos.")
+    args = parser.parse_args(argv)
+
+    rutas = buscar_datasets(args.entradas)
+    if not rutas:
+        parser.error(f"No se encontraron archivos de datos ({', '.join(EXTENSIONES)}) en las entradas indicadas.")
+
+    salida = open(args.salida, "w", encoding="utf-8") if args.salida else sys.stdout
+    try:
+        errores = ejecutar_lote(rutas, salida, args.media, args.sigma, args.varianza, args.procesos, args.proceso,
+                               args.combinar)
+    finally:
+        if salida is not sys.stdout:
+            salida.close()
+
+    print(f"{len(rutas)} archivos procesados, {errores} con errores.", file=sys.stderr)
+    return 1 if errores else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,131 @@
+import json
+import os
+import threading
+import time
+from contextlib import nullcontext
+
+# --- Medición opcional de las etapas de un cálculo ---
+#
+# Cuando un cálculo de las interfaces tarda, no se sabe si el tiempo se va en
+# leer los datos, en el cálculo numérico, en armar el texto del proceso, en la
+# figura o en dibujar el lienzo. Cada etapa se envuelve en ``with etapa(nombre):``;
+# con la medición desactivada eso devuelve un contexto vacío compartido (una
+# llamada y una comparación), y con la medición activada se registra el tramo.
+# Los tramos se exportan como JSON o en el formato de trazas de Chrome
+# (chrome://tracing, Perfetto).
+
+_NULO = nullcontext()
+
+
+class _Tramo:
+    __slots__ = ("medicion", "nombre", "inicio")
+
+    def __init__(self, medicion, nombre):
+        self.medicion = medicion
+        self.nombre = nombre
+
+    def __enter__(self):
+        self.inicio = time.perf_counter_ns()
+        return self
+
+    def __exit__(self, *error):
+        self.medicion._registrar(self.nombre, self.inicio, time.perf_counter_ns())
+        return False
+
+
+class Medicion:
+    """
+    Registro de los tramos (etapas) de los cálculos.
+
+    Atributos:
+        activa (bool): Si es False, ``etapa`` no registra nada.
+        tramos (list): Diccionarios con ``calculo``, ``nombre``, ``inicio_us``,
+            ``duracion_us`` e ``hilo`` de cada tramo terminado.
+    """
+
+    def __init__(self, activa=False):
+        self.activa = activa
+        self.tramos = []
+        self.calculos = []
+        self._origen = time.perf_counter_ns()
+        self._cerrojo = threading.Lock()
+
+    def etapa(self, nombre):
+        """Contexto que mide la etapa ``nombre`` (o no hace nada si la medición está inactiva)."""
+        if not self.activa:
+            return _NULO
+        return _Tramo(self, nombre)
+
+    def nuevo_calculo(self, titulo):
+        """Marca el comienzo de un cálculo: los tramos siguientes le pertenecen."""
+        if self.activa:
+            with self._cerrojo:
+                self.calculos.append(titulo)
+
+    def _registrar(self, nombre, inicio, fin):
+        hilo = threading.current_thread()
+        with self._cerrojo:
+            self.tramos.append({
+                "calculo": len(self.calculos) - 1,
+                "nombre": nombre,
+                "inicio_us": (inicio - self._origen) / 1000,
+                "duracion_us": (fin - inicio) / 1000,
+                "hilo": hilo.name,
+                "tid": hilo.ident,
+            })
+
+    def limpiar(self):
+        with self._cerrojo:
+            self.tramos.clear()
+            self.calculos.clear()
+
+    def ultimo_calculo(self):
+        """Tramos del cálculo más reciente, en el orden en que empezaron."""
+        with self._cerrojo:
+            actual = len(self.calculos) - 1
+            return sorted((t for t in self.tramos if t["calculo"] == actual), key=lambda t: t["inicio_us"])
+
+    def resumen(self):
+        """Texto de una línea con la duración de cada etapa del último cálculo."""
+        tramos = self.ultimo_calculo()
+        if not tramos:
+            return ""
+        inicio = tramos[0]["inicio_us"]
+        fin = max(t["inicio_us"] + t["duracion_us"] for t in tramos)
+        partes = [f"{t['nombre']} {_ms(t['duracion_us'])}" for t in tramos]
+        return " · ".join(partes) + f"  |  total {_ms(fin - inicio)}"
+
+    def a_dict(self):
+        with self._cerrojo:
+            return {"calculos": list(self.calculos), "tramos": [dict(t) for t in self.tramos]}
+
+    def a_chrome(self):
+        """Eventos en el formato de trazas de Chrome (``traceEvents`` con eventos completos "X")."""
+        datos = self.a_dict()
+        eventos = [{"name": "process_name", "ph": "M", "pid": os.getpid(), "args": {"name": "Calculadora"}}]
+        for t in datos["tramos"]:
+            calculo = datos["calculos"][t["calculo"]] if t["calculo"] >= 0 else ""
+            eventos.append({"name": t["nombre"], "cat": calculo or "calculo", "ph": "X", "ts": t["inicio_us"],
+                            "dur": t["duracion_us"], "pid": os.getpid(), "tid": t["tid"],
+                            "args": {"calculo": calculo, "hilo": t["hilo"]}})
+        return {"traceEvents": eventos, "displayTimeUnit": "ms"}
+
+    def exportar(self, ruta):
+        """Guarda los tramos: en formato de Chrome si la ruta termina en ``.trace.json``, si no como JSON."""
+        datos = self.a_chrome() if str(ruta).endswith(".trace.json") else self.a_dict()
+        with open(ruta, "w", encoding="utf-8") as archivo:
+            json.dump(datos, archivo, indent=1, ensure_ascii=False)
+
+
+def _ms(microsegundos):
+    return f"{microsegundos / 1000:.1f} ms" if microsegundos < 10_000_000 else f"{microsegundos / 1e6:.2f} s"
+
+
+# Medición compartida por las interfaces y el núcleo de cálculo. Se activa desde
+# la interfaz o con la variable de entorno CALCULADORA_TIEMPOS=1.
+MEDICION = Medicion(activa=os.environ.get("CALCULADORA_TIEMPOS") == "1")
+
+
+def etapa(nombre):
+    """``MEDICION.etapa(nombre)``: atajo para envolver una etapa en ``with``."""
+    return MEDICION.etapa(nombre)
@@ -0,0 +1,200 @@
+import numpy as np
+
+from congruencial import modulo_soportado, multiplicar_mod
+from tareas import informar
+
+# --- Generación por bloques del Algoritmo Multiplicador Constante ---
+#
+# X_{i+1} = (a * X_i) mod m  implica  X_{i+k} = (a^k mod m) * X_i mod m.
+# Con las potencias a^1 .. a^B (mod m) precalculadas, un bloque completo de B
+# estados se obtiene con una sola multiplicación vectorizada a partir del último
+# estado del bloque anterior. Los productos módulo m se calculan con
+# ``congruencial.multiplicar_mod``, que no desborda 64 bits aunque (m - 1)² no quepa.
+
+TAM_BLOQUE = 1 << 16
+
+# Hasta 2^53 los estados caben exactos en un float64 y X / m < 1 siempre; con m
+# mayor un X cercano a m - 1 redondea a 1.0 y se recorta a este valor.
+_DOS_53 = 1 << 53
+_MENOR_QUE_UNO = np.nextafter(1.0, 0.0)
+
+
+def saltar_lcg(x, a, m, k):
+    """
+    Avanza k pasos el generador multiplicador constante sin iterar.
+
+    Args:
+        x (int): Estado actual X_i.
+        a (int): Multiplicador.
+        m (int): Módulo.
+        k (int): Cantidad de pasos a saltar.
+
+    Returns:
+        int: El estado X_{i+k} = (a^k mod m) * X_i mod m.
+    """
+    return (pow(a, k, m) * x) % m
+
+
+def dtype_para(m):
+    """
+    Tipo de los estados para el módulo m: uint64 si m <= 2^63 o m es una potencia
+    de dos hasta 2^64 (ver ``congruencial.modulo_soportado``); para módulos
+    mayores, enteros de Python (dtype=object), exactos aunque más lentos.
+    """
+    return np.uint64 if modulo_soportado(m) else object
+
+
+def escalar(dtype, valor):
+    """Convierte un entero al escalar que se opera con arreglos de ``dtype``."""
+    return int(valor) if dtype is object else np.uint64(valor)
+
+
+def producto_mod(x, b, m, out=None):
+    """(x · b) mod m para un arreglo de estados de ``dtype_para(m)`` y un entero b."""
+    if x.dtype == object:
+        resultado = (x * int(b)) % m
+        if out is None:
+            return resultado
+        out[...] = resultado
+        return out
+    return multiplicar_mod(x, int(b), m, out=out)
+
+
+def potencias_modulares(a, m, cantidad):
+    """
+    Calcula el arreglo [a^1, a^2, ..., a^cantidad] (mod m) por duplicación.
+
+    Cada paso duplica la longitud del arreglo multiplicando la mitad ya
+    calculada por a^k, por lo que solo hacen falta log2(cantidad) operaciones
+    vectorizadas.
+    """
+    dtype = dtype_para(m)
+    potencias = np.empty(cantidad, dtype=dtype)
+    if cantidad == 0:
+        return potencias
+    potencias[0] = a % m
+    k = 1
+    while k < cantidad:
+        paso = min(k, cantidad - k)
+        producto_mod(potencias[:paso], pow(a, k, m), m, out=potencias[k:k + paso])
+        k += paso
+    return potencias
+
+
+def estados_lcg(semilla, a, m, n_numeros, tam_bloque=TAM_BLOQUE, progreso=None):
+    """
+    Genera los estados enteros X_1 .. X_n del generador multiplicador constante.
+
+    Args:
+        semilla (int): Semilla inicial (X₀).
+        a (int): Multiplicador.
+        m (int): Módulo.
+        n_numeros (int): Cantidad de estados a generar.
+        tam_bloque (int): Cantidad de estados calculados por operación vectorizada.
+        progreso (Progreso): Opcional; se informa el avance después de cada bloque.
+
+    Returns:
+        np.ndarray: Arreglo de longitud n_numeros con los estados (uint64, u
+        object si m no cabe en 64 bits).
+    """
+    if m <= 0:
+        raise ValueError("El módulo (m) debe ser un entero positivo.")
+    estados = np.empty(n_numeros, dtype=dtype_para(m))
+    llenar_estados_lcg(estados, semilla, a, m, tam_bloque, progreso)
+    return estados
+
+
+def llenar_estados_lcg(salida, semilla, a, m, tam_bloque=TAM_BLOQUE, progreso=None):
+    """
+    Escribe en ``salida`` los estados que siguen a ``semilla``: X_1 .. X_len(salida).
+
+    Args:
+        salida (np.ndarray): Arreglo de ``dtype_para(m)`` (puede ser una vista de
+            memoria compartida o de un archivo mapeado).
+        semilla (int): Estado anterior al primero que se escribe.
+
+    Returns:
+        int: El último estado escrito (o la semilla si ``salida`` está vacía).
+    """
+    n_numeros = len(salida)
+    if n_numeros == 0:
+        return semilla % m
+    potencias = potencias_modulares(a, m, min(tam_bloque, n_numeros))
+    xn = semilla % m
+    for inicio in range(0, n_numeros, len(potencias)):
+        fin = min(inicio + len(potencias), n_numeros)
+        bloque = salida[inicio:fin]
+        producto_mod(potencias[:fin - inicio], xn, m, out=bloque)
+        xn = int(bloque[-1])
+        informar(progreso, fin / n_numeros)
+    return xn
+
+
+def bloques_estados_lcg(semilla, a, m, n_numeros, tam_bloque=TAM_BLOQUE):
+    """
+    Recorre los estados enteros X_1 .. X_n del generador multiplicador constante por bloques.
+
+    Cada bloque se calcula a partir del último estado del anterior, por lo que
+    la memoria usada no depende de n_numeros.
+
+    Yields:
+        np.ndarray: Bloques de a lo sumo ``tam_bloque`` estados (uint64, u object
+        si m no cabe en 64 bits), cuya concatenación es ``estados_lcg(semilla, a, m, n_numeros)``.
+    """
+    if m <= 0:
+        raise ValueError("El módulo (m) debe ser un entero positivo.")
+    if n_numeros == 0:
+        return
+    potencias = potencias_modulares(a, m, min(tam_bloque, n_numeros))
+    xn = semilla % m
+    for inicio in range(0, n_numeros, len(potencias)):
+        bloque = producto_mod(potencias[:min(len(potencias), n_numeros - inicio)], xn, m)
+        xn = int(bloque[-1])
+        yield bloque
+
+
+def bloques_lcg(semilla, a, m, n_numeros, tam_bloque=TAM_BLOQUE):
+    """
+    Recorre los números U_1 .. U_n del generador multiplicador constante por bloques.
+
+    Yields:
+        np.ndarray: Bloques float64 de a lo sumo ``tam_bloque`` números en [0, 1),
+        cuya concatenación es ``generar_lcg_bloques(semilla, a, m, n_numeros)``.
+    """
+    for bloque in bloques_estados_lcg(semilla, a, m, n_numeros, tam_bloque):
+        yield normalizar_estados(bloque, m)
+
+
+def generar_lcg_bloques(semilla, a, m, n_numeros, tam_bloque=TAM_BLOQUE):
+    """
+    Genera n números pseudoaleatorios U_i = X_i / m por bloques vectorizados.
+
+    Con m <= 2^53 devuelve exactamente la misma secuencia que el ciclo escalar
+    ``xn = (a * xn) % m; u = xn / m`` de ``generador_multiplicador_constante_proceso``;
+    con m mayor cada U_i puede diferir en una ulp de ``xn / m`` (ver ``normalizar_estados``).
+
+    Returns:
+        np.ndarray: Arreglo float64 con los números generados en [0, 1).
+    """
+    return normalizar_estados(estados_lcg(semilla, a, m, n_numeros, tam_bloque), m)
+
+
+def normalizar_estados(estados, m):
+    """
+    Convierte los estados enteros X_i en números U_i = X_i / m (float64), siempre en [0, 1).
+
+    Con m <= 2^53 cada U_i es exactamente ``X_i / m``. Con m mayor los estados
+    uint64 se pasan a float64 antes de dividir, así que un U_i puede diferir en
+    una ulp de ``X_i / m``, y el que redondearía a 1.0 queda en el mayor float64
+    menor que 1.
+    """
+    estados = np.asarray(estados)
+    if estados.dtype == object:
+        # La división de enteros de Python redondea una sola vez, como el ciclo escalar.
+        numeros = np.array([int(x) / m for x in estados], dtype=np.float64)
+    else:
+        numeros = estados.astype(np.float64)
+        numeros /= m
+    if m > _DOS_53:
+        np.minimum(numeros, _MENOR_QUE_UNO, out=numeros)
+    return numeros
@@ -1,172 +1,23 @@
 import tkinter as tk
-from tkinter import ttk, messagebox
-import numpy as np
-from scipy.stats import kstest, norm, chi2
-import matplotlib.pyplot as plt
+from tkinter import ttk, messagebox, filedialog
 from matplotlib.backends.backend_tkagg import FigureCanvasTkAgg
-
-
-# --- Funciones de Lógica de Cálculo (mejoradas con pasos) ---
-
-def prueba_de_medias_proceso(datos, media_hipotetica, desviacion_estandar_poblacional=None):
-    n = len(datos)
-    media_muestra = np.mean(datos)
-
-    proceso = "--- Proceso de la Prueba de Medias ---\n"
-    proceso += f"1. Datos de entrada:\n   - Muestra: {datos}\n   - Tamaño de la muestra (n): {n}\n   - Media hipotética (μ₀): {media_hipotetica}\n"
-    proceso += f"2. Cálculo de la media de la muestra (x̄):\n   x̄ = Σ(datos) / n = {media_muestra:.4f}\n"
-
-    if desviacion_estandar_poblacional:
-        # Prueba Z
-        desviacion_estandar_error = desviacion_estandar_poblacional / np.sqrt(n)
-        z_score = (media_muestra - media_hipotetica) / desviacion_estandar_error
-        valor_p = 2 * (1 - norm.cdf(abs(z_score)))
-
-        proceso += f"3. Desviación estándar poblacional conocida (σ = {desviacion_estandar_poblacional:.4f}). Se usa una Prueba Z.\n"
-        proceso += f"4. Cálculo del Error Estándar (σ / √n):\n   Error Estándar = {desviacion_estandar_poblacional:.4f} / √{n} = {desviacion_estandar_error:.4f}\n"
-        proceso += f"5. Cálculo del Estadístico Z:\n   Z = (x̄ - μ₀) / Error Estándar\n   Z = ({media_muestra:.4f} - {media_hipotetica:.4f}) / {desviacion_estandar_error:.4f} = {z_score:.4f}\n"
-        proceso += f"6. Cálculo del Valor p (área bajo la curva Z):\n   Valor p = 2 * P(Z > |{z_score:.4f}|) = {valor_p:.4f}\n\n"
-
-        interpretacion = f"Interpretación:\n- Si el valor p ({valor_p:.4f}) es menor que 0.05, se rechaza la hipótesis nula.\n- Resultado: {'Se rechaza la hipótesis nula. La media de la muestra es significativamente diferente de la media hipotética.' if valor_p < 0.05 else 'No hay evidencia suficiente para rechazar la hipótesis nula. La media de la muestra no es significativamente diferente de la media hipotética.'}"
-
-        return proceso, interpretacion
-    else:
-        # Prueba t
-        desviacion_estandar_muestra = np.std(datos, ddof=1)
-        error_estandar = desviacion_estandar_muestra / np.sqrt(n)
-        t_statistic = (media_muestra - media_hipotetica) / error_estandar
-
-        proceso += f"3. Desviación estándar poblacional desconocida. Se usa una Prueba t.\n"
-        proceso += f"4. Cálculo de la Desviación Estándar de la Muestra (s):\n   s = {desviacion_estandar_muestra:.4f}\n"
-        proceso += f"5. Cálculo del Error Estándar (s / √n):\n   Error Estándar = {desviacion_estandar_muestra:.4f} / √{n} = {error_estandar:.4f}\n"
-        proceso += f"6. Cálculo del Estadístico t:\n   t = (x̄ - μ₀) / Error Estándar\n   t = ({media_muestra:.4f} - {media_hipotetica:.4f}) / {error_estandar:.4f} = {t_statistic:.4f}\n"
-
-        return proceso, "Se ha calculado el estadístico t. Para la interpretación, se compara este valor con el valor crítico de la distribución t de Student."
-
-
-def prueba_de_varianza_proceso(datos, varianza_hipotetica):
-    n = len(datos)
-    varianza_muestra = np.var(datos, ddof=1)
-    grados_libertad = n - 1
-
-    proceso = "--- Proceso de la Prueba de Varianza ---\n"
-    proceso += f"1. Datos de entrada:\n   - Tamaño de la muestra (n): {n}\n   - Varianza hipotética (σ₀²): {varianza_hipotetica}\n"
-    proceso += f"2. Cálculo de la varianza de la muestra (s²):\n   s² = Σ(xi - x̄)² / (n - 1) = {varianza_muestra:.4f}\n"
-    proceso += f"3. Grados de libertad (df):\n   df = n - 1 = {n - 1}\n"
-    proceso += f"4. Cálculo del Estadístico Chi-cuadrado (χ²):\n   χ² = ((n - 1) * s²) / σ₀²\n   χ² = (({n - 1}) * {varianza_muestra:.4f}) / {varianza_hipotetica:.4f} = {(n - 1) * varianza_muestra / varianza_hipotetica:.4f}\n\n"
-
-    chi2_statistic = (n - 1) * varianza_muestra / varianza_hipotetica
-
-    fig, ax = plt.subplots(figsize=(6, 4))
-    x = np.linspace(0, chi2.ppf(0.99, grados_libertad) * 1.5, 100)
-    ax.plot(x, chi2.pdf(x, grados_libertad), 'r-', lw=2, label='Distribución Chi-cuadrado')
-    ax.axvline(chi2_statistic, color='blue', linestyle='--', label=f'Estadístico χ²: {chi2_statistic:.4f}')
-    ax.set_title('Prueba de Varianza Chi-cuadrado')
-    ax.set_xlabel('Valor')
-    ax.set_ylabel('Densidad de Probabilidad')
-    ax.legend()
-    ax.grid(True)
-    plt.tight_layout()
-
-    return proceso, fig
-
-
-def prueba_de_uniformidad_proceso(datos):
-    n = len(datos)
-    datos_ordenados = np.sort(datos)
-
-    proceso = "--- Proceso de la Prueba de Uniformidad (Kolmogorov-Smirnov) ---\n"
-    proceso += f"1. Datos de entrada:\n   - Tamaño de la muestra (n): {n}\n"
-    proceso += f"2. Ordenar los datos de menor a mayor:\n   {np.round(datos_ordenados, 4)}\n"
-
-    diff_sup = [(i + 1) / n - u for i, u in enumerate(datos_ordenados)]
-    diff_inf = [u - i / n for i, u in enumerate(datos_ordenados)]
-
-    estadistico_ks = max(max(diff_sup), max(diff_inf))
-
-    proceso += f"3. Calcular la diferencia absoluta máxima (D):\n   D = max(|CDF Empírica - CDF Teórica|)\n"
-    proceso += f"   - Diferencias superiores: {[f'{d:.4f}' for d in diff_sup]}\n"
-    proceso += f"   - Diferencias inferiores: {[f'{d:.4f}' for d in diff_inf]}\n"
-    proceso += f"   - Estadístico D: {estadistico_ks:.4f}\n"
-
-    estadistico_ks_scipy, valor_p = kstest(datos, 'uniform')  # Usamos scipy para el valor p
-
-    proceso += f"4. El valor p para el Estadístico D ({estadistico_ks:.4f}) es: {valor_p:.4f}\n\n"
-
-    interpretacion = 'Se rechaza la hipótesis de uniformidad. Los datos NO parecen uniformes.' if valor_p < 0.05 else 'No hay evidencia suficiente para rechazar la hipótesis. Los datos parecen uniformes.'
-
-    fig, ax = plt.subplots(figsize=(6, 4))
-    cdf_empirica = np.arange(1, n + 1) / n
-    ax.plot(datos_ordenados, cdf_empirica, label='CDF Empírica', marker='o')
-    ax.plot(np.linspace(0, 1, 100), np.linspace(0, 1, 100), label='CDF Uniforme Teórica', linestyle='--')
-    ax.set_title('Prueba de Uniformidad (Kolmogorov-Smirnov)')
-    ax.set_xlabel('Valor')
-    ax.set_ylabel('Probabilidad Acumulada')
-    ax.legend()
-    ax.grid(True)
-    plt.tight_layout()
-
-    return proceso, interpretacion, fig
-
-
-def generador_cuadrados_medios_proceso(semilla, n_numeros):
-    proceso = "--- Proceso del Algoritmo de Cuadrados Medios ---\n"
-    proceso += f"1. Semilla inicial (X₀): {semilla}\n"
-
-    numeros_generados = []
-    current_semilla = str(semilla).zfill(4)
-    for i in range(n_numeros):
-        cuadrado = int(current_semilla) ** 2
-        cuadrado_str = str(cuadrado).zfill(8)
-        medio = cuadrado_str[2:6]
-
-        proceso += f"2. Iteración {i + 1}:\n"
-        proceso += f"   - Semilla actual: {current_semilla}\n"
-        proceso += f"   - Semilla al cuadrado: {cuadrado_str}\n"
-        proceso += f"   - Números del medio: {medio}\n"
-        proceso += f"   - Número pseudoaleatorio (U{i + 1}): {int(medio) / 10000:.4f}\n\n"
-
-        numeros_generados.append(int(medio) / 10000)
-        current_semilla = medio
-
-    fig, ax = plt.subplots(figsize=(6, 4))
-    ax.hist(numeros_generados, bins=10, edgecolor='black', alpha=0.7)
-    ax.set_title('Histograma de Números Generados')
-    ax.set_xlabel('Valor')
-    ax.set_ylabel('Frecuencia')
-    ax.grid(axis='y', alpha=0.75)
-    plt.tight_layout()
-
-    return proceso, fig
-
-
-def generador_multiplicador_constante_proceso(semilla, a, m, n_numeros):
-    proceso = "--- Proceso del Algoritmo Multiplicador Constante ---\n"
-    proceso += f"1. Parámetros:\n   - Semilla (X₀): {semilla}\n   - Multiplicador (a): {a}\n   - Módulo (m): {m}\n"
-
-    numeros_generados = []
-    xn = semilla
-    for i in range(n_numeros):
-        xn_siguiente = (a * xn) % m
-        u = xn_siguiente / m
-
-        proceso += f"2. Iteración {i + 1}:\n"
-        proceso += f"   - Fórmula: X_{i + 1} = (a * X_{i}) mod m\n"
-        proceso += f"   - Cálculo: X_{i + 1} = ({a} * {xn}) mod {m} = {xn_siguiente}\n"
-        proceso += f"   - Número pseudoaleatorio (U{i + 1}): {xn_siguiente} / {m} = {u:.4f}\n\n"
-
-        numeros_generados.append(u)
-        xn = xn_siguiente
-
-    fig, ax = plt.subplots(figsize=(6, 4))
-    ax.hist(numeros_generados, bins=10, edgecolor='black', alpha=0.7)
-    ax.set_title('Histograma de Números Generados')
-    ax.set_xlabel('Valor')
-    ax.set_ylabel('Frecuencia')
-    ax.grid(axis='y', alpha=0.75)
-    plt.tight_layout()
-
-    return proceso, fig
+from matplotlib.figure import Figure
+
+from calculos import (
+    DIFERIDO,
+    generador_cuadrados_medios_proceso,
+    generador_multiplicador_constante_proceso,
+    prueba_de_medias_proceso,
+    prueba_de_uniformidad_archivo_proceso,
+    prueba_de_uniformidad_proceso,
+    prueba_de_varianza_proceso,
+)
+from cache_resultados import CACHE, clave_de
+from carga import EXTENSIONES, archivo_mapeable, leer_datos
+from graficos import mostrar_png, png_de_lienzo
+from medicion import MEDICION, etapa
+from tareas import Cancelada, ejecutar_en_segundo_plano
+from traza import EXTREMOS, NIVELES, Traza, paginar
 
 
 # --- Lógica de la interfaz gráfica (GUI) ---
@@ -178,8 +29,37 @@ class App(tk.Tk):
         self.geometry("800x650")
         self.style = ttk.Style(self)
         self.style.theme_use('clam')
+        self.tarea = None
+        self.create_status_bar()
         self.create_main_menu()
 
+    def create_status_bar(self):
+        # Barra de estado con la medición opcional de las etapas de cada cálculo.
+        barra = ttk.Frame(self, relief="sunken", padding=(5, 2))
+        barra.pack(side="bottom", fill="x")
+        self.medir_var = tk.BooleanVar(value=MEDICION.activa)
+        ttk.Checkbutton(barra, text="Medir tiempos", variable=self.medir_var,
+                        command=self.cambiar_medicion).pack(side="left")
+        ttk.Button(barra, text="Exportar tiempos…", command=self.exportar_tiempos).pack(side="right")
+        self.tiempos_var = tk.StringVar()
+        ttk.Label(barra, textvariable=self.tiempos_var).pack(side="left", padx=10)
+
+    def cambiar_medicion(self):
+        MEDICION.activa = self.medir_var.get()
+        if not MEDICION.activa:
+            self.tiempos_var.set("")
+
+    def exportar_tiempos(self):
+        if not MEDICION.tramos:
+            messagebox.showinfo("Exportar tiempos", "Todavía no hay tiempos medidos. Activa \"Medir tiempos\" y "
+                                                    "realiza un cálculo.")
+            return
+        ruta = filedialog.asksaveasfilename(
+            title="Exportar tiempos", defaultextension=".json",
+            filetypes=[("Traza de Chrome (chrome://tracing)", "*.trace.json"), ("JSON", "*.json")])
+        if ruta:
+            MEDICION.exportar(ruta)
+
     def create_main_menu(self):
         self.main_frame = ttk.Frame(self, padding="20")
         self.main_frame.pack(fill="both", expand=True)
@@ -246,10 +126,12 @@ class App(tk.Tk):
             widget.destroy()
 
     def volver_al_menu_principal(self):
+        self.abandonar_calculo()
         self.clear_frame(self.main_frame)
         self.create_main_menu()
 
     def show_form(self, title, form_builder_func):
+        self.abandonar_calculo()
         self.clear_frame(self.main_frame)
 
         form_frame = ttk.Frame(self.main_frame)
@@ -263,8 +145,25 @@ class App(tk.Tk):
 
         form_builder_func(input_frame)
 
-        calc_button = ttk.Button(form_frame, text="Calcular y Mostrar", command=self.execute_calculation)
-        calc_button.pack(pady=10)
+        nivel_frame = ttk.Frame(form_frame)
+        nivel_frame.pack(pady=5)
+        ttk.Label(nivel_frame, text="Detalle del proceso:").pack(side="left", padx=5)
+        self.nivel_var = tk.StringVar(value=EXTREMOS)
+        ttk.Combobox(nivel_frame, textvariable=self.nivel_var, values=NIVELES, state="readonly",
+                     width=12).pack(side="left")
+
+        self.calc_button = ttk.Button(form_frame, text="Calcular y Mostrar", command=self.execute_calculation)
+        self.calc_button.pack(pady=10)
+
+        progreso_frame = ttk.Frame(form_frame)
+        progreso_frame.pack(pady=5)
+        self.barra_progreso = ttk.Progressbar(progreso_frame, length=250, maximum=1.0)
+        self.barra_progreso.pack(side="left", padx=5)
+        self.cancel_button = ttk.Button(progreso_frame, text="Cancelar", command=self.cancelar_calculo,
+                                        state="disabled")
+        self.cancel_button.pack(side="left")
+        self.etapa_var = tk.StringVar()
+        ttk.Label(form_frame, textvariable=self.etapa_var).pack()
 
         back_button = ttk.Button(form_frame, text="Volver al menú", command=self.volver_al_menu_principal)
         back_button.pack(pady=5)
@@ -275,20 +174,29 @@ class App(tk.Tk):
         self.process_text = tk.Text(self.result_frame, wrap=tk.WORD, height=15)
         self.process_text.pack(side="left", fill="y", expand=False)
 
-        scrollbar = ttk.Scrollbar(self.result_frame, command=self.process_text.yview)
-        scrollbar.pack(side="left", fill="y")
-        self.process_text.config(yscrollcommand=scrollbar.set)
+        self.scrollbar = ttk.Scrollbar(self.result_frame, command=self.process_text.yview)
+        self.scrollbar.pack(side="left", fill="y")
+        self.process_text.config(yscrollcommand=self.al_desplazar_proceso)
+        self.paginas_proceso = None
+        self.paginas_mostradas = None
 
         self.graph_frame = ttk.Frame(self.result_frame)
         self.graph_frame.pack(side="right", fill="both", expand=True, padx=10)
 
+        # Una sola figura y un solo lienzo por vista: cada cálculo redibuja sobre ellos.
+        self.fig = Figure(figsize=(6, 4))
+        self.canvas = FigureCanvasTkAgg(self.fig, master=self.graph_frame)
+        self.canvas.get_tk_widget().pack(fill="both", expand=True)
+
         self.current_title = title
 
     # --- Formularios dinámicos ---
     def show_media_test_form(self, input_frame):
-        ttk.Label(input_frame, text="Datos (separados por coma):").grid(row=0, column=0, padx=5, pady=5, sticky="e")
+        ttk.Label(input_frame, text="Datos (separados por coma) o archivo:").grid(row=0, column=0, padx=5, pady=5,
+                                                                               sticky="e")
         self.entry_datos = ttk.Entry(input_frame, width=40)
         self.entry_datos.grid(row=0, column=1, padx=5, pady=5, sticky="w")
+        self.agregar_boton_archivo(input_frame, self.entry_datos)
 
         ttk.Label(input_frame, text="Media Hipotética (μ₀):").grid(row=1, column=0, padx=5, pady=5, sticky="e")
         self.entry_media_h = ttk.Entry(input_frame, width=10)
@@ -300,18 +208,34 @@ class App(tk.Tk):
         self.entry_desv_pob.grid(row=2, column=1, padx=5, pady=5, sticky="w")
 
     def show_varianza_test_form(self, input_frame):
-        ttk.Label(input_frame, text="Datos (separados por coma):").grid(row=0, column=0, padx=5, pady=5, sticky="e")
+        ttk.Label(input_frame, text="Datos (separados por coma) o archivo:").grid(row=0, column=0, padx=5, pady=5,
+                                                                               sticky="e")
         self.entry_datos_var = ttk.Entry(input_frame, width=40)
         self.entry_datos_var.grid(row=0, column=1, padx=5, pady=5, sticky="w")
+        self.agregar_boton_archivo(input_frame, self.entry_datos_var)
 
         ttk.Label(input_frame, text="Varianza Hipotética (σ₀²):").grid(row=1, column=0, padx=5, pady=5, sticky="e")
         self.entry_varianza_h = ttk.Entry(input_frame, width=10)
         self.entry_varianza_h.grid(row=1, column=1, padx=5, pady=5, sticky="w")
 
     def show_uniformidad_test_form(self, input_frame):
-        ttk.Label(input_frame, text="Datos (separados por coma):").grid(row=0, column=0, padx=5, pady=5, sticky="e")
+        ttk.Label(input_frame, text="Datos (separados por coma) o archivo:").grid(row=0, column=0, padx=5, pady=5,
+                                                                               sticky="e")
         self.entry_datos_unif = ttk.Entry(input_frame, width=40)
         self.entry_datos_unif.grid(row=0, column=1, padx=5, pady=5, sticky="w")
+        self.agregar_boton_archivo(input_frame, self.entry_datos_unif)
+
+    def agregar_boton_archivo(self, input_frame, entry):
+        # La ruta elegida reemplaza al texto; el archivo se lee en segundo plano al calcular.
+        def buscar():
+            ruta = filedialog.askopenfilename(
+                title="Archivo de muestras",
+                filetypes=[("Muestras", " ".join("*" + e for e in EXTENSIONES)), ("Todos", "*.*")])
+            if ruta:
+                entry.delete(0, tk.END)
+                entry.insert(0, ruta)
+
+        ttk.Button(input_frame, text="Buscar archivo…", command=buscar).grid(row=0, column=2, padx=5, pady=5)
 
     def show_cm_form(self, input_frame):
         ttk.Label(input_frame, text="Semilla (4 dígitos):").grid(row=0, column=0, padx=5, pady=5, sticky="e")
@@ -335,63 +259,266 @@ class App(tk.Tk):
         self.entry_lcg_m = ttk.Entry(input_frame, width=10)
         self.entry_lcg_m.grid(row=2, column=1, padx=5, pady=5, sticky="w")
 
-        ttk.Label(input_frame, text="Cantidad de Números:").grid(row=3, column=0, padx=5, pady=5, sticky="e")
+        # Incremento vacío o 0: multiplicador constante; distinto de 0: congruencial mixto.
+        ttk.Label(input_frame, text="Incremento (c):").grid(row=3, column=0, padx=5, pady=5, sticky="e")
+        self.entry_lcg_c = ttk.Entry(input_frame, width=10)
+        self.entry_lcg_c.grid(row=3, column=1, padx=5, pady=5, sticky="w")
+
+        ttk.Label(input_frame, text="Cantidad de Números:").grid(row=4, column=0, padx=5, pady=5, sticky="e")
         self.entry_lcg_n = ttk.Entry(input_frame, width=10)
-        self.entry_lcg_n.grid(row=3, column=1, padx=5, pady=5, sticky="w")
+        self.entry_lcg_n.grid(row=4, column=1, padx=5, pady=5, sticky="w")
 
     # --- Lógica de Ejecución Centralizada ---
     def execute_calculation(self):
-        try:
-            self.clear_frame(self.graph_frame)
-            self.process_text.delete(1.0, tk.END)
-
-            if self.current_title == "Prueba de Medias":
-                datos = np.array([float(x.strip()) for x in self.entry_datos.get().split(',')])
-                media_h = float(self.entry_media_h.get())
-                desv_pob_str = self.entry_desv_pob.get()
-                desv_pob = float(desv_pob_str) if desv_pob_str else None
-                proceso, interpretacion = prueba_de_medias_proceso(datos, media_h, desv_pob)
-                self.process_text.insert(tk.END, proceso)
-                self.process_text.insert(tk.END, interpretacion)
-
-            elif self.current_title == "Prueba de Varianza":
-                datos = np.array([float(x.strip()) for x in self.entry_datos_var.get().split(',')])
-                varianza_h = float(self.entry_varianza_h.get())
-                proceso, fig = prueba_de_varianza_proceso(datos, varianza_h)
-                self.process_text.insert(tk.END, proceso)
-                self.show_graph(fig)
-
-            elif self.current_title == "Prueba de Uniformidad":
-                datos = np.array([float(x.strip()) for x in self.entry_datos_unif.get().split(',')])
-                proceso, interpretacion, fig = prueba_de_uniformidad_proceso(datos)
-                self.process_text.insert(tk.END, proceso)
-                self.process_text.insert(tk.END, interpretacion)
-                self.show_graph(fig)
-
-            elif self.current_title == "Cuadrados Medios":
-                semilla = int(self.entry_cm_semilla.get())
-                n_numeros = int(self.entry_cm_n.get())
-                proceso, fig = generador_cuadrados_medios_proceso(semilla, n_numeros)
-                self.process_text.insert(tk.END, proceso)
-                self.show_graph(fig)
-
-            elif self.current_title == "Multiplicador Constante":
-                semilla = int(self.entry_lcg_semilla.get())
-                a = int(self.entry_lcg_a.get())
-                m = int(self.entry_lcg_m.get())
-                n_numeros = int(self.entry_lcg_n.get())
-                proceso, fig = generador_multiplicador_constante_proceso(semilla, a, m, n_numeros)
-                self.process_text.insert(tk.END, proceso)
-                self.show_graph(fig)
-
-        except Exception as e:
-            messagebox.showerror("Error de Entrada",
-                                 f"Hubo un error con tus datos.\nPor favor, verifica que los datos sean correctos.\nError: {e}")
-
-    def show_graph(self, fig):
-        canvas = FigureCanvasTkAgg(fig, master=self.graph_frame)
-        canvas.draw()
-        canvas.get_tk_widget().pack(fill="both", expand=True)
+        if self.tarea is not None:
+            return
+        self.fig.clear()
+        self.canvas.draw_idle()
+        self.process_text.delete(1.0, tk.END)
+        self.paginas_proceso = None
+        self.paginas_mostradas = None
+        # Los valores de los widgets se leen aquí, en el hilo de la interfaz; el
+        # parseo y el cálculo corren en segundo plano, que devuelve solo los datos
+        # del gráfico. El dibujo se hace de vuelta en este hilo, sobre ``self.fig``.
+        MEDICION.nuevo_calculo(self.current_title)
+        nivel = self.nivel_var.get()
+        calcular, entradas = self.preparar_calculo(self.current_title, nivel)
+
+        # Los mismos datos (o el mismo archivo sin modificar) con los mismos
+        # parámetros: se muestra el resultado guardado sin recalcular ni redibujar.
+        clave = clave_de(*entradas, prueba=self.current_title, nivel=nivel)
+        with etapa("caché"):
+            guardado = CACHE.obtener(clave)
+            if guardado is not None:
+                self.mostrar_guardado(guardado)
+        if guardado is not None:
+            self.etapa_var.set("Resultado recuperado de la caché.")
+            if MEDICION.activa:
+                self.tiempos_var.set(MEDICION.resumen())
+            return
+
+        def calcular_y_guardar(progreso):
+            proceso, interpretacion, dibujar = calcular(progreso)
+            # El texto no se formatea aquí: la entrada recibe el que la vista arma al mostrarlo.
+            entrada = {"texto": None, "nivel": nivel, "resultados": proceso.resultados,
+                       "interpretacion": interpretacion, "png": None}
+            return proceso, interpretacion, dibujar, (clave, entrada)
+
+        self.calc_button.config(state="disabled")
+        self.cancel_button.config(state="normal")
+        self.barra_progreso["value"] = 0
+
+        # Las respuestas de una tarea abandonada (el usuario cambió de vista) se ignoran.
+        def al_terminar(resultado):
+            if tarea is self.tarea:
+                self.al_terminar_calculo(resultado)
+
+        def al_fallar(error):
+            if tarea is self.tarea:
+                self.al_fallar_calculo(error)
+
+        tarea = self.tarea = ejecutar_en_segundo_plano(self, calcular_y_guardar, al_terminar, al_fallar,
+                                                       self.al_avanzar_calculo)
+
+    def preparar_calculo(self, titulo, nivel):
+        if titulo == "Prueba de Medias":
+            datos_str, media_str, desv_pob_str = (self.entry_datos.get(), self.entry_media_h.get(),
+                                                  self.entry_desv_pob.get())
+
+            def calcular(progreso):
+                with etapa("lectura de datos"):
+                    datos = leer_datos(datos_str)
+                    media_h = float(media_str)
+                    desv_pob = float(desv_pob_str) if desv_pob_str else None
+                with etapa("cálculo"):
+                    proceso, interpretacion = prueba_de_medias_proceso(datos, media_h, desv_pob, nivel,
+                                                                       progreso=progreso)
+                return proceso, interpretacion, None
+
+            entradas = (datos_str, media_str, desv_pob_str)
+
+        elif titulo == "Prueba de Varianza":
+            datos_str, varianza_str = self.entry_datos_var.get(), self.entry_varianza_h.get()
+
+            def calcular(progreso):
+                with etapa("lectura de datos"):
+                    datos = leer_datos(datos_str)
+                    varianza_h = float(varianza_str)
+                with etapa("cálculo"):
+                    proceso, dibujar = prueba_de_varianza_proceso(datos, varianza_h, nivel, graficar=DIFERIDO,
+                                                                  progreso=progreso)
+                return proceso, "", dibujar
+
+            entradas = (datos_str, varianza_str)
+
+        elif titulo == "Prueba de Uniformidad":
+            datos_str = self.entry_datos_unif.get()
+
+            def calcular(progreso):
+                # Un .npy, .seq o binario crudo se prueba por tramos, sin cargarlo entero.
+                ruta = archivo_mapeable(datos_str)
+                if ruta is not None:
+                    with etapa("cálculo"):
+                        return prueba_de_uniformidad_archivo_proceso(ruta, nivel=nivel, graficar=DIFERIDO,
+                                                                     progreso=progreso)
+                with etapa("lectura de datos"):
+                    datos = leer_datos(datos_str)
+                with etapa("cálculo"):
+                    return prueba_de_uniformidad_proceso(datos, nivel, graficar=DIFERIDO, progreso=progreso)
+
+            entradas = (datos_str,)
+
+        elif titulo == "Cuadrados Medios":
+            semilla_str, n_str = self.entry_cm_semilla.get(), self.entry_cm_n.get()
+
+            def calcular(progreso):
+                with etapa("lectura de datos"):
+                    semilla, n_numeros = int(semilla_str), int(n_str)
+                with etapa("cálculo"):
+                    proceso, dibujar = generador_cuadrados_medios_proceso(semilla, n_numeros, nivel,
+                                                                          progreso=progreso, graficar=DIFERIDO)
+                return proceso, "", dibujar
+
+            entradas = (semilla_str, n_str)
+
+        elif titulo == "Multiplicador Constante":
+            valores = (self.entry_lcg_semilla.get(), self.entry_lcg_a.get(), self.entry_lcg_m.get(),
+                       self.entry_lcg_c.get(), self.entry_lcg_n.get())
+
+            def calcular(progreso):
+                with etapa("lectura de datos"):
+                    semilla, a, m, n_numeros = (int(v) for v in valores[:3] + valores[4:])
+                    c = int(valores[3]) if valores[3].strip() else 0
+                with etapa("cálculo"):
+                    proceso, dibujar = generador_multiplicador_constante_proceso(semilla, a, m, n_numeros, nivel,
+                                                                                 progreso=progreso, c=c,
+                                                                                 graficar=DIFERIDO)
+                return proceso, "", dibujar
+
+            entradas = valores
+
+        return calcular, entradas
+
+    def al_avanzar_calculo(self, progreso):
+        if self.tarea is None or progreso is not self.tarea.progreso:
+            return
+        self.barra_progreso["value"] = progreso.fraccion
+        self.etapa_var.set(progreso.etapa)
+
+    def al_terminar_calculo(self, resultado):
+        self.fin_de_calculo()
+        proceso, interpretacion, dibujar, (clave, entrada) = resultado
+        # La entrada se guarda cuando tiene el texto (completo recién cuando la vista
+        # terminó de recorrer la traza) y, si hay gráfico, el PNG del lienzo.
+        faltan = {"texto", "png"} if dibujar is not None else {"texto"}
+
+        def completar(parte, valor):
+            entrada[parte] = valor
+            faltan.discard(parte)
+            if not faltan:
+                CACHE.guardar(clave, entrada)
+
+        with etapa("texto del proceso"):
+            self.mostrar_proceso(proceso, interpretacion, lambda texto: completar("texto", texto))
+
+        def guardar_figura():
+            # El PNG sale de lo que el lienzo ya dibujó: guardar no cuesta otro dibujo.
+            completar("png", png_de_lienzo(self.canvas))
+
+        with etapa("dibujo"):
+            if dibujar is not None:
+                dibujar(self.fig)
+            self.show_graph(guardar_figura if dibujar is not None else None)
+        if MEDICION.activa:
+            self.tiempos_var.set(MEDICION.resumen())
+
+    def al_fallar_calculo(self, error):
+        self.fin_de_calculo()
+        if isinstance(error, Cancelada):
+            self.etapa_var.set("Cálculo cancelado.")
+            return
+        messagebox.showerror("Error de Entrada",
+                             f"Hubo un error con tus datos.\nPor favor, verifica que los datos sean correctos.\nError: {error}")
+
+    def fin_de_calculo(self):
+        self.tarea = None
+        self.calc_button.config(state="normal")
+        self.cancel_button.config(state="disabled")
+        self.barra_progreso["value"] = 0
+        self.etapa_var.set("")
+
+    def cancelar_calculo(self):
+        if self.tarea is not None:
+            self.tarea.cancelar()
+
+    def abandonar_calculo(self):
+        # Al salir de la vista: se cancela la tarea y ya no se espera su respuesta.
+        self.cancelar_calculo()
+        self.tarea = None
+
+    # --- Volcado del proceso por páginas ---
+    def mostrar_proceso(self, proceso, final="", al_completar=None):
+        # El texto se inserta de a una página; las siguientes se agregan cuando
+        # el usuario llega al final del desplazamiento. Si se pasa ``al_completar``,
+        # las páginas mostradas se conservan y, al llegar al final, se le entrega el
+        # texto entero: así la caché no vuelve a formatear la traza. Un texto que
+        # supera ``CACHE.max_entrada`` no se conserva ni se entrega.
+        self.paginas_proceso = paginar(proceso)
+        self.texto_final = final
+        self.al_completar_proceso = al_completar
+        self.paginas_mostradas = [] if al_completar is not None else None
+        self.largo_mostrado = 0
+        self.cargar_pagina_proceso()
+
+    def cargar_pagina_proceso(self):
+        if self.paginas_proceso is None:
+            return
+        pagina = next(self.paginas_proceso, None)
+        if pagina is None:
+            self.paginas_proceso = None
+            self.process_text.insert(tk.END, self.texto_final)
+            if self.paginas_mostradas is not None:
+                texto = "".join(self.paginas_mostradas)
+                self.paginas_mostradas = None
+                self.al_completar_proceso(texto)
+            return
+        self.process_text.insert(tk.END, pagina)
+        if self.paginas_mostradas is not None:
+            self.largo_mostrado += len(pagina)
+            if self.largo_mostrado > CACHE.max_entrada:
+                self.paginas_mostradas = None
+            else:
+                self.paginas_mostradas.append(pagina)
+
+    def al_desplazar_proceso(self, primero, ultimo):
+        self.scrollbar.set(primero, ultimo)
+        if float(ultimo) >= 1.0 and self.paginas_proceso is not None:
+            self.after_idle(self.cargar_pagina_proceso)
+
+    def mostrar_guardado(self, guardado):
+        proceso = Traza.de_texto(guardado["texto"], guardado["nivel"], guardado["resultados"])
+        self.mostrar_proceso(proceso, guardado["interpretacion"])
+        if guardado["png"] is not None:
+            mostrar_png(guardado["png"], self.fig)
+        self.show_graph()
+
+    def show_graph(self, al_dibujar=None):
+        """
+        Redibuja el lienzo de la vista con lo que haya en ``self.fig``.
+
+        Si se pasa ``al_dibujar``, se llama una sola vez cuando el lienzo termine de dibujar.
+        """
+        if al_dibujar is not None:
+            def una_vez(evento):
+                self.canvas.mpl_disconnect(conexion)
+                al_dibujar()
+
+            conexion = self.canvas.mpl_connect("draw_event", una_vez)
+        if MEDICION.activa:
+            # Al medir se dibuja ya, para que el tramo "dibujo" incluya el costo real.
+            self.canvas.draw()
+        else:
+            self.canvas.draw_idle()
 
 
 if __name__ == "__main__":
@@ -0,0 +1,307 @@
+"""
+Formato binario compacto para guardar secuencias generadas y volver a probarlas.
+
+Uso:
+    python secuencias.py lcg --semilla 12345 --a 16807 --m 2147483647 --n 1000000000 -j 0 lcg.seq
+    python secuencias.py cuadrados-medios --semilla 5735 --n 100000 cm.seq
+    python secuencias.py info lcg.seq
+
+Un archivo .seq guarda los estados enteros X_i (no los U_i): uint16, uint32 o
+uint64 según el mayor estado posible (10^d - 1 o m - 1), así que ocupa 2 a 8
+bytes por número en lugar de un texto como "r1: 0.1234". Empieza con una
+cabecera de ``TAM_CABECERA`` bytes (la marca ``MARCA`` y un JSON con el
+algoritmo, la semilla, a, m, los dígitos, la cantidad, el tipo de los estados y
+el divisor que los normaliza); los estados van a continuación, sin separadores.
+
+Se escribe por bloques y se abre como arreglo mapeado en memoria: leer miles de
+millones de números no los copia ni interpreta texto. ``Secuencia`` entrega los
+U_i = X_i / divisor por tramos, que es lo que esperan las pruebas (K-S por
+archivo, frecuencias por bloques, pruebas en flujo).
+"""
+import argparse
+import json
+import os
+import sys
+import tempfile
+
+import numpy as np
+
+from cuadrados_medios import bloques_estados_cuadrados_medios
+from multiplicador_constante import bloques_estados_lcg, normalizar_estados
+from tareas import informar
+
+EXTENSION = ".seq"
+
+MARCA = b"SECUENC1"
+
+# La cabecera ocupa una página completa: los estados quedan alineados para el mapeo.
+TAM_CABECERA = 4096
+
+VERSION = 1
+
+# Estados por bloque al escribir y al recorrer una secuencia: 8 MB de uint64.
+TAM_BLOQUE = 1 << 20
+
+
+def dtype_estados(maximo):
+    """
+    Tipo entero sin signo más chico que guarda estados de 0 a ``maximo``.
+
+    Raises:
+        ValueError: Si ``maximo`` no cabe en 64 bits.
+    """
+    for dtype in (np.uint16, np.uint32, np.uint64):
+        if maximo <= np.iinfo(dtype).max:
+            return np.dtype(dtype).newbyteorder("<")
+    raise ValueError(f"Los estados hasta {maximo} no caben en 64 bits; no se pueden guardar en {EXTENSION}.")
+
+
+def _codificar_cabecera(cabecera):
+    texto = MARCA + json.dumps(cabecera, ensure_ascii=False).encode()
+    if len(texto) > TAM_CABECERA:
+        raise ValueError(f"Los metadatos de la secuencia ocupan más de {TAM_CABECERA} bytes.")
+    return texto.ljust(TAM_CABECERA, b" ")
+
+
+class EscritorSecuencia:
+    """
+    Escribe una secuencia de estados por bloques, sin tenerla entera en memoria.
+
+    Los bloques van a un archivo temporal junto al destino que se renombra al
+    cerrar, así que un .seq siempre está completo. Se usa con ``with``: si hay
+    una excepción el temporal se borra.
+
+    Args:
+        ruta (str): Archivo de destino.
+        maximo (int): Mayor estado posible; decide el tipo (uint16, uint32 o uint64).
+        divisor (int): Los números se leen como U_i = X_i / divisor.
+        algoritmo (str): "lcg", "cuadrados_medios", ...
+        **parametros: Semilla, a, m, dígitos, etc.; se guardan en la cabecera.
+    """
+
+    def __init__(self, ruta, maximo, divisor, algoritmo, **parametros):
+        self.ruta = ruta
+        self.dtype = dtype_estados(maximo)
+        self.cabecera = {"version": VERSION, "algoritmo": algoritmo, **parametros,
+                         "cantidad": 0, "dtype": self.dtype.str, "divisor": divisor}
+        _codificar_cabecera(self.cabecera)
+        descriptor, self._temporal = tempfile.mkstemp(dir=os.path.dirname(os.path.abspath(ruta)), suffix=".tmp")
+        self._archivo = os.fdopen(descriptor, "wb")
+        self._archivo.write(bytes(TAM_CABECERA))
+
+    def escribir(self, estados):
+        """Agrega un bloque de estados (cualquier tipo entero, u object con enteros de Python)."""
+        bloque = np.asarray(estados)
+        if bloque.dtype == object:
+            bloque = bloque.astype(np.uint64)
+        self._archivo.write(np.ascontiguousarray(bloque, dtype=self.dtype).data)
+        self.cabecera["cantidad"] += len(bloque)
+
+    def cerrar(self):
+        self._archivo.seek(0)
+        self._archivo.write(_codificar_cabecera(self.cabecera))
+        self._archivo.close()
+        os.replace(self._temporal, self.ruta)
+
+    def descartar(self):
+        self._archivo.close()
+        os.remove(self._temporal)
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, tipo, *error):
+        if tipo is None:
+            self.cerrar()
+        else:
+            self.descartar()
+        return False
+
+
+def guardar_estados(ruta, bloques, maximo, divisor, algoritmo, total=None, progreso=None, **parametros):
+    """
+    Guarda los bloques de estados de un generador en un archivo .seq.
+
+    Args:
+        bloques: Iterable de bloques de estados enteros.
+        total (int): Cantidad esperada, solo para informar el avance.
+        progreso (Progreso): Opcional; se informa el avance después de cada bloque.
+
+    Returns:
+        dict: La cabecera escrita.
+    """
+    with EscritorSecuencia(ruta, maximo, divisor, algoritmo, **parametros) as escritor:
+        for bloque in bloques:
+            escritor.escribir(bloque)
+            if total:
+                informar(progreso, escritor.cabecera["cantidad"] / total)
+    return escritor.cabecera
+
+
+def guardar_lcg(ruta, semilla, a, m, n_numeros, tam_bloque=TAM_BLOQUE, progreso=None):
+    """Genera y guarda los estados X_1 .. X_n del multiplicador constante (U_i = X_i / m)."""
+    return guardar_estados(ruta, bloques_estados_lcg(semilla, a, m, n_numeros, tam_bloque), m - 1, m, "lcg",
+                           n_numeros, progreso, semilla=semilla, a=a, m=m)
+
+
+def guardar_cuadrados_medios(ruta, semilla, n_numeros, num_of_digits, tam_bloque=TAM_BLOQUE, progreso=None):
+    """Genera y guarda los estados X_1 .. X_n de cuadrados medios (U_i = X_i / 10^d)."""
+    if num_of_digits % 2 != 0:
+        raise ValueError("El número de dígitos debe ser par.")
+    bloques = bloques_estados_cuadrados_medios(semilla, n_numeros, num_of_digits, tam_bloque)
+    return guardar_estados(ruta, bloques, 10 ** num_of_digits - 1, 10 ** num_of_digits, "cuadrados_medios",
+                           n_numeros, progreso, semilla=semilla, digitos=num_of_digits)
+
+
+def crear_secuencia(ruta, cantidad, maximo, divisor, algoritmo, **parametros):
+    """
+    Crea un archivo .seq de ``cantidad`` estados en cero, para llenarlo en su lugar.
+
+    Sirve para escribir desde varios procesos a la vez: cada uno abre
+    ``np.memmap(ruta, dtype=cabecera["dtype"], mode="r+", offset=TAM_CABECERA,
+    shape=(cantidad,))`` y escribe su tramo.
+
+    Returns:
+        dict: La cabecera escrita.
+    """
+    dtype = dtype_estados(maximo)
+    cabecera = {"version": VERSION, "algoritmo": algoritmo, **parametros,
+                "cantidad": cantidad, "dtype": dtype.str, "divisor": divisor}
+    with open(ruta, "wb") as archivo:
+        archivo.write(_codificar_cabecera(cabecera))
+        archivo.truncate(TAM_CABECERA + cantidad * dtype.itemsize)
+    return cabecera
+
+
+def leer_cabecera(ruta):
+    """
+    Lee y valida la cabecera de un archivo .seq.
+
+    Raises:
+        ValueError: Si no es un archivo de secuencia o está incompleto.
+    """
+    with open(ruta, "rb") as archivo:
+        bloque = archivo.read(TAM_CABECERA)
+    if len(bloque) < TAM_CABECERA or not bloque.startswith(MARCA):
+        raise ValueError(f"'{ruta}' no es un archivo de secuencia {EXTENSION}.")
+    try:
+        cabecera = json.loads(bloque[len(MARCA):].decode())
+    except ValueError:
+        raise ValueError(f"La cabecera de '{ruta}' está dañada.") from None
+    if cabecera.get("version", 0) > VERSION:
+        raise ValueError(f"'{ruta}' usa una versión más nueva del formato ({cabecera['version']}).")
+    esperado = TAM_CABECERA + cabecera["cantidad"] * np.dtype(cabecera["dtype"]).itemsize
+    if os.path.getsize(ruta) != esperado:
+        raise ValueError(f"'{ruta}' está incompleto: la cabecera indica {cabecera['cantidad']} estados.")
+    return cabecera
+
+
+class Secuencia:
+    """
+    Secuencia guardada, abierta como arreglo mapeado en memoria (de solo lectura).
+
+    Se comporta como un arreglo de los números U_i: ``len``, tramos
+    (``secuencia[a:b]`` devuelve float64) y ``np.asarray(secuencia)``; cada tramo
+    se normaliza al pedirlo, así que nunca hay una copia completa en float64.
+
+    Atributos:
+        cabecera (dict): Metadatos del archivo.
+        estados (np.ndarray): Los estados enteros, mapeados sin copiarlos.
+        divisor (int): U_i = X_i / divisor.
+    """
+
+    def __init__(self, ruta):
+        self.ruta = ruta
+        self.cabecera = leer_cabecera(ruta)
+        self.divisor = self.cabecera["divisor"]
+        dtype = np.dtype(self.cabecera["dtype"])
+        if self.cabecera["cantidad"]:
+            self.estados = np.memmap(ruta, dtype=dtype, mode="r", offset=TAM_CABECERA,
+                                     shape=(self.cabecera["cantidad"],))
+        else:
+            self.estados = np.empty(0, dtype=dtype)
+
+    def __len__(self):
+        return len(self.estados)
+
+    def __getitem__(self, indice):
+        if isinstance(indice, slice):
+            return normalizar_estados(self.estados[indice], self.divisor)
+        return float(normalizar_estados(np.atleast_1d(self.estados[indice]), self.divisor)[0])
+
+    def __str__(self):
+        # Como un arreglo largo de NumPy, pero leyendo solo los extremos.
+        extremos = np.get_printoptions()["edgeitems"]
+        if len(self) <= 2 * extremos:
+            return str(self[:])
+        return f"{str(self[:extremos])[:-1]} ... {str(self[-extremos:])[1:]}"
+
+    def __array__(self, dtype=None, copy=None):
+        numeros = self[:]
+        return numeros if dtype is None else numeros.astype(dtype, copy=False)
+
+    def bloques(self, tam_bloque=TAM_BLOQUE):
+        """
+        Yields:
+            np.ndarray: Tramos float64 consecutivos de a lo sumo ``tam_bloque`` números.
+        """
+        for inicio in range(0, len(self), tam_bloque):
+            yield self[inicio:inicio + tam_bloque]
+
+
+def abrir_secuencia(ruta):
+    """Abre un archivo .seq (ver ``Secuencia``)."""
+    return Secuencia(ruta)
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Guarda secuencias generadas en formato .seq o muestra su cabecera.")
+    comandos = parser.add_subparsers(dest="comando", required=True)
+
+    lcg = comandos.add_parser("lcg", help="Multiplicador constante: X_{i+1} = (a * X_i) mod m.")
+    lcg.add_argument("--semilla", type=int, required=True)
+    lcg.add_argument("--a", type=int, required=True)
+    lcg.add_argument("--m", type=int, required=True)
+    lcg.add_argument("--n", type=int, required=True, help="Cantidad de números.")
+    lcg.add_argument("--procesos", "-j", type=int, default=1,
+                     help="Procesos que escriben tramos del archivo a la vez (0 = uno por núcleo). Por defecto 1.")
+    lcg.add_argument("salida")
+
+    cm = comandos.add_parser("cuadrados-medios", help="Método de los cuadrados medios.")
+    cm.add_argument("--semilla", type=int, required=True)
+    cm.add_argument("--digitos", type=int, default=None,
+                    help="Ancho de los estados (por defecto, los dígitos de la semilla).")
+    cm.add_argument("--n", type=int, required=True, help="Cantidad de números.")
+    cm.add_argument("salida")
+
+    info = comandos.add_parser("info", help="Muestra la cabecera y los primeros números de un archivo .seq.")
+    info.add_argument("archivo")
+    args = parser.parse_args(argv)
+
+    try:
+        if args.comando == "lcg":
+            if args.procesos == 1:
+                cabecera = guardar_lcg(args.salida, args.semilla, args.a, args.m, args.n)
+            else:
+                from lcg_paralelo import guardar_lcg_paralelo
+
+                cabecera = guardar_lcg_paralelo(args.salida, args.semilla, args.a, args.m, args.n,
+                                                args.procesos or None)
+        elif args.comando == "cuadrados-medios":
+            cabecera = guardar_cuadrados_medios(args.salida, args.semilla, args.n,
+                                                args.digitos or len(str(args.semilla)))
+        else:
+            secuencia = abrir_secuencia(args.archivo)
+            for clave, valor in secuencia.cabecera.items():
+                print(f"{clave}: {valor}")
+            print("primeros números:", ", ".join(f"{u:.4f}" for u in secuencia[:10]))
+            return 0
+    except (OSError, ValueError) as e:
+        print(f"Error: {e}", file=sys.stderr)
+        return 1
+    print(f"{cabecera['cantidad']:,} estados ({cabecera['dtype']}) guardados en {args.salida}")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
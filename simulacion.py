@@ -0,0 +1,204 @@
+"""
+Simulación Monte Carlo del tamaño y la potencia empíricos de las pruebas.
+
+Uso:
+    python simulacion.py --n 100 --replicas 100000
+    python simulacion.py --n 100 --replicas 100000 --distribucion beta --parametros a=1.2 b=1
+
+Se generan R réplicas de n muestras como un arreglo R × n y cada estadístico
+(Z/t de medias, Chi-cuadrado de varianza, D de Kolmogorov-Smirnov) se calcula
+a lo largo del eje 1 en una sola operación vectorizada. Las réplicas se reparten
+en tandas de tamaño fijo entre los procesos de un pool; cada tanda recibe su
+propia semilla derivada de ``SeedSequence``, así que el resultado es el mismo
+sin importar la cantidad de procesos.
+"""
+import argparse
+import sys
+from concurrent.futures import ProcessPoolExecutor
+
+import numpy as np
+
+from kolmogorov import estadistico_ks_ordenado
+from valores_criticos import valor_critico
+
+PRUEBAS = ("medias", "varianza", "ks")
+
+# Elementos (réplicas × n) por tanda: unos 32 MB de float64.
+TAM_TANDA = 1 << 22
+
+
+def estadisticos_medias(muestras, media_hipotetica=0.5, desviacion_estandar_poblacional=None):
+    """Estadístico Z (σ conocida) o t de cada réplica (fila)."""
+    n = muestras.shape[1]
+    medias = muestras.mean(axis=1)
+    if desviacion_estandar_poblacional:
+        return (medias - media_hipotetica) / (desviacion_estandar_poblacional / np.sqrt(n))
+    return (medias - media_hipotetica) / (muestras.std(axis=1, ddof=1) / np.sqrt(n))
+
+
+def estadisticos_varianza(muestras, varianza_hipotetica=1 / 12):
+    """Estadístico χ² = (n - 1) s² / σ₀² de cada réplica."""
+    n = muestras.shape[1]
+    return (n - 1) * muestras.var(axis=1, ddof=1) / varianza_hipotetica
+
+
+def estadisticos_ks(muestras):
+    """Estadístico D de Kolmogorov-Smirnov contra la U(0, 1) de cada réplica (ordena en el lugar)."""
+    muestras.sort(axis=1)
+    return estadistico_ks_ordenado(muestras)[0]
+
+
+def valores_criticos_pruebas(n, alpha=0.05, desviacion_estandar_poblacional=None, pruebas=PRUEBAS):
+    """
+    Regiones de rechazo de cada prueba para tamaño n y nivel alpha.
+
+    Returns:
+        dict: Para cada prueba, (límite inferior, límite superior) del estadístico
+        fuera de los cuales se rechaza H0 (medias y varianza bilaterales, K-S de cola superior).
+    """
+    limites = {}
+    if "medias" in pruebas:
+        if desviacion_estandar_poblacional:
+            critico = valor_critico("norm", alpha / 2)
+        else:
+            critico = valor_critico("t", alpha / 2, n - 1)
+        limites["medias"] = (-critico, critico)
+    if "varianza" in pruebas:
+        limites["varianza"] = (valor_critico("chi2", 1 - alpha / 2, n - 1), valor_critico("chi2", alpha / 2, n - 1))
+    if "ks" in pruebas:
+        from scipy.stats import kstwo
+
+        limites["ks"] = (-np.inf, float(kstwo.isf(alpha, n)))
+    return limites
+
+
+def _simular_tanda(tarea):
+    semilla, replicas, n, distribucion, parametros, configuracion, limites = tarea
+    rng = np.random.default_rng(semilla)
+    muestras = getattr(rng, distribucion)(size=(replicas, n), **parametros)
+
+    rechazos = {}
+    for prueba, (inferior, superior) in limites.items():
+        if prueba == "medias":
+            estadisticos = estadisticos_medias(muestras, configuracion["media_hipotetica"],
+                                               configuracion["desviacion_estandar_poblacional"])
+        elif prueba == "varianza":
+            estadisticos = estadisticos_varianza(muestras, configuracion["varianza_hipotetica"])
+        else:
+            estadisticos = estadisticos_ks(muestras)
+        rechazos[prueba] = int(np.count_nonzero((estadisticos < inferior) | (estadisticos > superior)))
+    return rechazos
+
+
+def intervalo_wilson(rechazos, replicas, confianza=0.95):
+    """Intervalo de confianza de Wilson para una proporción de rechazos."""
+    z = valor_critico("norm", (1 - confianza) / 2)
+    p = rechazos / replicas
+    centro = (p + z * z / (2 * replicas)) / (1 + z * z / replicas)
+    radio = z * np.sqrt(p * (1 - p) / replicas + z * z / (4 * replicas ** 2)) / (1 + z * z / replicas)
+    return max(0.0, centro - radio), min(1.0, centro + radio)
+
+
+def simular(n, replicas, distribucion="uniform", parametros=None, alpha=0.05, media_hipotetica=0.5,
+            desviacion_estandar_poblacional=None, varianza_hipotetica=1 / 12, pruebas=PRUEBAS,
+            semilla=0, procesos=None, confianza=0.95):
+    """
+    Estima la tasa de rechazo de cada prueba por Monte Carlo.
+
+    Bajo H0 (por defecto, muestras U(0, 1)) la tasa estima el tamaño real de la
+    prueba; con otra distribución, su potencia frente a esa alternativa.
+
+    Args:
+        n (int): Tamaño de cada muestra.
+        replicas (int): Cantidad de réplicas (R).
+        distribucion (str): Método de ``numpy.random.Generator`` que genera las
+            muestras (``"uniform"``, ``"beta"``, ``"normal"``, ...).
+        parametros (dict): Argumentos de ese método, sin ``size``.
+        pruebas (tuple): Subconjunto de ``PRUEBAS``.
+        semilla (int): Semilla raíz; el resultado no depende de ``procesos``.
+        procesos (int): Procesos del pool (1 = sin pool).
+        confianza (float): Nivel de los intervalos de confianza de las tasas.
+
+    Returns:
+        dict: Para cada prueba, ``rechazos``, ``replicas``, ``tasa``, ``ic_inf`` e ``ic_sup``.
+    """
+    if n < 2:
+        raise ValueError("El tamaño de muestra (n) debe ser al menos 2.")
+    if replicas <= 0:
+        raise ValueError("La cantidad de réplicas debe ser positiva.")
+    desconocidas = set(pruebas) - set(PRUEBAS)
+    if desconocidas:
+        raise ValueError(f"Pruebas desconocidas: {sorted(desconocidas)}. Deben ser de {PRUEBAS}.")
+
+    limites = valores_criticos_pruebas(n, alpha, desviacion_estandar_poblacional, pruebas)
+    configuracion = {
+        "media_hipotetica": media_hipotetica,
+        "desviacion_estandar_poblacional": desviacion_estandar_poblacional,
+        "varianza_hipotetica": varianza_hipotetica,
+    }
+    # El reparto en tandas depende solo de (replicas, n), nunca de los procesos.
+    por_tanda = max(1, TAM_TANDA // n)
+    tamanos = [min(por_tanda, replicas - inicio) for inicio in range(0, replicas, por_tanda)]
+    semillas = np.random.SeedSequence(semilla).spawn(len(tamanos))
+    tareas = [(s, r, n, distribucion, parametros or {}, configuracion, limites) for s, r in zip(semillas, tamanos)]
+
+    if procesos == 1 or len(tareas) == 1:
+        parciales = map(_simular_tanda, tareas)
+        totales = _sumar(parciales, limites)
+    else:
+        with ProcessPoolExecutor(max_workers=procesos) as pool:
+            totales = _sumar(pool.map(_simular_tanda, tareas), limites)
+
+    resultado = {}
+    for prueba, rechazos in totales.items():
+        ic_inf, ic_sup = intervalo_wilson(rechazos, replicas, confianza)
+        resultado[prueba] = {"rechazos": rechazos, "replicas": replicas, "tasa": rechazos / replicas,
+                             "ic_inf": ic_inf, "ic_sup": ic_sup}
+    return resultado
+
+
+def _sumar(parciales, limites):
+    totales = dict.fromkeys(limites, 0)
+    for parcial in parciales:
+        for prueba, rechazos in parcial.items():
+            totales[prueba] += rechazos
+    return totales
+
+
+def _parametro(texto):
+    nombre, _, valor = texto.partition("=")
+    if not valor:
+        raise argparse.ArgumentTypeError(f"Parámetro inválido '{texto}': se espera nombre=valor.")
+    return nombre, float(valor)
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Tamaño y potencia empíricos de las pruebas por Monte Carlo.")
+    parser.add_argument("--n", type=int, required=True, help="Tamaño de cada muestra.")
+    parser.add_argument("--replicas", "-R", type=int, default=10000, help="Cantidad de réplicas. Por defecto 10000.")
+    parser.add_argument("--distribucion", default="uniform",
+                        help="Método de numpy.random.Generator que genera las muestras. Por defecto uniform (H0).")
+    parser.add_argument("--parametros", nargs="*", type=_parametro, default=[],
+                        help="Parámetros de la distribución como nombre=valor (p. ej. a=1.2 b=1).")
+    parser.add_argument("--alpha", type=float, default=0.05, help="Nivel de significancia. Por defecto 0.05.")
+    parser.add_argument("--media", type=float, default=0.5, help="Media hipotética (μ₀). Por defecto 0.5.")
+    parser.add_argument("--sigma", type=float, default=None,
+                        help="Desviación estándar poblacional (σ). Si se omite, se usa una prueba t.")
+    parser.add_argument("--varianza", type=float, default=1 / 12, help="Varianza hipotética (σ₀²). Por defecto 1/12.")
+    parser.add_argument("--pruebas", nargs="+", choices=PRUEBAS, default=list(PRUEBAS))
+    parser.add_argument("--semilla", type=int, default=0, help="Semilla raíz. Por defecto 0.")
+    parser.add_argument("--procesos", "-j", type=int, default=None, help="Procesos en paralelo (por defecto, uno por núcleo).")
+    args = parser.parse_args(argv)
+
+    resultado = simular(args.n, args.replicas, args.distribucion, dict(args.parametros), args.alpha, args.media,
+                        args.sigma, args.varianza, tuple(args.pruebas), args.semilla, args.procesos)
+    print(f"Distribución: {args.distribucion} {dict(args.parametros)}, n = {args.n}, "
+          f"R = {args.replicas}, α = {args.alpha}")
+    for prueba, r in resultado.items():
+        print(f"  {prueba:<9} tasa de rechazo = {r['tasa']:.4f}  IC 95%: [{r['ic_inf']:.4f}, {r['ic_sup']:.4f}]"
+              f"  ({r['rechazos']}/{r['replicas']})")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,147 @@
+import threading
+
+# --- Cálculos en segundo plano con progreso y cancelación ---
+#
+# Las interfaces corrían el parseo, el cálculo y el gráfico dentro del ciclo de
+# eventos de Tk, así que una entrada grande congelaba la ventana. Aquí el
+# cálculo corre en un hilo aparte (NumPy libera el GIL en las operaciones
+# vectorizadas) y la interfaz consulta su avance con ``after()``. Los cálculos
+# largos reciben un ``Progreso``: informan cuánto llevan y, en cada punto de
+# control, se detienen con ``Cancelada`` si el usuario pidió cancelar.
+
+
+class Cancelada(Exception):
+    """El usuario canceló el cálculo."""
+
+
+class Progreso:
+    """
+    Avance compartido entre el hilo del cálculo y el de la interfaz.
+
+    Atributos:
+        fraccion (float): Parte ya hecha, entre 0 y 1.
+        etapa (str): Descripción de lo que se está haciendo.
+    """
+
+    def __init__(self):
+        self.fraccion = 0.0
+        self.etapa = ""
+        self._cancelar = threading.Event()
+
+    def cancelar(self):
+        self._cancelar.set()
+
+    @property
+    def cancelado(self):
+        return self._cancelar.is_set()
+
+    def verificar(self):
+        """Punto de control: lanza ``Cancelada`` si se pidió cancelar."""
+        if self._cancelar.is_set():
+            raise Cancelada()
+
+    def informar(self, fraccion, etapa=None):
+        """Actualiza el avance (y es también un punto de control)."""
+        self.verificar()
+        self.fraccion = min(max(fraccion, 0.0), 1.0)
+        if etapa is not None:
+            self.etapa = etapa
+
+    def tramo(self, inicio, fin, etapa=None):
+        """Vista que traduce el avance [0, 1] de un paso al tramo [inicio, fin] del total."""
+        if etapa is not None:
+            self.informar(inicio, etapa)
+        return _Tramo(self, inicio, fin)
+
+
+class _Tramo:
+    def __init__(self, padre, inicio, fin):
+        self.padre = padre
+        self.inicio = inicio
+        self.fin = fin
+
+    @property
+    def cancelado(self):
+        return self.padre.cancelado
+
+    def verificar(self):
+        self.padre.verificar()
+
+    def informar(self, fraccion, etapa=None):
+        self.padre.informar(self.inicio + (self.fin - self.inicio) * fraccion, etapa)
+
+    def tramo(self, inicio, fin, etapa=None):
+        ancho = self.fin - self.inicio
+        return self.padre.tramo(self.inicio + ancho * inicio, self.inicio + ancho * fin, etapa)
+
+
+def informar(progreso, fraccion, etapa=None):
+    """Atajo para las funciones cuyo ``progreso`` es opcional."""
+    if progreso is not None:
+        progreso.informar(fraccion, etapa)
+
+
+def tramo(progreso, inicio, fin, etapa=None):
+    """Como ``Progreso.tramo``, pero acepta ``progreso=None``."""
+    return None if progreso is None else progreso.tramo(inicio, fin, etapa)
+
+
+class TareaEnSegundoPlano:
+    """
+    Corre ``funcion(*args, progreso=..., **kwargs)`` en un hilo aparte.
+
+    Atributos:
+        progreso (Progreso): Avance y cancelación de la tarea.
+        resultado: Lo que devolvió la función (cuando terminó sin error).
+        error (BaseException): La excepción que lanzó, si la hubo.
+    """
+
+    def __init__(self, funcion, *args, **kwargs):
+        self.progreso = Progreso()
+        self.resultado = None
+        self.error = None
+        self._hilo = threading.Thread(target=self._correr, args=(funcion, args, kwargs), daemon=True)
+
+    def _correr(self, funcion, args, kwargs):
+        try:
+            self.resultado = funcion(*args, progreso=self.progreso, **kwargs)
+        except BaseException as e:
+            self.error = e
+
+    def iniciar(self):
+        self._hilo.start()
+        return self
+
+    def cancelar(self):
+        self.progreso.cancelar()
+
+    @property
+    def terminada(self):
+        return not self._hilo.is_alive()
+
+
+def ejecutar_en_segundo_plano(widget, funcion, al_terminar, al_fallar, al_avanzar=None, intervalo=100):
+    """
+    Lanza una tarea y la sigue desde el ciclo de eventos de Tk con ``widget.after``.
+
+    Los callbacks se llaman siempre en el hilo de la interfaz: ``al_avanzar(progreso)``
+    en cada consulta, y al final ``al_terminar(resultado)`` o ``al_fallar(error)``
+    (con ``Cancelada`` si se canceló).
+
+    Returns:
+        TareaEnSegundoPlano: La tarea, para poder cancelarla.
+    """
+    tarea = TareaEnSegundoPlano(funcion).iniciar()
+
+    def sondear():
+        if al_avanzar is not None:
+            al_avanzar(tarea.progreso)
+        if not tarea.terminada:
+            widget.after(intervalo, sondear)
+        elif tarea.error is not None:
+            al_fallar(tarea.error)
+        else:
+            al_terminar(tarea.resultado)
+
+    widget.after(intervalo, sondear)
+    return tarea
@@ -0,0 +1,111 @@
+# --- Traza perezosa del proceso paso a paso ---
+#
+# Los *_proceso armaban el texto con ``proceso += ...`` en cada iteración, lo
+# que es cuadrático y obliga a tener toda la explicación en memoria. Una Traza
+# guarda solo cómo formatear cada paso; el texto se produce al iterarla y, según
+# el nivel de detalle, se omiten los pasos intermedios.
+
+RESUMEN = "resumen"
+EXTREMOS = "extremos"
+COMPLETO = "completo"
+
+NIVELES = (RESUMEN, EXTREMOS, COMPLETO)
+
+PASOS_EXTREMOS = 10
+
+
+class Traza:
+    """
+    Explicación paso a paso que se genera de forma perezosa.
+
+    Args:
+        nivel (str): ``RESUMEN`` (sin pasos), ``EXTREMOS`` (primeros y últimos
+            ``extremos`` pasos) o ``COMPLETO`` (todos los pasos).
+        extremos (int): Cantidad de pasos a mostrar al principio y al final en ``EXTREMOS``.
+    """
+
+    def __init__(self, nivel=COMPLETO, extremos=PASOS_EXTREMOS):
+        if nivel not in NIVELES:
+            raise ValueError(f"El nivel de detalle debe ser uno de {NIVELES}.")
+        self.nivel = nivel
+        self.extremos = extremos
+        self._segmentos = []
+        # Valores numéricos calculados durante el proceso (estadístico, valor p, ...).
+        self.resultados = {}
+
+    def texto(self, texto):
+        """Agrega un fragmento de texto fijo."""
+        self._segmentos.append(texto)
+        return self
+
+    def pasos(self, n, formatear, separador="", omitidos="   ... ({} pasos omitidos) ...\n"):
+        """
+        Agrega una sección de n pasos; ``formatear(i)`` devuelve el texto del paso i.
+
+        Los pasos no se formatean hasta que la traza se recorre. ``omitidos`` es
+        el texto que reemplaza a los pasos que el nivel de detalle deja afuera.
+        """
+        self._segmentos.append((n, formatear, separador, omitidos))
+        return self
+
+    def _indices(self, n):
+        if self.nivel == COMPLETO or n <= 2 * self.extremos:
+            return range(n), None
+        if self.nivel == RESUMEN:
+            return range(0), None
+        return range(self.extremos), range(n - self.extremos, n)
+
+    def __iter__(self):
+        for segmento in self._segmentos:
+            if isinstance(segmento, str):
+                yield segmento
+                continue
+            n, formatear, separador, omitidos = segmento
+            inicio, final = self._indices(n)
+            escritos = 0
+            for i in inicio:
+                yield (separador if escritos else "") + formatear(i)
+                escritos += 1
+            mostrados = len(inicio) + (len(final) if final is not None else 0)
+            if mostrados < n:
+                yield (separador if escritos else "") + omitidos.format(n - mostrados)
+                escritos += 1
+            for i in final or ():
+                yield (separador if escritos else "") + formatear(i)
+                escritos += 1
+
+    def paginas(self, tam_pagina=20000):
+        """Agrupa el texto en páginas de aproximadamente ``tam_pagina`` caracteres."""
+        return paginar(self, tam_pagina)
+
+    def __str__(self):
+        return "".join(self)
+
+    @classmethod
+    def de_texto(cls, texto, nivel=COMPLETO, resultados=None):
+        """Traza ya formateada (p. ej. recuperada de la caché)."""
+        traza = cls(nivel).texto(texto)
+        traza.resultados.update(resultados or {})
+        return traza
+
+
+def paginar(fragmentos, tam_pagina=20000):
+    """
+    Agrupa un iterable de fragmentos de texto (o un texto) en páginas.
+
+    Yields:
+        str: Páginas de aproximadamente ``tam_pagina`` caracteres.
+    """
+    if isinstance(fragmentos, str):
+        fragmentos = (fragmentos,)
+    pagina = []
+    largo = 0
+    for fragmento in fragmentos:
+        pagina.append(fragmento)
+        largo += len(fragmento)
+        if largo >= tam_pagina:
+            yield "".join(pagina)
+            pagina = []
+            largo = 0
+    if pagina:
+        yield "".join(pagina)